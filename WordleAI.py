@@ -1,4 +1,5 @@
-from typing import List, Tuple, Optional, Any
+from typing import List, Tuple, Optional, Any, Callable
+from concurrent.futures import ProcessPoolExecutor
 from WordleHelper import WordleHelper
 import random
 
@@ -8,27 +9,40 @@ class WordleAI:
     AI agent that plays Wordle using various strategies
     """
 
-    def __init__(self, word_list: List[str], strategy: str = "frequency"):
+    def __init__(self, word_list: List[str], strategy: str = "frequency", word_length: int = 5,
+                 hard_mode: bool = False):
         """
         Initialize the AI with a word list and strategy
 
         Args:
-            word_list: List of valid 5-letter words
+            word_list: List of valid words (only word_length-letter ones are used)
             strategy: Strategy to use ('frequency', 'random', 'elimination', 'adaptive')
+            word_length: Letters per word
+            hard_mode: Only guess words that reuse every revealed hint
         """
-        self.helper = WordleHelper(word_list)
+        self.helper = WordleHelper(word_list, word_length, hard_mode)
+        self.hard_mode = hard_mode
         self.strategy = strategy
         self.guess_history = []
         self.feedback_history = []
+        # Own RNG so games can be replayed from a seed, independent of other users of `random`
+        self.rng = random.Random()
 
         # Pre-compute best starting words
         self.best_starters = [word for word, _ in self.helper.get_recommended_starters(20)]
 
-    def reset(self):
-        """Reset the AI for a new game"""
+    def reset(self, seed: Optional[int] = None):
+        """
+        Reset the AI for a new game
+
+        Args:
+            seed: Optional seed for the AI's random choices in this game
+        """
         self.helper.reset()
         self.guess_history = []
         self.feedback_history = []
+        if seed is not None:
+            self.rng.seed(seed)
 
     def make_guess(self, attempt_number: int = 1) -> str:
         """
@@ -66,8 +80,8 @@ class WordleAI:
     def _random_strategy(self) -> str:
         """Randomly select from remaining possible words"""
         if not self.helper.possible_words:
-            return random.choice(self.helper.all_words)
-        return random.choice(self.helper.possible_words)
+            return self.rng.choice(self.helper.allowed_words)
+        return self.rng.choice(self.helper.possible_words)
 
     def _frequency_strategy(self, attempt_number: int) -> str:
         """
@@ -119,7 +133,7 @@ class WordleAI:
             if remaining > 0:
                 return self.helper.possible_words[0]
             else:
-                return random.choice(self.helper.all_words)
+                return self.rng.choice(self.helper.allowed_words)
 
     def get_statistics(self) -> dict:
         """
@@ -145,15 +159,9 @@ class WordleAI:
         if not self.helper.possible_words:
             return None, []
 
-        # Get top scoring words
-        scored = [(word, self.helper.score_word(word))
-                  for word in self.helper.possible_words[:100]]  # Limit for performance
-        scored.sort(key=lambda x: x[1], reverse=True)
-
-        best = scored[0][0] if scored else None
-        alternatives = [word for word, _ in scored[1:6]]
-
-        return best, alternatives
+        # Frequencies are computed once and only the top 6 are selected, so every word can be considered
+        top = self.helper.top_words(6, use_remaining_only=True)
+        return top[0], top[1:]
 
 
 class WordleTrainer:
@@ -161,12 +169,21 @@ class WordleTrainer:
     Trainer class to run multiple games and collect statistics
     """
 
-    def __init__(self, word_list: List[str]):
+    def __init__(self, word_list: List[str], word_length: int = 5):
         """Initialize trainer with word list"""
-        self.word_list = [word.upper() for word in word_list if len(word) == 5]
+        from indexes import shared_words
+        from wordle_copy import WordleGame
+
+        self.word_length = word_length
+        # Shared read-only tuple: the same one the AI's helper and the engine use
+        self.word_list = shared_words(word_list, word_length).words
         self.results = []
+        # One engine per word list, reset for every game
+        self.game = WordleGame(self.word_list, word_length)
 
-    def train(self, ai: WordleAI, num_games: int, secret_words: List[str] = None) -> dict:
+    def train(self, ai: WordleAI, num_games: int, secret_words: List[str] = None,
+              workers: int = 1, seed: Optional[int] = None,
+              progress: Callable = None) -> dict:
         """
         Train the AI by playing multiple games
 
@@ -174,62 +191,55 @@ class WordleTrainer:
             ai: The AI agent to train
             num_games: Number of games to play
             secret_words: Optional list of secret words to use (for testing)
+            workers: Number of worker processes; 1 plays every game in this process
+            seed: Master seed. Each game gets its own seed derived from it, so results
+                  are the same for any number of workers
+            progress: Optional progress wrapper, called as progress(iterable, description)
+                      (e.g. TrainingUI.show_progress)
 
         Returns:
             Dictionary with training statistics
         """
-        from wordle_copy import WordleGame
+        if seed is None:
+            seed = random.randrange(2 ** 32)
+
+        jobs = []
+        for i in range(num_games):
+            # Use provided secret word for testing, otherwise the game picks one
+            secret = secret_words[i] if secret_words and i < len(secret_words) else None
+            jobs.append((i, secret, _game_seed(seed, i)))
+
+        if workers > 1:
+            executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                           initargs=(ai, self.word_list, self.word_length))
+            chunksize = max(1, num_games // (workers * 8))
+            outcomes = executor.map(_play_worker_game, jobs, chunksize=chunksize)
+        else:
+            executor = None
+            outcomes = (_play_game(self.game, ai, *job) for job in jobs)
+
+        if progress:
+            outcomes = progress(outcomes, f"Playing {num_games} games...")
 
         wins = 0
         total_attempts = 0
         attempt_distribution = {1: 0, 2: 0, 3: 0, 4: 0, 5: 0, 6: 0}
         failures = 0
 
-        for i in range(num_games):
-            # Create a new game
-            if secret_words and i < len(secret_words):
-                # Use provided secret word for testing
-                game = WordleGame(self.word_list)
-                game.secret_word = secret_words[i].upper()
-            else:
-                game = WordleGame(self.word_list)
-
-            ai.reset()
-
-            # Play the game
-            attempts = 0
-            won = False
-
-            while not game.game_over and attempts < 6:
-                attempts += 1
-                guess = ai.make_guess(attempts)
-                success, feedback = game.make_guess(guess)
-
-                if success:
-                    ai.process_feedback(guess, feedback)
-                    if game.won:
-                        won = True
-                        break
+        try:
+            for result in outcomes:
+                # Record results
+                if result["won"]:
+                    wins += 1
+                    total_attempts += result["attempts"]
+                    attempt_distribution[result["attempts"]] += 1
                 else:
-                    # Should not happen if AI is working correctly
-                    print(f"Warning: Invalid guess {guess}")
-                    break
-
-            # Record results
-            if won:
-                wins += 1
-                total_attempts += attempts
-                attempt_distribution[attempts] += 1
-            else:
-                failures += 1
+                    failures += 1
 
-            self.results.append({
-                "game": i + 1,
-                "won": won,
-                "attempts": attempts if won else 6,
-                "secret_word": game.secret_word,
-                "guesses": ai.guess_history.copy()
-            })
+                self.results.append(result)
+        finally:
+            if executor:
+                executor.shutdown()
 
         # Calculate statistics
         win_rate = (wins / num_games) * 100 if num_games > 0 else 0
@@ -246,3 +256,59 @@ class WordleTrainer:
         }
 
         return stats
+
+
+def _game_seed(master_seed: int, game_index: int) -> int:
+    """Derive a game's seed from the master seed (stable across processes and runs)"""
+    return random.Random(f"{master_seed}:{game_index}").getrandbits(32)
+
+
+def _play_game(game, ai: WordleAI, index: int, secret: Optional[str], seed: int) -> dict:
+    """Play one game on a reusable engine and return its result record"""
+    rng = random.Random(seed)
+    game.reset(secret or rng.choice(game.word_list))
+    ai.reset(seed=rng.getrandbits(32))
+
+    # Play the game
+    attempts = 0
+    won = False
+
+    while not game.game_over and attempts < 6:
+        attempts += 1
+        guess = ai.make_guess(attempts)
+        success, feedback = game.make_guess(guess)
+
+        if success:
+            ai.process_feedback(guess, feedback)
+            if game.won:
+                won = True
+                break
+        else:
+            # Should not happen if AI is working correctly
+            print(f"Warning: Invalid guess {guess}")
+            break
+
+    return {
+        "game": index + 1,
+        "won": won,
+        "attempts": attempts if won else 6,
+        "secret_word": game.secret_word,
+        "guesses": ai.guess_history.copy()
+    }
+
+
+# Per-process state for parallel training, set up once by _init_worker
+_worker_ai = None
+_worker_game = None
+
+
+def _init_worker(ai: WordleAI, word_list: List[str], word_length: int = 5):
+    global _worker_ai, _worker_game
+    from wordle_copy import WordleGame
+
+    _worker_ai = ai
+    _worker_game = WordleGame(word_list, word_length)
+
+
+def _play_worker_game(job: tuple) -> dict:
+    return _play_game(_worker_game, _worker_ai, *job)
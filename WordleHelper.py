@@ -1,5 +1,53 @@
-from typing import List, Set, Tuple, Dict
+from typing import List, Optional, Sequence, Set, Tuple, Dict
 from collections import Counter
+import heapq
+
+try:
+    import tkinter as tk
+    from tkinter import ttk, scrolledtext, messagebox
+except ImportError:
+    # The filtering helper is usable without a display; only the GUI needs Tk
+    tk = None
+
+from feedback import from_tuples, hard_mode_filter
+from indexes import shared_words
+from packed import encode_words, filter_packed
+from search import score_guess
+from lexicon import load_words
+from results_view import PagedResults
+from startup import StagedLoader
+
+
+# Letter-frequency scoring: the one scorer behind WordleHelper and both GUIs' rankings
+
+def letter_frequencies(words: Sequence[str]) -> Counter:
+    """Number of words containing each letter (each letter counted once per word)"""
+    freq = Counter()
+    for word in words:
+        freq.update(set(word))
+    return freq
+
+
+def letter_score(word: str, freq: Dict[str, int]) -> int:
+    """Sum of the frequencies of word's distinct letters (repeats add nothing)"""
+    return sum(freq.get(letter, 0) for letter in set(word))
+
+
+def rank_words(words: Sequence[str], top_n: Optional[int] = None) -> List[str]:
+    """
+    Rank words by letter_score against their own letter_frequencies
+
+    Args:
+        words: Words to rank (also the population the frequencies come from)
+        top_n: If set, only the top_n words are selected (partial selection)
+
+    Returns:
+        Words ordered from best to worst score
+    """
+    freq = letter_frequencies(words)
+    if top_n is None:
+        return sorted(words, key=lambda word: letter_score(word, freq), reverse=True)
+    return heapq.nlargest(top_n, words, key=lambda word: letter_score(word, freq))
 
 
 class WordleHelper:
@@ -8,14 +56,37 @@ class WordleHelper:
     and providing strategic word selection
     """
 
-    def __init__(self, word_list: List[str]):
-        """Initialize with a list of valid words"""
-        self.all_words = [word.upper() for word in word_list if len(word) == 5]
-        self.possible_words = self.all_words.copy()
+    def __init__(self, word_list: List[str], word_length: int = 5, hard_mode: bool = False):
+        """
+        Initialize with a list of valid words of word_length letters.
+        In hard mode only words that reuse every revealed hint may be guessed (allowed_words).
+        """
+        self.word_length = word_length
+        self.hard_mode = hard_mode
+        # The dictionary is shared process-wide (read-only); a helper only holds its candidates
+        self.lexicon = shared_words(word_list, word_length)
+        self.all_words = self.lexicon.words
+        # Candidates are filtered as packed integers (packed.py); words are decoded on demand
+        self.all_codes = self.lexicon.codes
+        self._word_of = self.lexicon.word_of
+        self.reset()
 
     def reset(self):
         """Reset the possible words to the full list"""
-        self.possible_words = self.all_words.copy()
+        self.possible_codes = self.all_codes
+        self._possible_words = self.all_words
+        self.allowed_words = self.all_words
+
+    @property
+    def possible_words(self) -> Sequence[str]:
+        if self._possible_words is None:
+            self._possible_words = list(map(self._word_of.__getitem__, self.possible_codes))
+        return self._possible_words
+
+    @possible_words.setter
+    def possible_words(self, words: List[str]):
+        self.possible_codes = encode_words(words)
+        self._possible_words = list(words)
 
     def filter_words(self, guess: str, feedback: List[Tuple[str, str]]) -> List[str]:
         """
@@ -29,66 +100,16 @@ class WordleHelper:
             List of words that match the feedback constraints
         """
         guess = guess.upper()
-        filtered = []
-
-        # Extract constraints from feedback
-        green_positions = {}  # position -> letter
-        yellow_letters = set()  # letters that are in word but not in these positions
-        yellow_not_positions = {}  # letter -> set of positions it can't be
-        gray_letters = set()  # letters not in word
-
-        for i, (letter, color) in enumerate(feedback):
-            if color == 'green':
-                green_positions[i] = letter
-            elif color == 'yellow':
-                yellow_letters.add(letter)
-                if letter not in yellow_not_positions:
-                    yellow_not_positions[letter] = set()
-                yellow_not_positions[letter].add(i)
-            elif color == 'gray':
-                # Only mark as gray if it's not marked as yellow or green elsewhere
-                if letter not in yellow_letters and letter not in green_positions.values():
-                    gray_letters.add(letter)
-
-        # Filter words
-        for word in self.possible_words:
-            valid = True
-
-            # Check green positions
-            for pos, letter in green_positions.items():
-                if word[pos] != letter:
-                    valid = False
-                    break
-
-            if not valid:
-                continue
-
-            # Check yellow letters (must be in word but not in specified positions)
-            for letter in yellow_letters:
-                if letter not in word:
-                    valid = False
-                    break
-                # Check if letter is in any of the positions it shouldn't be
-                if letter in yellow_not_positions:
-                    for pos in yellow_not_positions[letter]:
-                        if word[pos] == letter:
-                            valid = False
-                            break
-
-            if not valid:
-                continue
-
-            # Check gray letters (must not be in word)
-            for letter in gray_letters:
-                if letter in word:
-                    valid = False
-                    break
-
-            if valid:
-                filtered.append(word)
+        # Same consistency rule as the solver and game engine, so duplicate
+        # letters (e.g. one copy yellow, another gray) are handled exactly
+        pattern = from_tuples(feedback)
+        self.possible_codes = filter_packed(self.possible_codes, guess, pattern, self.word_length)
+        self._possible_words = None
+        if self.hard_mode:
+            # Narrow last turn's legal guesses rather than rescanning all_words
+            self.allowed_words = hard_mode_filter(self.allowed_words, guess, pattern)
 
-        self.possible_words = filtered
-        return filtered
+        return self.possible_words
 
     def get_letter_frequencies(self, words: List[str] = None) -> Dict[str, int]:
         """
@@ -103,12 +124,7 @@ class WordleHelper:
         if words is None:
             words = self.possible_words
 
-        freq = Counter()
-        for word in words:
-            # Count unique letters in each word
-            freq.update(set(word))
-
-        return dict(freq)
+        return dict(letter_frequencies(words))
 
     def get_position_frequencies(self, words: List[str] = None) -> List[Dict[str, int]]:
         """
@@ -118,19 +134,19 @@ class WordleHelper:
             words: List of words to analyze (defaults to current possible words)
 
         Returns:
-            List of 5 dictionaries, one for each position
+            List of dictionaries, one for each position
         """
         if words is None:
             words = self.possible_words
 
-        position_freq = [Counter() for _ in range(5)]
+        position_freq = [Counter() for _ in range(self.word_length)]
         for word in words:
             for i, letter in enumerate(word):
                 position_freq[i][letter] += 1
 
         return [dict(pf) for pf in position_freq]
 
-    def score_word(self, word: str, words: List[str] = None) -> float:
+    def score_word(self, word: str, words: List[str] = None, freq: Dict[str, int] = None) -> float:
         """
         Score a word based on letter frequency
         Higher score = more common letters = better for elimination
@@ -138,20 +154,19 @@ class WordleHelper:
         Args:
             word: Word to score
             words: List of words to base frequency on (defaults to current possible words)
+            freq: Precomputed letter frequencies; pass these when scoring many words
+                  against the same list so they are not recomputed per word
 
         Returns:
             Score for the word
         """
-        if words is None:
-            words = self.possible_words
-
-        word = word.upper()
-        freq = self.get_letter_frequencies(words)
+        if freq is None:
+            if words is None:
+                words = self.possible_words
+            freq = self.get_letter_frequencies(words)
 
         # Score based on unique letters (avoid double letters for better elimination)
-        score = sum(freq.get(letter, 0) for letter in set(word))
-
-        return score
+        return letter_score(word.upper(), freq)
 
     def get_best_guess(self, use_remaining_only: bool = True) -> str:
         """
@@ -159,7 +174,7 @@ class WordleHelper:
 
         Args:
             use_remaining_only: If True, only consider words from possible_words
-                              If False, consider all words for better elimination
+                              If False, consider all (hard mode: all legal) words for better elimination
 
         Returns:
             Best word to guess
@@ -171,20 +186,38 @@ class WordleHelper:
         if len(self.possible_words) == 1:
             return self.possible_words[0]
 
+        return self.top_words(1, use_remaining_only)[0]
+
+    def top_words(self, k: int = 5, use_remaining_only: bool = True) -> List[str]:
+        """
+        The k highest-scoring words, best first (heap selection, no full sort)
+
+        Args:
+            k: Number of words to return
+            use_remaining_only: Same as for get_best_guess
+        """
         # If few words left, just pick from remaining
         if len(self.possible_words) <= 2 or use_remaining_only:
             candidate_words = self.possible_words
         else:
             # Use all words for better elimination strategy
-            candidate_words = self.all_words
+            candidate_words = self.allowed_words
 
-        # Score all candidates
-        scored_words = [(word, self.score_word(word)) for word in candidate_words]
+        freq = self.get_letter_frequencies()
+        return heapq.nlargest(k, candidate_words, key=lambda word: self.score_word(word, freq=freq))
 
-        # Sort by score (descending) and return best
-        scored_words.sort(key=lambda x: x[1], reverse=True)
+    def get_top_guesses(self, k: int = 5, use_remaining_only: bool = True) -> List[Tuple[str, float, float, float]]:
+        """
+        The k best words as (word, entropy, expected_remaining, p_answer) tuples
 
-        return scored_words[0][0]
+        Words are selected by letter-frequency score (top_words); only those k
+        are then scored against the remaining possibilities.
+        """
+        possible = set(self.possible_words)
+        if not possible:
+            return []
+        return [(word,) + score_guess(word, possible) + (1 / len(possible) if word in possible else 0.0,)
+                for word in self.top_words(k, use_remaining_only)]
 
     def get_recommended_starters(self, top_n: int = 10) -> List[Tuple[str, float]]:
         """
@@ -196,47 +229,84 @@ class WordleHelper:
         Returns:
             List of (word, score) tuples
         """
-        scored_words = [(word, self.score_word(word, self.all_words))
+        freq = self.get_letter_frequencies(self.all_words)
+        scored_words = [(word, self.score_word(word, freq=freq))
                         for word in self.all_words]
         scored_words.sort(key=lambda x: x[1], reverse=True)
 
         return scored_words[:top_n]
 
-class WordleHelper:
-    def __init__(self, word_list_path: str = "word_list.txt"):
-        self.all_words = self.load_words_from_file(word_list_path)
-        if not self.all_words:
-            self.all_words = self.get_default_word_list()
-        
-        self.possible_words = self.all_words.copy()
-        self.green_letters = [""] * 5
+class WordleHelperGUI:
+    def __init__(self, word_list_path: str = "word_list.txt", word_length: int = 5):
+        # Word list and AI are loaded in the background so the window appears immediately
+        self.word_length = word_length
+        self.all_words = None
+        self.possible_words = []
+        self.green_letters = [""] * word_length
         self.yellow_letters = []
         self.gray_letters = set()
         self.yellow_rows = 1
         
         self.ai = None
-        if AI_AVAILABLE:
-            try:
-                self.ai = EntropyAI(self.all_words)
-            except:
-                self.ai = None
         
         self.setup_gui()
         self.update_possible_words()
+        
+        stages = [("Loading word list...", lambda _: self.load_word_list(word_list_path), self.on_words_loaded),
+                  ("Building AI tables...", self.build_ai, self.on_ai_ready)]
+        self.loader = StagedLoader(self.root, stages,
+                                   on_progress=self.on_startup_progress,
+                                   on_error=self.on_startup_error)
+        self.loader.start()
+    
+    def load_word_list(self, filepath: str) -> List[str]:
+        """Load the word list, falling back to the default list (runs off the Tk thread)"""
+        return self.load_words_from_file(filepath) or self.get_default_word_list()
+    
+    def build_ai(self, words: List[str]):
+        """Build the AI for the loaded words (runs off the Tk thread)"""
+        try:
+            from WordleAI import WordleAI  # Localized: WordleAI imports this module
+            return WordleAI(words, word_length=self.word_length)
+        except Exception:
+            return None
+    
+    def on_words_loaded(self, words: List[str]):
+        """Accept input as soon as the word list is available"""
+        self.all_words = words
+        self.update_possible_words()
+    
+    def on_ai_ready(self, ai):
+        """Enable AI recommendations once the AI has been built"""
+        self.ai = ai
+        if self.ai:
+            self.ai_button.config(state='normal')
+        else:
+            self.ai_label.config(text="AI could not be loaded")
+    
+    def on_startup_progress(self, index: int, total: int, description: str):
+        self.startup_progress.config(value=100 * index / total)
+        self.startup_label.config(text=description)
+        if index == total:
+            self.startup_progress.grid_remove()
+            self.startup_label.grid_remove()
+    
+    def on_startup_error(self, error: Exception):
+        self.startup_label.config(text="Loading failed")
+        messagebox.showerror("Error", f"Could not load the word list: {error}")
     
     def load_words_from_file(self, filepath: str) -> List[str]:
-        """Load words from text file"""
+        """Load words from text file (through its packed lexicon cache)"""
         try:
-            with open(filepath, 'r') as f:
-                words = [line.strip().upper() for line in f if len(line.strip()) == 5]
-            return words
+            return load_words(filepath, self.word_length)
         except FileNotFoundError:
             print(f"Warning: {filepath} not found. Using default word list.")
             return []
     
     def get_default_word_list(self) -> List[str]:
         """Fallback word list"""
-        return ["APPLE", "BRAVE", "CLIMB", "DREAM", "EARTH", "FLAME", "GRAPE", "HOUSE"]
+        words = ["APPLE", "BRAVE", "CLIMB", "DREAM", "EARTH", "FLAME", "GRAPE", "HOUSE"]
+        return [w for w in words if len(w) == self.word_length]
     
     def setup_gui(self):
         """Create the main interface"""
@@ -287,14 +357,21 @@ class WordleHelper:
         
         self.setup_results_section(results_frame)
         
-        if AI_AVAILABLE and self.ai:
-            ai_frame = ttk.LabelFrame(main_frame, text="🤖 AI Recommendation", padding="10")
-            ai_frame.grid(row=6, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(10, 0))
-            
-            self.ai_label = ttk.Label(ai_frame, text="Recommended next word will appear here", font=("Arial", 12, "bold"))
-            self.ai_label.grid(row=0, column=0, sticky=tk.W)
-            
-            ttk.Button(ai_frame, text="Get AI Recommendation", command=self.get_ai_recommendation).grid(row=0, column=1, padx=10)
+        ai_frame = ttk.LabelFrame(main_frame, text="🤖 AI Recommendation", padding="10")
+        ai_frame.grid(row=6, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(10, 0))
+        
+        self.ai_label = ttk.Label(ai_frame, text="Recommended next word will appear here", font=("Arial", 12, "bold"))
+        self.ai_label.grid(row=0, column=0, sticky=tk.W)
+        
+        # Enabled by on_ai_ready once the AI has finished building
+        self.ai_button = ttk.Button(ai_frame, text="Get AI Recommendation", command=self.get_ai_recommendation,
+                                    state='disabled')
+        self.ai_button.grid(row=0, column=1, padx=10)
+        
+        self.startup_progress = ttk.Progressbar(main_frame, mode='determinate', maximum=100)
+        self.startup_progress.grid(row=7, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(10, 0))
+        self.startup_label = ttk.Label(main_frame, text="Starting...")
+        self.startup_label.grid(row=8, column=0, columnspan=2, sticky=tk.W)
     
     def setup_green_section(self, parent):
         """Setup the green letters input boxes"""
@@ -302,7 +379,7 @@ class WordleHelper:
         green_subframe.grid(row=0, column=0, sticky=(tk.W, tk.E))
         
         self.green_entries = []
-        for i in range(5):
+        for i in range(self.word_length):
             label = ttk.Label(green_subframe, text=f"Position {i+1}:")
             label.grid(row=0, column=i*2, padx=(10, 5), pady=5)
             
@@ -340,7 +417,7 @@ class WordleHelper:
         
         position_vars = []
         position_checks = []
-        for i in range(5):
+        for i in range(self.word_length):
             var = tk.BooleanVar()
             check = ttk.Checkbutton(row_frame, text=str(i+1), variable=var)
             check.grid(row=0, column=3+i, padx=2)
@@ -349,7 +426,7 @@ class WordleHelper:
         
         delete_btn = ttk.Button(row_frame, text="✕", width=3, 
                                command=lambda idx=row_index: self.remove_yellow_row(idx))
-        delete_btn.grid(row=0, column=8, padx=(10, 5))
+        delete_btn.grid(row=0, column=3 + self.word_length, padx=(10, 5))
         
         row_widgets = {
             'frame': row_frame,
@@ -399,6 +476,24 @@ class WordleHelper:
         self.results_text = scrolledtext.ScrolledText(parent, width=80, height=15, font=("Consolas", 10))
         self.results_text.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
+        nav_frame = ttk.Frame(parent)
+        nav_frame.grid(row=2, column=0, sticky=(tk.W, tk.E), pady=(5, 0))
+        
+        ttk.Button(nav_frame, text="◀ Prev", command=lambda: self.results_view.prev_page()).pack(side=tk.LEFT, padx=2)
+        self.page_label = ttk.Label(nav_frame, text="")
+        self.page_label.pack(side=tk.LEFT, padx=5)
+        ttk.Button(nav_frame, text="Next ▶", command=lambda: self.results_view.next_page()).pack(side=tk.LEFT, padx=2)
+        
+        self.top_n_enabled = tk.BooleanVar(value=False)
+        self.top_n_var = tk.IntVar(value=50)
+        ttk.Spinbox(nav_frame, from_=1, to=1000, width=5, textvariable=self.top_n_var,
+                    command=self.display_results).pack(side=tk.RIGHT, padx=2)
+        ttk.Checkbutton(nav_frame, text="Top N ranked only", variable=self.top_n_enabled,
+                        command=self.display_results).pack(side=tk.RIGHT, padx=5)
+        
+        self.results_view = PagedResults(self.results_text, words_per_line=8, lines_per_page=50,
+                                         on_page_change=lambda text: self.page_label.config(text=text))
+        
         parent.columnconfigure(0, weight=1)
         parent.rowconfigure(1, weight=1)
     
@@ -454,6 +549,11 @@ class WordleHelper:
         """Update the list of possible words based on current constraints"""
         self.update_yellow_letters()
         
+        if self.all_words is None:
+            # Inputs are kept and applied once the word list has loaded
+            self.count_label.config(text="Loading word list...")
+            return
+        
         possible = []
         
         for word in self.all_words:
@@ -507,43 +607,42 @@ class WordleHelper:
     
     def display_results(self):
         """Display the possible words in the results area"""
-        self.results_text.delete(1.0, tk.END)
-        
         count = len(self.possible_words)
         self.count_label.config(text=f"{count} possible words")
         
         if count == 0:
-            self.results_text.insert(tk.END, "No words match your criteria!\n\n")
-            self.results_text.insert(tk.END, "Check your inputs:\n")
-            self.results_text.insert(tk.END, "- Green letters must be in exact positions\n")
-            self.results_text.insert(tk.END, "- Yellow letters must be in word but not in marked positions\n")
-            self.results_text.insert(tk.END, "- Gray letters should not be in word (unless also yellow/green)")
+            self.results_view.show_message(
+                "No words match your criteria!\n\n"
+                "Check your inputs:\n"
+                "- Green letters must be in exact positions\n"
+                "- Yellow letters must be in word but not in marked positions\n"
+                "- Gray letters should not be in word (unless also yellow/green)")
+        elif self.top_n_enabled.get():
+            try:
+                top_n = max(1, int(self.top_n_var.get()))
+            except (tk.TclError, ValueError):
+                top_n = 50
+            self.results_view.show(rank_words(self.possible_words, top_n))
         else:
-            words_per_line = 8
-            for i, word in enumerate(self.possible_words):
-                self.results_text.insert(tk.END, word)
-                if (i + 1) % words_per_line == 0:
-                    self.results_text.insert(tk.END, '\n')
-                else:
-                    self.results_text.insert(tk.END, ' ')
+            self.results_view.show(self.possible_words)
     
     def get_ai_recommendation(self):
         """Get AI recommendation for next word"""
-        if not AI_AVAILABLE or not self.ai:
-            messagebox.showerror("Error", "AI not available. Make sure wordleai.py is in the same directory.")
+        if not self.ai:
+            messagebox.showerror("Error", "AI not available. Make sure WordleAI.py is in the same directory.")
             return
         
         try:
-            self.ai.reset()
-
             if self.possible_words:
-                if hasattr(self.ai, 'get_best_guess'):
-                    recommendation = self.ai.get_best_guess()
-                else:
-                    top_candidates = self.possible_words[:10]
-                    recommendation = max(top_candidates, key=lambda word: len(set(word)))
-                
-                self.ai_label.config(text=f"Recommended: {recommendation}")
+                # The AI ranks the words left by the filters above
+                self.ai.helper.possible_words = self.possible_words
+                # One heap selection gives the guess and the runners-up, in the AI's own order
+                recommendation, alternatives = self.ai.suggest_next_move()
+                alternatives = alternatives[:4]
+                text = f"Recommended: {recommendation}"
+                if alternatives:
+                    text += f"  |  Also: {', '.join(alternatives)}"
+                self.ai_label.config(text=text)
             else:
                 self.ai_label.config(text="No words available for recommendation")
                 
@@ -554,7 +653,7 @@ class WordleHelper:
         """Clear all inputs"""
         for entry in self.green_entries:
             entry.delete(0, tk.END)
-        self.green_letters = [""] * 5
+        self.green_letters = [""] * self.word_length
 
         self.gray_entry.delete(0, tk.END)
         self.gray_letters = set()
@@ -569,7 +668,7 @@ class WordleHelper:
         
         self.update_possible_words()
         
-        if AI_AVAILABLE and self.ai:
+        if self.ai:
             self.ai_label.config(text="Recommended next word will appear here")
     
     def run(self):
@@ -577,5 +676,5 @@ class WordleHelper:
         self.root.mainloop()
 
 if __name__ == "__main__":
-    helper = WordleHelper("word_list.txt")
+    helper = WordleHelperGUI("word_list.txt")
     helper.run()
@@ -10,16 +10,34 @@ import json
 # ==============================================================================
 # 0. MODULE IMPORTS (CRITICAL: Ensure these files are present)
 # ==============================================================================
+from results_view import PagedResults
+from startup import StagedLoader
+
 try:
-    from config import MAX_GUESSES
+    from config import MAX_GUESSES, WORD_LENGTH
+    from indexes import opener
+    from knowledge import WordleKnowledge
     from solver import WordleSolver
+    from WordleHelper import rank_words
 except ImportError:
-    # Fallback to prevent crash if modules are missing
+    # Fallback to prevent crash if modules are missing (loading then fails
+    # on the loader thread and is reported through on_startup_error)
     MAX_GUESSES = 6
+    WORD_LENGTH = 5
+
+
+    def opener(word_length: int = WORD_LENGTH): raise NotImplementedError("Solver files not found.")
+
+
+    class WordleKnowledge:
+        def __init__(self, *args, **kwargs): raise NotImplementedError("Solver files not found.")
 
 
     class WordleSolver:
-        def __init__(self): raise NotImplementedError("Solver files not found.")
+        def __init__(self, *args, **kwargs): raise NotImplementedError("Solver files not found.")
+
+
+    def rank_words(words, top_n=None): return list(words)[:top_n]
 
 # --- Helper map for displaying feedback ---
 COLOR_MAP = {
@@ -35,17 +53,75 @@ COLOR_MAP = {
 # ==============================================================================
 
 class WordleHelper:
-    def __init__(self):
-        # Start in Helper Mode by default (answer=None)
-        self.ai_solver = WordleSolver()
-        self.ai_solver.start_game(answer=None)
+    def __init__(self, word_length: int = WORD_LENGTH):
+        # The window is shown right away; the word lists and the solver are
+        # loaded in the background (see on_lexicon_ready / on_solver_ready).
+        self.word_length = word_length
+        self.kb = None
+        self.ai_solver = None
         self.board_tiles: List[List[tk.Label]] = []
         self.feedback_history: List[Tuple[str, str]] = []
 
         self.setup_gui()
+        self.feedback_entry.config(state='disabled')
+        self.set_ai_controls_state('disabled')
+
+        self.loader = StagedLoader(self.root, [
+            ("Loading word lists...", self.load_knowledge, self.on_lexicon_ready),
+            ("Loading AI model...", self.build_solver, self.on_solver_ready),
+        ], on_progress=self.on_startup_progress, on_error=self.on_startup_error)
+        self.loader.start()
+
+    def load_knowledge(self, _):
+        """Runs on the loader thread."""
+        kb = WordleKnowledge(word_length=self.word_length)
+        kb.warm_up()
+        # Lengths without a configured opener compute one here, off the Tk thread
+        return kb, opener(self.word_length)
+
+    def build_solver(self, loaded):
+        """Runs on the loader thread."""
+        kb, _ = loaded
+        solver = WordleSolver(knowledge=kb)
+        solver.warm_up()
+        return solver
+
+    def on_lexicon_ready(self, loaded):
+        """Word lists are loaded: show candidates and accept feedback for the opener."""
+        self.kb, first_guess = loaded
+        self.display_results()
+        for control in self.top_n_controls:
+            control.config(state='normal')
+        self.feedback_entry.config(state='normal')
+        self.ai_suggestion_label.config(text=f"AI Guess: {first_guess}")
+
+    def on_solver_ready(self, solver):
+        """Solver is built: start Helper Mode and enable the AI controls."""
+        self.ai_solver = solver
+        # Start in Helper Mode by default (answer=None)
+        self.ai_solver.start_game(answer=None)
+
+        typed_feedback = self.feedback_entry.get()
         self.display_results()
         self.update_guess_label()
         self.update_mode_display()
+        self.feedback_entry.insert(0, typed_feedback)
+        self.set_ai_controls_state('normal')
+
+    def on_startup_progress(self, index: int, total: int, description: str):
+        self.startup_progress.config(value=100 * index / total)
+        self.startup_label.config(text=description)
+        if index == total:
+            self.startup_progress.grid_remove()
+            self.startup_label.grid_remove()
+
+    def on_startup_error(self, error: Exception):
+        self.startup_label.config(text="AI failed to load", foreground='red')
+        messagebox.showerror("Startup Error", f"Could not load the solver: {error}")
+
+    def set_ai_controls_state(self, state: str):
+        for button in [self.submit_button] + self.mode_buttons:
+            button.config(state=state)
 
     def setup_gui(self):
         self.root = tk.Tk()
@@ -81,6 +157,13 @@ class WordleHelper:
         row_idx += 1
         self.setup_control_section(control_frame)
 
+        self.startup_progress = ttk.Progressbar(input_frame, mode='determinate', maximum=100)
+        self.startup_progress.grid(row=row_idx, column=0, sticky=(tk.W, tk.E));
+        row_idx += 1
+        self.startup_label = ttk.Label(input_frame, text="Starting...", font=("Arial", 10))
+        self.startup_label.grid(row=row_idx, column=0, sticky=tk.W);
+        row_idx += 1
+
         results_frame = ttk.LabelFrame(self.root, text="Possible Words & AI Suggestion", padding="15")
         results_frame.grid(row=0, column=1, sticky=(tk.W, tk.E, tk.N, tk.S))
         self.setup_results_section(results_frame)
@@ -92,7 +175,7 @@ class WordleHelper:
         self.board_tiles = []
         for r in range(MAX_GUESSES):
             row_tiles = []
-            for c in range(5):
+            for c in range(self.word_length):
                 tile = tk.Label(board_frame, text="", font=("Arial", 24, "bold"), width=3, height=1,
                                 bg=COLOR_MAP['DEFAULT'], fg='black', borderwidth=2, relief="solid")
                 tile.grid(row=r, column=c, padx=3, pady=3)
@@ -100,7 +183,7 @@ class WordleHelper:
             self.board_tiles.append(row_tiles)
 
         self.board_status_label = ttk.Label(parent, text="Start a new game to begin.", font=("Arial", 10))
-        self.board_status_label.grid(row=1, column=0, columnspan=5, pady=(5, 0))
+        self.board_status_label.grid(row=1, column=0, columnspan=self.word_length, pady=(5, 0))
 
     def setup_control_section(self, parent):
         self.ai_suggestion_label = ttk.Label(parent, text="AI Guess: ---", font=("Arial", 16, "bold"),
@@ -124,14 +207,19 @@ class WordleHelper:
         mode_frame = ttk.Frame(parent)
         mode_frame.grid(row=3, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(10, 0))
 
-        ttk.Button(mode_frame, text="✍️ Start Helper Mode", command=self.start_helper_mode).pack(side=tk.LEFT,
-                                                                                                 expand=True, fill=tk.X,
-                                                                                                 padx=2)
-        ttk.Button(mode_frame, text="🤖 Start Engine Mode", command=self.start_engine_mode).pack(side=tk.LEFT,
-                                                                                                expand=True, fill=tk.X,
-                                                                                                padx=2)
-        ttk.Button(mode_frame, text="▶️ Demo (SLATE)", command=lambda: self.start_engine_mode("SLATE")).pack(
-            side=tk.LEFT, expand=True, fill=tk.X, padx=2)
+        self.mode_buttons = [
+            ttk.Button(mode_frame, text="✍️ Start Helper Mode", command=self.start_helper_mode),
+            ttk.Button(mode_frame, text="🤖 Start Engine Mode", command=self.start_engine_mode),
+        ]
+        if self.word_length == 5:
+            self.mode_buttons.append(
+                ttk.Button(mode_frame, text="▶️ Demo (SLATE)", command=lambda: self.start_engine_mode("SLATE")))
+        for button in self.mode_buttons:
+            button.pack(side=tk.LEFT, expand=True, fill=tk.X, padx=2)
+
+        # Ranked alternatives the planner produced alongside its guess
+        self.alternatives_label = ttk.Label(parent, text="", font=("Consolas", 10), justify=tk.LEFT)
+        self.alternatives_label.grid(row=4, column=0, columnspan=3, sticky=tk.W, pady=(10, 0))
 
     def setup_results_section(self, parent):
         self.count_label = ttk.Label(parent, text="0 possible words", font=("Arial", 14))
@@ -140,6 +228,30 @@ class WordleHelper:
         self.results_text = scrolledtext.ScrolledText(parent, width=50, height=5, font=("Consolas", 12))
         self.results_text.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
 
+        nav_frame = ttk.Frame(parent)
+        nav_frame.grid(row=2, column=0, sticky=(tk.W, tk.E), pady=(5, 0))
+
+        ttk.Button(nav_frame, text="◀ Prev", command=lambda: self.results_view.prev_page()).pack(side=tk.LEFT, padx=2)
+        self.page_label = ttk.Label(nav_frame, text="")
+        self.page_label.pack(side=tk.LEFT, padx=5)
+        ttk.Button(nav_frame, text="Next ▶", command=lambda: self.results_view.next_page()).pack(side=tk.LEFT, padx=2)
+
+        self.top_n_enabled = tk.BooleanVar(value=False)
+        self.top_n_var = tk.IntVar(value=50)
+        # Disabled until the word lists are loaded (display_results needs self.kb)
+        self.top_n_controls = [
+            ttk.Spinbox(nav_frame, from_=1, to=1000, width=5, textvariable=self.top_n_var,
+                        command=self.display_results, state='disabled'),
+            ttk.Checkbutton(nav_frame, text="Top N ranked only", variable=self.top_n_enabled,
+                            command=self.display_results, state='disabled'),
+        ]
+        self.top_n_controls[0].pack(side=tk.RIGHT, padx=2)
+        self.top_n_controls[1].pack(side=tk.RIGHT, padx=5)
+
+        self.results_view = PagedResults(self.results_text, words_per_line=6, lines_per_page=60,
+                                         column_width=6, separator='  ',
+                                         on_page_change=lambda text: self.page_label.config(text=text))
+
         parent.columnconfigure(0, weight=1)
         parent.rowconfigure(1, weight=1)
 
@@ -168,6 +280,13 @@ class WordleHelper:
             self.feedback_entry.delete(0, tk.END)
 
         self.ai_suggestion_label.config(text=f"AI Guess: {next_guess}")
+        self.display_alternatives()
+
+    def display_alternatives(self):
+        """Shows the solver's ranked suggestions for this turn (already computed with the guess)."""
+        lines = [f"{word}  {entropy:.2f} bits  ~{remaining:.1f} left" + ("  (could be the answer)" if p else "")
+                 for word, entropy, remaining, p in self.ai_solver.suggestions]
+        self.alternatives_label.config(text="Top guesses:\n" + "\n".join(lines) if lines else "")
 
     def submit_move(self):
         """Handles both Helper Mode (user input) and Engine Mode (auto-feedback)."""
@@ -179,7 +298,7 @@ class WordleHelper:
 
         # Check if we are in Helper Mode and input is missing
         if not self.ai_solver.answer and not feedback_input:
-            messagebox.showerror("Input Error", "In Helper Mode, you must enter the 5-char feedback (G/Y/B).")
+            messagebox.showerror("Input Error", f"In Helper Mode, you must enter the {self.word_length}-char feedback (G/Y/B).")
             return
 
         # Pass feedback_input for Helper Mode, or empty string "" for Engine Mode
@@ -238,45 +357,43 @@ class WordleHelper:
         self.board_status_label.config(text=f"Turn 1 of {MAX_GUESSES} (Engine Mode)", foreground='blue')
 
     def display_results(self):
-        self.results_text.delete(1.0, tk.END)
-
-        possible_words = self.ai_solver.kb.possible
+        possible_words = self.kb.possible
         count = len(possible_words)
 
         self.count_label.config(text=f"📚 {count} possible words")
 
         if count == 0:
-            self.results_text.insert(tk.END, "❌ No words match the game history!")
+            self.results_view.show_message("❌ No words match the game history!")
             self.ai_suggestion_label.config(text="AI Guess: ERROR")
+        elif self.top_n_enabled.get():
+            try:
+                top_n = max(1, int(self.top_n_var.get()))
+            except (tk.TclError, ValueError):
+                top_n = 50
+            self.results_view.show(rank_words(list(possible_words), top_n))
         else:
-            display_words = sorted(list(possible_words))
-            words_per_line = 6
-            for i, word in enumerate(display_words):
-                self.results_text.insert(tk.END, word.ljust(6))
-                if (i + 1) % words_per_line == 0:
-                    self.results_text.insert(tk.END, '\n')
-                else:
-                    self.results_text.insert(tk.END, '  ')
+            self.results_view.show(sorted(possible_words))
 
     def display_board(self):
         for r in range(MAX_GUESSES):
-            for c in range(5):
+            for c in range(self.word_length):
                 self.board_tiles[r][c].config(text="", bg=COLOR_MAP['DEFAULT'], fg='black')
 
         for r, (guess, feedback) in enumerate(self.feedback_history):
-            for c in range(5):
+            for c in range(self.word_length):
                 color = feedback[c]
                 self.board_tiles[r][c].config(text=guess[c], bg=COLOR_MAP[color],
                                               fg='white' if color != 'DEFAULT' else 'black')
 
         if self.ai_solver.game_over:
-            status = "🎉 SOLVED!" if self.feedback_history[-1][1] == "GGGGG" else "💀 GAME OVER!"
+            solved = self.feedback_history[-1][1] == self.ai_solver.solved_pattern
+            status = "🎉 SOLVED!" if solved else "💀 GAME OVER!"
 
             if self.ai_solver.answer:
                 status += f" (Word: {self.ai_solver.answer})"
 
             self.board_status_label.config(text=status,
-                                           foreground='red' if not self.feedback_history[-1][1] == "GGGGG" else 'green')
+                                           foreground='green' if solved else 'red')
         else:
             mode_desc = "Engine Mode" if self.ai_solver.answer else "Helper Mode"
             self.board_status_label.config(text=f"Turn {self.ai_solver.turn + 1} of {MAX_GUESSES} ({mode_desc})",
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+batch.py - Non-interactive batch solver for offline evaluation
+Run: python batch.py answers.txt > results.jsonl
+     cat answers.txt | python batch.py - | jq .turns
+
+Each input line is one puzzle, in any of these forms:
+    CRANE                                       (solver picks its own opener)
+    CRANE SLATE                                 (answer, opener)
+    {"answer": "CRANE", "opener": "SLATE"}
+Blank lines and lines starting with '#' are skipped.
+
+Every game is solved in Engine Mode and written out as one JSON line as soon
+as it finishes, so memory stays constant however long the input is:
+    {"answer", "solved", "turns", "guesses", "patterns", "guess_ms", "feedback_ms"}
+Invalid input produces {"answer", "error"} instead.
+"""
+
+import argparse
+import json
+import sys
+import time
+from typing import Iterator, Optional, Tuple
+
+from gamelog import GameLog
+from solver import WordleSolver
+
+
+def parse_line(line: str) -> Optional[Tuple[str, Optional[str]]]:
+    """One input line -> (answer, opener or None); None for blank/comment lines"""
+    line = line.strip()
+    if not line or line.startswith("#"):
+        return None
+    if line.startswith("{"):
+        data = json.loads(line)
+        return data["answer"], data.get("opener")
+    fields = line.split()
+    return fields[0], (fields[1] if len(fields) > 1 else None)
+
+
+def solve_one(solver: WordleSolver, answer: str, opener: str = None) -> dict:
+    """Play one Engine Mode game and return its record"""
+    n = solver.word_length
+    answer = answer.upper()
+    if len(answer) != n or not answer.isalpha():
+        return {"answer": answer, "error": f"answer must be a {n}-letter word"}
+    if opener is not None:
+        opener = opener.upper()
+        if len(opener) != n or not opener.isalpha():
+            return {"answer": answer, "error": f"opener must be a {n}-letter word"}
+
+    solver.start_game(answer=answer)
+    guesses, patterns, guess_ms, feedback_ms = [], [], [], []
+    solved = False
+
+    while not solver.game_over:
+        start = time.perf_counter()
+        guess = opener if (solver.turn == 0 and opener) else solver.get_guess()
+        mid = time.perf_counter()
+        if guess.startswith("ERROR"):
+            return {"answer": answer, "error": guess, "guesses": guesses, "patterns": patterns}
+
+        solver.last_guess = guess
+        result = solver.submit_feedback("")  # Auto-feedback in Engine Mode
+        end = time.perf_counter()
+
+        guesses.append(guess)
+        patterns.append(result["feedback"])
+        guess_ms.append(round((mid - start) * 1000, 3))
+        feedback_ms.append(round((end - mid) * 1000, 3))
+        solved = result["solved"]
+
+    return {
+        "answer": answer,
+        "solved": solved,
+        "turns": len(guesses),
+        "guesses": guesses,
+        "patterns": patterns,
+        "guess_ms": guess_ms,
+        "feedback_ms": feedback_ms,
+    }
+
+
+def iter_results(solver: WordleSolver, lines) -> Iterator[dict]:
+    """Lazily solve each puzzle in `lines`, yielding one record per game"""
+    for line in lines:
+        try:
+            puzzle = parse_line(line)
+        except (ValueError, KeyError, TypeError):
+            yield {"input": line.strip(), "error": "unparseable line"}
+            continue
+        if puzzle is not None:
+            yield solve_one(solver, *puzzle)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Solve a stream of Wordle puzzles, one JSON line per game")
+    parser.add_argument("input", nargs="?", default="-", help="answers file, or - for stdin (default)")
+    parser.add_argument("--learn", action="store_true",
+                        help="update and save the Q-table while solving (off by default)")
+    parser.add_argument("--hard", action="store_true", help="play in hard mode")
+    parser.add_argument("--length", type=int, default=None, help="word length (default: config.WORD_LENGTH)")
+    parser.add_argument("--log", default=None, help="also append each game to this replayable game log")
+    args = parser.parse_args()
+
+    log = GameLog(args.log) if args.log else None
+    solver = WordleSolver(learn=args.learn, log=log, word_length=args.length, hard_mode=args.hard)
+    try:
+        solver.kb.warm_up()
+    except FileNotFoundError as e:
+        parser.error(str(e))
+    source = sys.stdin if args.input == "-" else open(args.input, "r")
+    try:
+        for record in iter_results(solver, source):
+            sys.stdout.write(json.dumps(record) + "\n")
+            sys.stdout.flush()
+    except BrokenPipeError:
+        sys.stderr.close()  # e.g. piped into head: stop quietly
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if log is not None:
+            log.close()
+
+
+if __name__ == "__main__":
+    main()
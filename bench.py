@@ -0,0 +1,491 @@
+#!/usr/bin/env python3
+"""
+bench.py - Performance benchmarks for the Wordle AI
+Run: python bench.py startup --runs 20 --budget-ms 100
+     python bench.py multiboard --boards 4 8
+     python bench.py deadline --budgets-ms 10 50 100 250
+     python bench.py approx --opener FUZZY --sample 256
+     python bench.py hybrid --games 50 --keep 50 200
+     python bench.py kernels --states 5 --guesses 2000
+     python bench.py packed --checks 300
+"""
+
+import argparse
+import random
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent
+
+
+def bench_startup(runs: int = 20) -> dict:
+    """
+    Time-to-first-guess for main.py: from spawning the process until it
+    prints its first "Guess:" line. Includes interpreter startup.
+    """
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        proc = subprocess.Popen([sys.executable, "-u", "main.py"], cwd=PROJECT_ROOT,
+                                stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL, text=True)
+        try:
+            for line in proc.stdout:
+                if line.startswith("Guess:"):
+                    timings.append((time.perf_counter() - start) * 1000)
+                    break
+            else:
+                raise RuntimeError("main.py exited without printing a guess")
+        finally:
+            proc.kill()
+            proc.wait()
+
+    return {
+        "runs": runs,
+        "min_ms": min(timings),
+        "median_ms": statistics.median(timings),
+        "max_ms": max(timings),
+    }
+
+
+def bench_multiboard(boards: int, states: int = 5, guesses: int = 300, seed: int = 0) -> dict:
+    """
+    Joint entropy of `guesses` sampled guess words over `boards` boards, each
+    after the opener against a random answer: naive sum of search.entropy per
+    board vs the batched search.joint_entropy kernel (results must agree).
+    """
+    from config import OPENER
+    from feedback import feedback_pattern, filter_consistent
+    from knowledge import WordleKnowledge
+    from search import board_membership, entropy, joint_entropy
+
+    kb = WordleKnowledge()
+    answers, guessable = list(kb.answers), list(kb.guessable)
+    rng = random.Random(seed)
+
+    naive_s = batched_s = 0.0
+    sizes = []
+    for _ in range(states):
+        sets = [set(filter_consistent(answers, OPENER, feedback_pattern(OPENER, a)))
+                for a in rng.sample(answers, boards)]
+        sizes.append(sum(len(c) for c in sets))
+        words = rng.sample(guessable, guesses)
+
+        start = time.perf_counter()
+        naive = [sum(entropy(w, c) for c in sets) for w in words]
+        naive_s += time.perf_counter() - start
+
+        start = time.perf_counter()
+        membership = board_membership(sets)
+        batched = [joint_entropy(w, sets, membership) for w in words]
+        batched_s += time.perf_counter() - start
+
+        if any(abs(x - y) > 1e-9 for x, y in zip(naive, batched)):
+            raise AssertionError("batched joint entropy disagrees with the naive sum")
+
+    scored = states * guesses
+    return {
+        "boards": boards,
+        "mean_candidates": statistics.mean(sizes),
+        "naive_us": naive_s / scored * 1e6,
+        "batched_us": batched_s / scored * 1e6,
+        "speedup": naive_s / batched_s,
+    }
+
+
+def _percentile(values, pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def bench_deadline(budgets_ms, states: int = 10, seed: int = 0) -> list:
+    """
+    Quality vs latency of the deadline-bounded search: for random game states
+    after the opener, compare each budget's pick with the full search.
+    """
+    from config import OPENER
+    from feedback import feedback_pattern, filter_consistent
+    from knowledge import WordleKnowledge
+    from search import anytime_top_guesses, top_guesses
+
+    kb = WordleKnowledge()
+    answers, guessable = list(kb.answers), kb.guessable
+    rng = random.Random(seed)
+    cases = []
+    for _ in range(states):
+        candidates = set(filter_consistent(answers, OPENER, feedback_pattern(OPENER, rng.choice(answers))))
+        if len(candidates) > 2:
+            full = top_guesses(candidates, guessable, 1)[0]
+            cases.append((candidates, full))
+
+    results = []
+    for budget in budgets_ms:
+        latencies, matches, completes, losses = [], 0, 0, []
+        for candidates, (best_word, best_entropy, _, _) in cases:
+            start = time.monotonic()
+            top, complete = anytime_top_guesses(candidates, guessable, 1, start + budget / 1000)
+            latencies.append((time.monotonic() - start) * 1000)
+            matches += top[0][0] == best_word
+            completes += complete
+            losses.append(best_entropy - top[0][1])
+        results.append({
+            "budget_ms": budget,
+            "p50_ms": _percentile(latencies, 50),
+            "p99_ms": _percentile(latencies, 99),
+            "same_pick": matches / len(cases),
+            "complete": completes / len(cases),
+            "mean_bits_lost": statistics.mean(losses),
+        })
+    return results
+
+
+def bench_approx(opener: str = "FUZZY", sample: int = 256, rescore: int = 32, seed: int = 0,
+                 max_states: int = None) -> dict:
+    """
+    Guess quality of approximate vs exact scoring across every answer: each
+    answer's state after `opener` is solved both ways (states shared by
+    several answers are computed once and weighted by their answer count).
+    Only states larger than the sample differ; smaller ones are exact anyway.
+    """
+    from collections import defaultdict
+    from feedback import feedback_pattern, filter_consistent
+    from knowledge import WordleKnowledge
+    from search import approx_top_guesses, top_guesses
+
+    kb = WordleKnowledge()
+    answers, guessable = list(kb.answers), kb.guessable
+    opener = opener.upper()
+
+    states = defaultdict(int)
+    for answer in answers:
+        states[feedback_pattern(opener, answer)] += 1
+    large = sorted((p for p in states if states[p] > sample), key=states.get, reverse=True)[:max_states]
+
+    exact_s = approx_s = 0.0
+    weight = same = 0
+    losses = []
+    for pattern in large:
+        candidates = set(filter_consistent(answers, opener, pattern))
+        start = time.perf_counter()
+        exact = top_guesses(candidates, guessable, 1)[0]
+        mid = time.perf_counter()
+        approx = approx_top_guesses(candidates, guessable, 1, sample, rescore, seed)[0]
+        approx_s += time.perf_counter() - mid
+        exact_s += mid - start
+
+        n = states[pattern]
+        weight += n
+        same += n * (approx[0] == exact[0])
+        losses.append((exact[1] - approx[1], n))
+
+    covered = weight / len(answers)
+    return {
+        "answers": len(answers),
+        "approximated_states": len(large),
+        "answers_covered": covered,
+        "same_pick": same / weight if weight else 1.0,
+        "mean_bits_lost": sum(loss * n for loss, n in losses) / weight if weight else 0.0,
+        "max_bits_lost": max((loss for loss, _ in losses), default=0.0),
+        "exact_s": exact_s,
+        "approx_s": approx_s,
+    }
+
+
+def _play(answer, kb, opener, pick) -> int:
+    """Turns `pick(candidates)` takes to find `answer` after `opener` (kb is reset)"""
+    from feedback import feedback_pattern
+
+    kb.reset()
+    guess, turns = opener, 1
+    while guess != answer:
+        kb.apply_feedback(guess, feedback_pattern(guess, answer))
+        guess = pick(kb.possible)
+        turns += 1
+    return turns
+
+
+def bench_hybrid(keeps, games: int = 50, seed: int = 0) -> list:
+    """
+    Hybrid (heuristic shortlist + exact) vs exhaustive planning over random
+    games after the opener: per-turn cost, how often the picks differ in the
+    states the exhaustive planner reaches, and average guesses per game.
+    """
+    from config import OPENER
+    from knowledge import WordleKnowledge
+    from search import hybrid_top_guesses, top_guesses
+
+    kb = WordleKnowledge()
+    answers, guessable = list(kb.answers), kb.guessable
+    targets = random.Random(seed).sample(answers, games)
+
+    exact_ms, states = [], []
+
+    def exhaustive(candidates):
+        if len(candidates) <= 2:
+            return next(iter(candidates))
+        start = time.perf_counter()
+        word, ent = top_guesses(candidates, guessable, 1)[0][:2]
+        exact_ms.append((time.perf_counter() - start) * 1000)
+        states.append((candidates, word, ent))
+        return word
+
+    exact_turns = [_play(answer, kb, OPENER, exhaustive) for answer in targets]
+
+    results = []
+    for keep in keeps:
+        def hybrid(candidates):
+            if len(candidates) <= 2:
+                return next(iter(candidates))
+            return hybrid_top_guesses(candidates, guessable, 1, keep)[0][0]
+
+        latencies, differ, worse, losses = [], 0, 0, []
+        for candidates, word, ent in states:
+            start = time.perf_counter()
+            pick = hybrid_top_guesses(candidates, guessable, 1, keep)[0]
+            latencies.append((time.perf_counter() - start) * 1000)
+            differ += pick[0] != word
+            worse += pick[1] < ent  # a different word with equal entropy is just another tie
+            losses.append(ent - pick[1])
+        turns = [_play(answer, kb, OPENER, hybrid) for answer in targets]
+        results.append({
+            "keep": keep,
+            "states": len(states),
+            "differ": differ / len(states) if states else 0.0,
+            "worse": worse / len(states) if states else 0.0,
+            "mean_bits_lost": statistics.mean(losses) if losses else 0.0,
+            "mean_ms": statistics.mean(latencies) if latencies else 0.0,
+            "exact_mean_ms": statistics.mean(exact_ms) if exact_ms else 0.0,
+            "avg_guesses": statistics.mean(turns),
+            "exact_avg_guesses": statistics.mean(exact_turns),
+        })
+    return results
+
+
+def bench_kernels(states: int = 5, guesses: int = 2000, seed: int = 0) -> dict:
+    """
+    Pattern-table vs matrix-free kernel: time per guess scored and memory,
+    over the full answer list and random states after the opener. The table's
+    rows are built for `guesses` sampled words; its full size is extrapolated.
+    """
+    import tracemalloc
+    from config import OPENER
+    from feedback import feedback_pattern, filter_consistent
+    from indexes import PatternIndex
+    from knowledge import WordleKnowledge
+    from search import score_guess
+    from vectorized import WordArrays, np
+
+    kb = WordleKnowledge()
+    answers, guessable = list(kb.answers), kb.guessable
+    rng = random.Random(seed)
+    sample = rng.sample(guessable, guesses)
+    cases = [set(answers)]
+    for _ in range(states):
+        cases.append(set(filter_consistent(answers, OPENER, feedback_pattern(OPENER, rng.choice(answers)))))
+
+    index = PatternIndex(answers, guessable)
+    start = time.perf_counter()
+    for w in sample:
+        index.row(w)
+    table_build_s = time.perf_counter() - start
+    tracemalloc.start()  # separate pass: tracing slows the build down
+    traced = PatternIndex(answers, guessable)
+    for w in sample:
+        traced.row(w)
+    table_bytes = tracemalloc.get_traced_memory()[0] * len(guessable) / guesses
+    tracemalloc.stop()
+    del traced
+
+    timings = {"direct": 0.0, "table": 0.0, "vector": 0.0}
+    mismatches = vector_bytes = 0
+    for candidates in cases:
+        start = time.perf_counter()
+        direct = [score_guess(w, candidates) for w in sample]
+        timings["direct"] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        ids = index.ids(candidates)
+        table = [index.score(w, ids) for w in sample]
+        timings["table"] += time.perf_counter() - start
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        arrays = WordArrays(candidates)
+        vector = [arrays.score(w) for w in sample]
+        timings["vector"] += time.perf_counter() - start
+        vector_bytes = max(vector_bytes, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+        mismatches += sum(d != t or d != v for d, t, v in zip(direct, table, vector))
+
+    scored = guesses * len(cases)
+    return {
+        "numpy": np is not None,
+        "states": len(cases),
+        "direct_us": timings["direct"] / scored * 1e6,
+        "table_us": timings["table"] / scored * 1e6,
+        "vector_us": timings["vector"] / scored * 1e6,
+        "table_build_s": table_build_s * len(guessable) / guesses,
+        "table_mb": table_bytes / 2 ** 20,
+        "vector_mb": vector_bytes / 2 ** 20,
+        "mismatches": mismatches,
+    }
+
+
+def bench_packed(checks: int = 300, seed: int = 0) -> dict:
+    """
+    Packed integer words (packed.py) vs str: filtering the full guessable list
+    after a random guess/answer pair, feedback per pair, and list memory.
+    Fails loudly if any result differs.
+    """
+    import tracemalloc
+    from feedback import feedback_pattern, filter_consistent, encode_pattern
+    from knowledge import WordleKnowledge
+    from packed import encode_word, encode_words, filter_packed, packed_feedback
+
+    kb = WordleKnowledge()
+    answers, guessable = list(kb.answers), kb.guessable
+    rng = random.Random(seed)
+    pairs = [(rng.choice(guessable), rng.choice(answers)) for _ in range(checks)]
+    codes = encode_words(guessable)
+    packed_pairs = [(encode_word(g), encode_word(a)) for g, a in pairs]
+
+    str_s = packed_s = 0.0
+    for guess, answer in pairs:
+        pattern = feedback_pattern(guess, answer)
+        start = time.perf_counter()
+        words = filter_consistent(guessable, guess, pattern)
+        mid = time.perf_counter()
+        kept = filter_packed(codes, guess, pattern)
+        packed_s += time.perf_counter() - mid
+        str_s += mid - start
+        assert kept == encode_words(words), (guess, answer)
+
+    start = time.perf_counter()
+    patterns = [encode_pattern(feedback_pattern(g, a)) for g, a in pairs * 20]
+    mid = time.perf_counter()
+    packed = [packed_feedback(g, a) for g, a in packed_pairs * 20]
+    end = time.perf_counter()
+    assert patterns == packed
+
+    tracemalloc.start()
+    copies = ["".join(w) for w in guessable]  # fresh str objects, as read from a file
+    str_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    tracemalloc.start()
+    ints = encode_words(copies)
+    int_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del copies, ints
+
+    return {
+        "words": len(guessable),
+        "filter_str_ms": str_s / checks * 1000,
+        "filter_packed_ms": packed_s / checks * 1000,
+        "feedback_str_us": (mid - start) / len(patterns) * 1e6,
+        "feedback_packed_us": (end - mid) / len(packed) * 1e6,
+        "str_kb": str_bytes / 1024,
+        "packed_kb": int_bytes / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Wordle AI benchmarks")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("startup", help="time-to-first-guess of main.py")
+    p.add_argument("--runs", type=int, default=20)
+    p.add_argument("--budget-ms", type=float, default=100.0,
+                   help="fail (exit 1) if the median exceeds this")
+
+    p = sub.add_parser("multiboard", help="joint entropy: naive per-board sum vs batched kernel")
+    p.add_argument("--boards", type=int, nargs="+", default=[4, 8])
+    p.add_argument("--states", type=int, default=5, help="random game states per board count")
+    p.add_argument("--guesses", type=int, default=300, help="guess words scored per state")
+    p.add_argument("--seed", type=int, default=0)
+
+    p = sub.add_parser("deadline", help="deadline-bounded search: latency vs agreement with the full search")
+    p.add_argument("--budgets-ms", type=float, nargs="+", default=[10, 50, 100, 250])
+    p.add_argument("--states", type=int, default=10)
+    p.add_argument("--seed", type=int, default=0)
+
+    p = sub.add_parser("approx", help="approximate (sampled) vs exact scoring across all answers")
+    p.add_argument("--opener", default="FUZZY", help="a weak opener leaves large candidate sets")
+    p.add_argument("--sample", type=int, default=256)
+    p.add_argument("--rescore", type=int, default=32)
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--max-states", type=int, default=None, help="only the N largest states")
+
+    p = sub.add_parser("hybrid", help="heuristic shortlist + exact scoring vs exhaustive planning")
+    p.add_argument("--keep", type=int, nargs="+", default=[50, 200], help="shortlist sizes (K)")
+    p.add_argument("--games", type=int, default=50)
+    p.add_argument("--seed", type=int, default=0)
+
+    p = sub.add_parser("kernels", help="pattern table vs matrix-free kernel: speed and memory")
+    p.add_argument("--states", type=int, default=5, help="random states after the opener (plus all answers)")
+    p.add_argument("--guesses", type=int, default=2000, help="guesses scored per state")
+    p.add_argument("--seed", type=int, default=0)
+
+    p = sub.add_parser("packed", help="packed integer words vs str: filter, feedback, memory")
+    p.add_argument("--checks", type=int, default=300, help="random guess/answer pairs")
+    p.add_argument("--seed", type=int, default=0)
+
+    args = parser.parse_args()
+
+    if args.command == "startup":
+        result = bench_startup(args.runs)
+        print(f"main.py time-to-first-guess over {result['runs']} runs: "
+              f"min {result['min_ms']:.1f} ms | median {result['median_ms']:.1f} ms | "
+              f"max {result['max_ms']:.1f} ms")
+        if result["median_ms"] > args.budget_ms:
+            print(f"FAIL: median exceeds budget of {args.budget_ms:.0f} ms")
+            sys.exit(1)
+        print(f"OK: within budget of {args.budget_ms:.0f} ms")
+
+    elif args.command == "multiboard":
+        for n in args.boards:
+            r = bench_multiboard(n, args.states, args.guesses, args.seed)
+            print(f"{r['boards']} boards ({r['mean_candidates']:.0f} candidates in total): "
+                  f"naive {r['naive_us']:.0f} us/guess | batched {r['batched_us']:.0f} us/guess | "
+                  f"{r['speedup']:.2f}x")
+
+    elif args.command == "deadline":
+        for r in bench_deadline(args.budgets_ms, args.states, args.seed):
+            print(f"budget {r['budget_ms']:.0f} ms: p50 {r['p50_ms']:.1f} ms | p99 {r['p99_ms']:.1f} ms | "
+                  f"same pick as full search {100 * r['same_pick']:.0f}% | "
+                  f"complete {100 * r['complete']:.0f}% | mean loss {r['mean_bits_lost']:.3f} bits")
+
+    elif args.command == "approx":
+        r = bench_approx(args.opener, args.sample, args.rescore, args.seed, args.max_states)
+        print(f"after {args.opener.upper()}: {r['approximated_states']} states larger than the sample, "
+              f"covering {100 * r['answers_covered']:.1f}% of {r['answers']} answers")
+        print(f"same pick as exact {100 * r['same_pick']:.1f}% | mean loss {r['mean_bits_lost']:.4f} bits | "
+              f"max loss {r['max_bits_lost']:.4f} bits | exact {r['exact_s']:.1f} s vs approx {r['approx_s']:.1f} s")
+
+    elif args.command == "hybrid":
+        for r in bench_hybrid(args.keep, args.games, args.seed):
+            print(f"K={r['keep']:5d}: {r['mean_ms']:7.1f} ms/turn vs {r['exact_mean_ms']:.1f} ms exhaustive | "
+                  f"differs on {100 * r['differ']:.1f}% of {r['states']} states "
+                  f"(worse on {100 * r['worse']:.1f}%, mean loss {r['mean_bits_lost']:.3f} bits) | "
+                  f"avg guesses {r['avg_guesses']:.3f} vs {r['exact_avg_guesses']:.3f}")
+
+    elif args.command == "kernels":
+        r = bench_kernels(args.states, args.guesses, args.seed)
+        print(f"{r['states']} states, vector kernel on {'numpy' if r['numpy'] else 'bytes (no numpy)'}, "
+              f"{r['mismatches']} score mismatches")
+        print(f"direct {r['direct_us']:7.1f} us/guess | table {r['table_us']:7.1f} us/guess "
+              f"(full table {r['table_mb']:.1f} MB, {r['table_build_s']:.1f} s to build) | "
+              f"vector {r['vector_us']:7.1f} us/guess (peak {r['vector_mb']:.2f} MB)")
+
+    elif args.command == "packed":
+        r = bench_packed(args.checks, args.seed)
+        print(f"filter {r['words']} words: str {r['filter_str_ms']:.2f} ms vs packed {r['filter_packed_ms']:.2f} ms | "
+              f"feedback: str {r['feedback_str_us']:.2f} us vs packed {r['feedback_packed_us']:.2f} us | "
+              f"word list: str {r['str_kb']:.0f} KB vs packed {r['packed_kb']:.0f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,11 +11,36 @@ BASE_DIR = Path(__file__).resolve().parent
 # Use BASE_DIR to ensure the files are found relative to this file
 WORD_LIST_PATH = BASE_DIR / "wordle_answers.txt"
 GUESSABLE_PATH = BASE_DIR / "word_list.txt"
+Q_TABLE_PATH = BASE_DIR / "q_table.json"  # RL policy; read and written here, not in the CWD
+
+# --- WORD LENGTH ---
+# The lists above are the 5-letter game. Other lengths read
+# wordle_answers_<n>.txt / word_list_<n>.txt from the same directory.
+WORD_LENGTH = 5
+WORD_LIST_PATTERN = "wordle_answers_{n}.txt"
+GUESSABLE_PATTERN = "word_list_{n}.txt"
 
 ANSWERS = ["CIGAR", "REBUS", "SASSY", "HUMPH", "AWAKE", "BLUSH", "FOCAL", "EVADE", "NAVAL", "SERVE", "HEATH", "DWARF", "MODEL", "KARMA", "STINK", "GRADE", "QUIET", "BENCH", "ABATE", "FEIGN", "SLATE", "CRANE", "TRACE", "RAISE", "STARE"]
 GUESSABLE = ANSWERS  # or load from full list
 
 MAX_GUESSES = 6
+OPENER = "SLATE"  # fixed first guess; needs no search
+OPENERS = {5: OPENER}  # per word length; lengths not listed get one computed on first use
+SUGGESTIONS = 5  # ranked guesses the planner keeps per turn (best + alternatives)
+# "direct" (feedback_row per guess), "index" to cache a guess x answer pattern table
+# (long-running processes), or "vector" for the matrix-free array kernel in vectorized.py
+# (numpy if installed; small memory, no table)
+ENTROPY_KERNEL = "direct"
+# Approximate scoring when more than APPROX_SAMPLE answers remain (search.approx_top_guesses);
+# 0 always scores exactly
+APPROX_SAMPLE = 0
+APPROX_RESCORE = 32  # contenders re-scored exactly
+APPROX_SEED = 0
+# Hybrid planning: rank guesses by letter frequency and score only the best HYBRID_PREFILTER
+# exactly (search.hybrid_top_guesses); 0 scores every guess
+HYBRID_PREFILTER = 0
+DEDUP_GUESSES = True  # score one guess per partition of the candidates (same picks, fewer words)
 ALPHA = 0.1
 GAMMA = 0.9
-EPSILON = 0.3
\ No newline at end of file
+EPSILON = 0.3
+SESSION_MEMORY_BUDGET = 4 * 1024 * 1024  # bytes one solver session may retain (python memory.py check)
@@ -0,0 +1,197 @@
+# feedback.py
+"""
+The one feedback kernel used by the solver, the game engine and the helpers.
+
+Patterns are strings of 'G' (green), 'Y' (yellow) and 'B' (gray), one per
+letter. WordleGame and WordleHelper speak in (letter, color) tuples; the
+adapters below convert between the two without recomputing anything.
+"""
+
+from typing import Iterable, List, Tuple
+
+COLOR_NAMES = {'G': 'green', 'Y': 'yellow', 'B': 'gray'}
+COLOR_CODES = {'green': 'G', 'yellow': 'Y', 'gray': 'B'}
+
+
+def feedback_pattern(guess: str, answer: str) -> str:
+    """
+    Feedback for `guess` when the secret is `answer`.
+
+    Greens are assigned first; each remaining guess letter is yellow only while
+    unmatched copies of it are left in the answer (left to right), so duplicate
+    letters behave like the real game.
+    """
+    if guess == answer:
+        return 'G' * len(guess)
+
+    # Answer letters not matched by a green; each yellow consumes one of them
+    unmatched = [a for g, a in zip(guess, answer) if g != a]
+
+    result = []
+    for g, a in zip(guess, answer):
+        if g == a:
+            result.append('G')
+        elif g in unmatched:
+            result.append('Y')
+            unmatched.remove(g)
+        else:
+            result.append('B')
+    return ''.join(result)
+
+
+def feedback_row(guess: str, words: Iterable[str]) -> List[str]:
+    """
+    [feedback_pattern(guess, w) for w in words], faster.
+
+    When the guess has no repeated letter a non-green letter is yellow exactly
+    when it occurs anywhere in the answer, so no unmatched-letter bookkeeping
+    is needed; that covers most guesses.
+    """
+    if len(set(guess)) != len(guess):
+        return [feedback_pattern(guess, w) for w in words]
+    if len(guess) == 5:
+        g0, g1, g2, g3, g4 = guess
+        return [('G' if w[0] == g0 else 'Y' if g0 in w else 'B')
+                + ('G' if w[1] == g1 else 'Y' if g1 in w else 'B')
+                + ('G' if w[2] == g2 else 'Y' if g2 in w else 'B')
+                + ('G' if w[3] == g3 else 'Y' if g3 in w else 'B')
+                + ('G' if w[4] == g4 else 'Y' if g4 in w else 'B')
+                for w in words]
+    positions = list(enumerate(guess))
+    return [''.join(['G' if w[i] == g else 'Y' if g in w else 'B' for i, g in positions])
+            for w in words]
+
+
+def is_consistent(word: str, guess: str, pattern: str) -> bool:
+    """True if `word` could be the answer given that `guess` scored `pattern`"""
+    return feedback_pattern(guess, word) == pattern
+
+
+def compile_constraints(guess: str, pattern: str):
+    """
+    Turn (guess, pattern) into the equivalent positional and letter-count constraints.
+
+    Returns (greens, misplaced, counts) or None if no answer can produce the pattern:
+        greens:    [(position, letter)] the word must have
+        misplaced: [(position, letter)] the word must not have (yellow/gray spots)
+        counts:    [(letter, n, exact)] the word has >= n copies, or exactly n if exact
+    A word satisfies them exactly when feedback_pattern(guess, word) == pattern.
+    """
+    greens = []
+    misplaced = []
+    required = {}
+    capped = set()
+    for i, (g, p) in enumerate(zip(guess, pattern)):
+        if p == 'G':
+            greens.append((i, g))
+        else:
+            misplaced.append((i, g))
+        if p == 'B':
+            capped.add(g)
+        elif p == 'Y' and g in capped:
+            # Yellows go to the leftmost unmatched copies, so gray-then-yellow can't happen
+            return None
+        else:
+            required[g] = required.get(g, 0) + 1
+
+    counts = [(letter, required.get(letter, 0), letter in capped)
+              for letter in set(required) | capped]
+    return greens, misplaced, counts
+
+
+def filter_consistent(words: Iterable[str], guess: str, pattern: str) -> List[str]:
+    """
+    Words that are still possible answers after `guess` scored `pattern`.
+    Same result as filtering with is_consistent, but checks compiled constraints
+    so most words are rejected after a character comparison or two.
+    """
+    constraints = compile_constraints(guess, pattern)
+    if constraints is None:
+        return []
+    greens, misplaced, counts = constraints
+
+    # Letters known to be absent reject the most words, so test them first and cheaply
+    absent = [letter for letter, n, exact in counts if exact and n == 0]
+    counts = [(letter, n, exact) for letter, n, exact in counts if n > 0]
+
+    matches = []
+    for w in words:
+        for i, letter in greens:
+            if w[i] != letter:
+                break
+        else:
+            for letter in absent:
+                if letter in w:
+                    break
+            else:
+                for i, letter in misplaced:
+                    if w[i] == letter:
+                        break
+                else:
+                    for letter, n, exact in counts:
+                        c = w.count(letter)
+                        if c < n or (exact and c != n):
+                            break
+                    else:
+                        matches.append(w)
+    return matches
+
+
+PATTERN_DIGITS = {'B': 0, 'Y': 1, 'G': 2}
+
+
+def encode_pattern(pattern: str) -> int:
+    """'GYB...' -> base-3 integer (B=0, Y=1, G=2, first letter most significant)"""
+    code = 0
+    for p in pattern:
+        code = code * 3 + PATTERN_DIGITS[p]
+    return code
+
+
+def decode_pattern(code: int, length: int = 5) -> str:
+    """Inverse of encode_pattern"""
+    letters = []
+    for _ in range(length):
+        code, digit = divmod(code, 3)
+        letters.append('BYG'[digit])
+    return ''.join(reversed(letters))
+
+
+def hard_mode_filter(words: Iterable[str], guess: str, pattern: str) -> List[str]:
+    """
+    Words still legal as hard-mode guesses after `guess` scored `pattern`:
+    every green stays in place and every revealed letter (green or yellow) is
+    used at least as many times as it was revealed. Grays don't restrict guesses.
+    Apply once per turn to the previous turn's result to keep the set incrementally.
+    """
+    greens = [(i, g) for i, (g, p) in enumerate(zip(guess, pattern)) if p == 'G']
+    required = {}
+    for g, p in zip(guess, pattern):
+        if p != 'B':
+            required[g] = required.get(g, 0) + 1
+    if not required:
+        return list(words)
+
+    required = list(required.items())
+    matches = []
+    for w in words:
+        for i, letter in greens:
+            if w[i] != letter:
+                break
+        else:
+            for letter, n in required:
+                if w.count(letter) < n:
+                    break
+            else:
+                matches.append(w)
+    return matches
+
+
+def to_tuples(guess: str, pattern: str) -> List[Tuple[str, str]]:
+    """'GYB' pattern -> [(letter, 'green'|'yellow'|'gray'), ...]"""
+    return list(zip(guess, map(COLOR_NAMES.__getitem__, pattern)))
+
+
+def from_tuples(feedback: Iterable[Tuple[str, str]]) -> str:
+    """[(letter, color), ...] -> 'GYB' pattern"""
+    return ''.join(COLOR_CODES[color] for _, color in feedback)
@@ -0,0 +1,63 @@
+# gamelog.py
+"""
+Append-only JSONL log of played games.
+
+One line per finished game:
+    {"mode": "engine"|"helper", "answer": "CRANE"|null, "hard_mode": false, "solved": true,
+     "turns": [{"guess": "SLATE", "pattern": "BBGBG", "source": "opener", "ms": 0.002,
+                "deadline_ms": null, "complete": true}, ...]}
+
+source records who made each decision: "opener" (fixed first guess),
+"planner" (entropy search), "rl" (Q-table), "endgame" (random pick among
+the last two candidates) or "manual" (a guess the solver didn't choose).
+ms is the time taken to choose it, or null for manual guesses. deadline_ms
+is the latency budget the search had (null: none), and complete is false if
+it stopped at that budget before scoring every word.
+Replay them with replay.py.
+"""
+
+import json
+from pathlib import Path
+from typing import Iterator, Union
+
+
+class GameLog:
+    """Buffered writer: records are kept in memory and appended in batches"""
+
+    def __init__(self, path: Union[str, Path], buffer_size: int = 64):
+        self.path = Path(path)
+        self.buffer_size = buffer_size
+        self._pending = []
+
+    def write(self, record: dict):
+        self._pending.append(json.dumps(record))
+        if len(self._pending) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        if self._pending:
+            with open(self.path, "a") as f:
+                f.write("\n".join(self._pending) + "\n")
+            self._pending = []
+
+    close = flush
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.flush()
+
+    def __del__(self):
+        try:
+            self.flush()
+        except Exception:
+            pass  # interpreter shutdown: nothing sensible left to do
+
+
+def read_games(path: Union[str, Path]) -> Iterator[dict]:
+    """Stream the games of a log, skipping blank lines"""
+    with open(path, "r") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
@@ -0,0 +1,247 @@
+# indexes.py
+"""
+Per-word-length word lists, pattern indexes and openers.
+
+Everything here is built on first use and cached per length, so a process
+serving 5- and 6-letter games only loads (and indexes) those two lengths.
+The cached objects are read-only and shared by every WordleKnowledge.
+
+shared_words() does the same for the arbitrary word lists handed to
+WordleHelper, WordleAI, WordleTrainer and WordleGame: equal lists map to one
+SharedWords, so sessions hold a reference to the dictionary, not a copy.
+"""
+
+import heapq
+import threading
+from array import array
+from collections import Counter
+from itertools import product
+from math import log2
+from operator import itemgetter
+from typing import Dict, FrozenSet, Iterable, Tuple
+
+from config import (ANSWERS, BASE_DIR, GUESSABLE, GUESSABLE_PATH, GUESSABLE_PATTERN,
+                    OPENERS, WORD_LIST_PATH, WORD_LIST_PATTERN)
+from feedback import encode_pattern, feedback_row
+from lexicon import Lexicon, load_words
+
+_lock = threading.RLock()
+_word_lists: Dict[int, Tuple] = {}
+_pattern_indexes: Dict[int, "PatternIndex"] = {}
+_openers: Dict[int, str] = dict(OPENERS)
+_opener_locks: Dict[int, threading.Lock] = {}  # per length, so one slow search doesn't block other lookups
+_answer_sets: Dict[int, FrozenSet[str]] = {}
+_shared_words: Dict[Tuple[int, Tuple[str, ...]], "SharedWords"] = {}
+_shared_by_id: Dict[int, "SharedWords"] = {}  # id(SharedWords.words) -> itself, for the fast path
+
+
+def list_paths(length: int):
+    """(answers path, guessable path) for a word length"""
+    if length == 5:
+        return WORD_LIST_PATH, GUESSABLE_PATH
+    return (BASE_DIR / WORD_LIST_PATTERN.format(n=length),
+            BASE_DIR / GUESSABLE_PATTERN.format(n=length))
+
+
+def word_lists(length: int = 5):
+    """(answers, guessable) for a word length, loaded once per process"""
+    lists = _word_lists.get(length)
+    if lists is None:
+        with _lock:
+            lists = _word_lists.get(length)
+            if lists is None:
+                lists = _word_lists[length] = _load_lists(length)
+    return lists
+
+
+def _load_lists(length: int):
+    answers_path, guessable_path = list_paths(length)
+    try:
+        answers = load_words(answers_path, length)
+    except FileNotFoundError:
+        if length != 5:
+            raise FileNotFoundError(f"No {length}-letter answer list: expected {answers_path}")
+        answers = [w.upper() for w in ANSWERS]
+    try:
+        guessable = load_words(guessable_path, length)
+    except FileNotFoundError:
+        guessable = [w.upper() for w in GUESSABLE] if length == 5 else answers
+    return answers, guessable
+
+
+def answer_set(length: int = 5) -> FrozenSet[str]:
+    """word_lists(length)[0] as a frozenset: every session's starting candidate set"""
+    words = _answer_sets.get(length)
+    if words is None:
+        with _lock:
+            words = _answer_sets.get(length)
+            if words is None:
+                words = _answer_sets[length] = frozenset(word_lists(length)[0])
+    return words
+
+
+def shared_words(words: Iterable[str], length: int = 5) -> "SharedWords":
+    """
+    The process-wide SharedWords for a word list (uppercased, other lengths
+    dropped). Passing a SharedWords' own .words tuple back costs nothing.
+    """
+    shared = _shared_by_id.get(id(words))
+    if shared is not None and shared.words is words:
+        return shared
+    key = (length, tuple(w.upper() for w in words if len(w) == length))
+    shared = _shared_words.get(key)
+    if shared is None:
+        with _lock:
+            shared = _shared_words.get(key)
+            if shared is None:
+                shared = _shared_words[key] = SharedWords(key[1], length)
+                _shared_by_id[id(shared.words)] = shared
+    return shared
+
+
+class SharedWords:
+    """
+    Read-only uppercased word list, shared by reference:
+    words (tuple, in list order), members (frozenset) and the packed encoding
+    (codes, word_of: code -> word; see packed.py), each built on first use.
+    """
+
+    def __init__(self, words: Tuple[str, ...], length: int):
+        self.words = words
+        self.length = length
+        self._members = None
+        self._codes = None
+        self._word_of = None
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    @property
+    def members(self) -> FrozenSet[str]:
+        if self._members is None:
+            self._members = frozenset(self.words)
+        return self._members
+
+    @property
+    def codes(self) -> Tuple[int, ...]:
+        if self._codes is None:
+            from packed import encode_word  # Localized: only WordleHelper filters packed words
+            self._codes = tuple(map(encode_word, self.words))
+        return self._codes
+
+    @property
+    def word_of(self) -> Dict[int, str]:
+        if self._word_of is None:
+            self._word_of = dict(zip(self.codes, self.words))
+        return self._word_of
+
+
+def pattern_index(length: int = 5) -> "PatternIndex":
+    """PatternIndex over word_lists(length), shared process-wide"""
+    index = _pattern_indexes.get(length)
+    if index is None:
+        with _lock:
+            index = _pattern_indexes.get(length)
+            if index is None:
+                index = _pattern_indexes[length] = PatternIndex(*word_lists(length))
+    return index
+
+
+def opener(length: int = 5) -> str:
+    """Fixed first guess for a length: config.OPENERS, else the best entropy guess (computed once)"""
+    word = _openers.get(length)
+    if word is None:
+        with _lock:
+            length_lock = _opener_locks.setdefault(length, threading.Lock())
+        # The search can take seconds: hold only this length's lock, not the module-wide one
+        with length_lock:
+            word = _openers.get(length)
+            if word is None:
+                from search import best_guess  # Localized: only for lengths without a configured opener
+                answers, guessable = word_lists(length)
+                word = _openers[length] = best_guess(set(answers), guessable)
+    return word
+
+
+class PatternIndex:
+    """
+    Feedback patterns of each guess against every answer, as integer codes
+    (feedback.encode_pattern). Rows are computed the first time a guess is
+    scored and then reused, so later entropy calls only count codes.
+
+    A full index holds len(guessable) x len(answers) codes (one byte each for
+    5 letters, two for longer words): worth it in long-running processes.
+    """
+
+    def __init__(self, answers, guessable):
+        self.answers = answers
+        self.guessable = guessable
+        self.word_length = len(answers[0]) if len(answers) else 5
+        self._answer_ids = None
+        self._codes = None
+        self._rows = {}
+
+    @property
+    def answer_ids(self) -> Dict[str, int]:
+        if self._answer_ids is None:
+            if isinstance(self.answers, Lexicon):
+                self._answer_ids = self.answers.index
+            else:
+                self._answer_ids = {w: i for i, w in enumerate(self.answers)}
+        return self._answer_ids
+
+    @property
+    def codes(self) -> Dict[str, int]:
+        """Pattern string -> code, for every pattern of this length"""
+        if self._codes is None:
+            self._codes = {''.join(p): encode_pattern(p)
+                           for p in product('BYG', repeat=self.word_length)}
+        return self._codes
+
+    def row(self, guess: str):
+        """Codes of guess against answers[0], answers[1], ..."""
+        row = self._rows.get(guess)
+        if row is None:
+            codes = map(self.codes.__getitem__, feedback_row(guess, self.answers))
+            row = bytes(codes) if 3 ** self.word_length <= 256 else array('H', codes)
+            self._rows[guess] = row
+        return row
+
+    def ids(self, words: Iterable[str]):
+        answer_ids = self.answer_ids
+        return [answer_ids[w] for w in words]
+
+    def entropy(self, guess: str, ids) -> float:
+        """search.entropy(guess, candidates) with candidates given as answer ids"""
+        n = len(ids)
+        if n == 0:
+            return 0.0
+        # Same arithmetic as search.entropy, so both pick the same guess on ties
+        counts = sorted(Counter(map(self.row(guess).__getitem__, ids)).values())
+        return -sum(c / n * log2(c / n) for c in counts if c > 0)
+
+    def score(self, guess: str, ids) -> Tuple[float, float]:
+        """search.score_guess with candidates given as answer ids"""
+        n = len(ids)
+        if n == 0:
+            return 0.0, 0.0
+        counts = sorted(Counter(map(self.row(guess).__getitem__, ids)).values())
+        ent = -sum(c / n * log2(c / n) for c in counts if c > 0)
+        return ent, sum(c * c for c in counts) / n
+
+    def top_guesses(self, candidates, guessable, k: int = 5):
+        """search.top_guesses through the index"""
+        n = len(candidates)
+        if n == 0:
+            return []
+        ids = self.ids(candidates)
+        scored = ((w,) + self.score(w, ids) for w in guessable)
+        best = heapq.nlargest(k, scored, key=itemgetter(1))
+        return [(w, ent, remaining, 1 / n if w in candidates else 0.0) for w, ent, remaining in best]
+
+    def best_guess(self, candidates, guessable) -> str:
+        """search.best_guess through the index"""
+        if len(candidates) <= 2:
+            return list(candidates)[0] if candidates else "NO_CANDIDATE"
+        ids = self.ids(candidates)
+        return max(guessable, key=lambda w: self.entropy(w, ids))
@@ -1,31 +1,138 @@
 # knowledge.py
 from typing import List, Set, Tuple
 from collections import Counter
-from config import ANSWERS, GUESSABLE, WORD_LIST_PATH, GUESSABLE_PATH
-from pathlib import Path
+from config import WORD_LENGTH
+from lexicon import Lexicon
 
 
 class WordleKnowledge:
-    def __init__(self):
-        try:
-            self.answers = [line.strip().upper() for line in WORD_LIST_PATH.open() if line.strip()]
-            self.guessable = [line.strip().upper() for line in GUESSABLE_PATH.open() if line.strip()]
-        except FileNotFoundError:
-            self.answers = [w.upper() for w in ANSWERS]
-            self.guessable = [w.upper() for w in GUESSABLE]
-
-        self.possible = set(self.answers)
+    def __init__(self, answers=None, guessable=None, word_length: int = None, hard_mode: bool = False):
+        # Word lists are loaded on first use: turn 1 always plays the fixed
+        # opener, so a fresh game doesn't need them yet. Already loaded
+        # (read-only) lists can be passed in and are shared by reference.
+        self._answers = answers
+        self._guessable = guessable
+        if word_length is None:
+            word_length = len(answers[0]) if answers else WORD_LENGTH
+        self.word_length = word_length
+        self._possible = None
+        self._pattern_index = None
+        # Hard mode: guesses must reuse every revealed hint (see allowed)
+        self.hard_mode = hard_mode
+        self._allowed = None
         self.constraints: List[Tuple[str, str]] = []
+        self.solved = False  # set once a guess scored all green
+
+    @property
+    def answers(self):
+        if self._answers is None:
+            from indexes import word_lists  # Localized: shared per-length lists
+            self._answers = word_lists(self.word_length)[0]
+        return self._answers
+
+    @property
+    def guessable(self):
+        if self._guessable is None:
+            from indexes import word_lists  # Localized: shared per-length lists
+            self._guessable = word_lists(self.word_length)[1]
+        return self._guessable
+
+    @property
+    def pattern_index(self):
+        """PatternIndex over this knowledge's lists (the shared one for the standard lists)"""
+        if self._pattern_index is None:
+            from indexes import PatternIndex, pattern_index, word_lists  # Localized import
+            try:
+                shared_answers, shared_guessable = word_lists(self.word_length)
+            except FileNotFoundError:
+                shared_answers = shared_guessable = None  # lists were handed in directly
+            if self.answers is shared_answers and self.guessable is shared_guessable:
+                self._pattern_index = pattern_index(self.word_length)
+            else:
+                self._pattern_index = PatternIndex(self.answers, self.guessable)
+        return self._pattern_index
+
+    @property
+    def allowed(self):
+        """Words that may be guessed now: guessable, narrowed each turn in hard mode"""
+        if not self.hard_mode:
+            return self.guessable
+        if self._allowed is None:
+            # Fresh game or restored snapshot: rebuild from the constraint history once
+            from feedback import hard_mode_filter  # Localized import
+            allowed = self.guessable
+            for guess, feedback in self.constraints:
+                allowed = hard_mode_filter(allowed, guess, feedback)
+            self._allowed = allowed
+        return self._allowed
+
+    @property
+    def possible(self) -> Set[str]:
+        if self._possible is None:
+            # Read-only start state: the shared answer set for the standard lists.
+            # apply_feedback replaces it with a new set rather than mutating it.
+            from indexes import answer_set, word_lists  # Localized: shared per-length lists
+            try:
+                shared = word_lists(self.word_length)[0] is self.answers
+            except FileNotFoundError:
+                shared = False  # lists were handed in directly
+            self._possible = answer_set(self.word_length) if shared else frozenset(self.answers)
+        return self._possible
+
+    @possible.setter
+    def possible(self, words: Set[str]):
+        self._possible = words
+
+    def _answer_index(self):
+        answers = self.answers
+        if isinstance(answers, Lexicon):
+            return answers.index  # built once per list, shared by every session
+        return {w: i for i, w in enumerate(answers)}
+
+    def candidate_mask(self) -> bytes:
+        """possible as a bitmask over answers (bit i set if answers[i] is still possible)"""
+        index = self._answer_index()
+        mask = bytearray((len(self.answers) + 7) // 8)
+        for word in self.possible:
+            i = index[word]
+            mask[i >> 3] |= 1 << (i & 7)
+        return bytes(mask)
+
+    def set_candidate_mask(self, mask: bytes):
+        """Restore possible from candidate_mask() output (no filtering is replayed)"""
+        answers = self.answers
+        if len(mask) != (len(answers) + 7) // 8 or (len(answers) % 8 and mask[-1] >> (len(answers) % 8)):
+            raise ValueError("Candidate mask does not match the answer list")
+        possible = set()
+        for byte_index, byte in enumerate(mask):
+            base = byte_index << 3
+            while byte:
+                low = byte & -byte
+                possible.add(answers[base + low.bit_length() - 1])
+                byte ^= low
+        self.possible = possible
+
+    def warm_up(self):
+        """Load everything now instead of on first use"""
+        self.guessable
+        self.possible
 
     def apply_feedback(self, guess: str, feedback: str):
         self.constraints.append((guess, feedback))
-        new_possible = {w for w in self.possible if self._matches_feedback(w, guess, feedback)}
-        self.possible = new_possible
+        if self.hard_mode and self._allowed is not None:
+            from feedback import hard_mode_filter  # Localized import
+            self._allowed = hard_mode_filter(self._allowed, guess, feedback)
+        if feedback == 'G' * len(feedback):
+            self.solved = True
+        from feedback import filter_consistent  # Localized import
+        self.possible = set(filter_consistent(self.possible, guess, feedback))
 
     def _matches_feedback(self, word: str, guess: str, feedback: str) -> bool:
-        from search import feedback_pattern  # Localized import
-        return feedback_pattern(guess, word) == feedback
+        from feedback import is_consistent  # Localized import
+        return is_consistent(word, guess, feedback)
 
     def reset(self):
-        self.possible = set(self.answers)
-        self.constraints = []
\ No newline at end of file
+        self._possible = None
+        self._allowed = None
+        self.constraints = []
+        self.solved = False
\ No newline at end of file
@@ -0,0 +1,143 @@
+# lexicon.py
+"""
+Packed binary word lists.
+
+A .lex file is a 16-byte header followed by fixed-width uppercase ASCII
+records, one per word:
+
+    magic    4s   b"WLEX"
+    version  B    FORMAT_VERSION
+    length   B    letters per word
+    reserved H
+    count    I    number of records
+    crc32    I    checksum of the records
+
+load_words() compiles the text list into a .lex file next to it the first
+time it is used (and again whenever the text file is newer), so every
+entry point shares one fast loader instead of parsing text line by line.
+"""
+
+import os
+import struct
+import zlib
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Union
+
+MAGIC = b"WLEX"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sBBHII")
+
+
+class LexiconError(ValueError):
+    """Raised when a .lex file is malformed or fails its checksum"""
+
+
+class Lexicon(Sequence):
+    """
+    Read-only word list backed by a packed buffer
+
+    - buffer: zero-copy memoryview over the records
+    - words are decoded lazily on access (lex[i], iteration)
+    - index: word -> position hash, built on first use
+    """
+
+    def __init__(self, data: bytes, word_length: int):
+        self.word_length = word_length
+        self.buffer = memoryview(data)
+        self._text = None
+        self._index = None
+
+    @property
+    def text(self) -> str:
+        """All records as one string (decoded once, then sliced per word)"""
+        if self._text is None:
+            self._text = str(self.buffer, "ascii")
+        return self._text
+
+    @property
+    def index(self) -> Dict[str, int]:
+        if self._index is None:
+            self._index = {word: i for i, word in enumerate(self)}
+        return self._index
+
+    def __len__(self) -> int:
+        return len(self.buffer) // self.word_length
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("lexicon index out of range")
+        n = self.word_length
+        return self.text[i * n:(i + 1) * n]
+
+    def __iter__(self) -> Iterator[str]:
+        text, n = self.text, self.word_length
+        return (text[i:i + n] for i in range(0, len(text), n))
+
+    def __contains__(self, word) -> bool:
+        return word in self.index
+
+    def __repr__(self) -> str:
+        return f"Lexicon({len(self)} words of length {self.word_length})"
+
+
+def pack(words: Iterable[str], word_length: int = 5) -> bytes:
+    """Serialize words into the .lex format"""
+    records = "".join(words).encode("ascii")
+    if len(records) % word_length:
+        raise LexiconError(f"Words must all be {word_length} letters")
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, word_length, 0,
+                         len(records) // word_length, zlib.crc32(records))
+    return header + records
+
+
+def unpack(data: bytes) -> Lexicon:
+    """Validate a .lex blob and wrap its records without copying them"""
+    if len(data) < HEADER.size:
+        raise LexiconError("Lexicon file is truncated")
+    magic, version, word_length, _, count, checksum = HEADER.unpack_from(data)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise LexiconError("Not a lexicon file (or unsupported version)")
+
+    records = memoryview(data)[HEADER.size:]
+    if word_length == 0 or len(records) != count * word_length:
+        raise LexiconError("Lexicon record count does not match the header")
+    if zlib.crc32(records) != checksum:
+        raise LexiconError("Lexicon checksum mismatch")
+    return Lexicon(records, word_length)
+
+
+def parse_text(path: Union[str, Path], word_length: int = 5) -> list:
+    """Read a one-word-per-line text list (uppercased, wrong lengths skipped)"""
+    with open(path, "r") as f:
+        words = (line.strip().upper() for line in f)
+        return [w for w in words if len(w) == word_length and w.isascii() and w.isalpha()]
+
+
+def load_words(path: Union[str, Path], word_length: int = 5) -> Lexicon:
+    """
+    Load a text word list through its compiled .lex cache
+
+    Raises FileNotFoundError if neither the text list nor a cache exists.
+    """
+    path = Path(path)
+    packed = path.with_suffix(f".{word_length}.lex")
+
+    try:
+        if not path.exists() or packed.stat().st_mtime >= path.stat().st_mtime:
+            return unpack(packed.read_bytes())
+    except (OSError, LexiconError):
+        pass  # missing, stale or corrupt cache: rebuild from text
+
+    data = pack(parse_text(path, word_length), word_length)
+    try:
+        tmp = packed.with_suffix(f".lex.{os.getpid()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, packed)
+    except OSError:
+        pass  # read-only install: still works, just without the cache
+    return unpack(data)
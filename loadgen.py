@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+loadgen.py - Concurrent-session load generator and throughput benchmark
+Run: python loadgen.py --users 1 4 16 --games 3 --model thread --deadline-ms 100
+     python loadgen.py --users 8 --model process --think-ms 0 --json
+
+Each simulated user owns a WordleSolver (read-only policy, own seed) and
+plays Engine Mode games back to back against random answers, pausing
+--think-ms (+-50%, uniform) between seeing a guess and submitting its
+feedback, as a person reading the board would.
+
+Every concurrency level runs in a fresh Python process, so its peak RSS is
+its own and not the high-water mark of an earlier, bigger level:
+    thread:  all users on a thread pool in that process (one shared word list
+             and Q-table); peak RSS is the process's
+    process: one worker process per user (each loads its own copy); peak RSS
+             is the driver's plus each distinct worker's (a pool worker that
+             ran several users is counted once)
+Reported per level: games/sec, p50/p95/p99 latency of get_guess and
+submit_feedback (ms) and peak RSS. Nothing leaves the machine.
+"""
+
+import argparse
+import json
+import os
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List
+
+PERCENTILES = (50, 95, 99)
+
+
+def _peak_rss_kb() -> int:
+    """This process's peak resident set size, in KB (ru_maxrss is KB on Linux, bytes on macOS)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def _warm_up():
+    """Load what sessions share (word lists, Q-table) before any timing starts"""
+    from indexes import word_lists
+    from rl_agent import shared_agent
+
+    word_lists(5)
+    shared_agent().q_table
+
+
+def simulate_user(user: int, games: int, think_ms: float, deadline_ms: float = None, seed: int = 0) -> dict:
+    """
+    One user's session: `games` Engine Mode games.
+    Returns {"games", "guess_ms": [...], "feedback_ms": [...], "peak_rss_kb", "pid"}
+    """
+    from solver import WordleSolver
+
+    rng = random.Random(f"{seed}:{user}")
+    solver = WordleSolver(learn=False, seed=rng.getrandbits(32))
+    answers = solver.kb.answers
+    guess_ms, feedback_ms = [], []
+
+    for _ in range(games):
+        solver.start_game(answer=answers[rng.randrange(len(answers))])
+        while not solver.game_over:
+            start = time.perf_counter()
+            deadline = time.monotonic() + deadline_ms / 1000 if deadline_ms is not None else None
+            solver.last_guess = solver.get_guess(deadline)
+            guess_ms.append((time.perf_counter() - start) * 1000)
+
+            if think_ms:
+                time.sleep(think_ms * rng.uniform(0.5, 1.5) / 1000)
+
+            start = time.perf_counter()
+            solver.submit_feedback("")
+            feedback_ms.append((time.perf_counter() - start) * 1000)
+
+    return {"games": games, "guess_ms": guess_ms, "feedback_ms": feedback_ms, "peak_rss_kb": _peak_rss_kb(),
+            "pid": os.getpid()}
+
+
+def _simulate_job(job):
+    return simulate_user(*job)
+
+
+def _quantiles(values: List[float]) -> dict:
+    if len(values) < 2:
+        return {f"p{p}": (values[0] if values else 0.0) for p in PERCENTILES}
+    cuts = statistics.quantiles(values, n=100, method="inclusive")
+    return {f"p{p}": cuts[p - 1] for p in PERCENTILES}
+
+
+def run_level(users: int, model: str, games: int, think_ms: float, deadline_ms: float = None,
+              seed: int = 0) -> dict:
+    """Drive `users` concurrent sessions in this process (see the module docstring)"""
+    jobs = [(u, games, think_ms, deadline_ms, seed) for u in range(users)]
+    if model == "thread":
+        _warm_up()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=users) as pool:
+            results = list(pool.map(_simulate_job, jobs))
+        elapsed = time.perf_counter() - start
+        peak_rss_kb = _peak_rss_kb()
+    else:
+        with ProcessPoolExecutor(max_workers=users, initializer=_warm_up) as pool:
+            # Start (and warm) every worker before the clock starts
+            list(pool.map(time.sleep, [0.05] * users))
+            start = time.perf_counter()
+            results = list(pool.map(_simulate_job, jobs))
+            elapsed = time.perf_counter() - start
+        # Each worker's peak is a running maximum, so keep its largest report once
+        worker_peaks = {}
+        for r in results:
+            worker_peaks[r["pid"]] = max(worker_peaks.get(r["pid"], 0), r["peak_rss_kb"])
+        peak_rss_kb = _peak_rss_kb() + sum(worker_peaks.values())
+
+    guess_ms = [ms for r in results for ms in r["guess_ms"]]
+    feedback_ms = [ms for r in results for ms in r["feedback_ms"]]
+    total_games = sum(r["games"] for r in results)
+    return {
+        "users": users,
+        "model": model,
+        "games": total_games,
+        "seconds": elapsed,
+        "games_per_sec": total_games / elapsed if elapsed else 0.0,
+        "guess_ms": _quantiles(guess_ms),
+        "feedback_ms": _quantiles(feedback_ms),
+        "peak_rss_mb": peak_rss_kb / 1024,
+    }
+
+
+def run_isolated(users: int, model: str, games: int, think_ms: float, deadline_ms: float = None,
+                 seed: int = 0) -> dict:
+    """run_level() in a fresh interpreter, so peak RSS is measured per level"""
+    cmd = [sys.executable, __file__, "--users", str(users), "--model", model, "--games", str(games),
+           "--think-ms", str(think_ms), "--seed", str(seed), "--in-process", "--json"]
+    if deadline_ms is not None:
+        cmd += ["--deadline-ms", str(deadline_ms)]
+    out = subprocess.run(cmd, check=True, capture_output=True, text=True).stdout
+    return json.loads(out)[0]
+
+
+def format_row(r: dict) -> str:
+    g, f = r["guess_ms"], r["feedback_ms"]
+    return (f"{r['users']:5d} {r['model']:>7s} {r['games']:6d} {r['games_per_sec']:8.2f} | "
+            f"{g['p50']:7.1f} {g['p95']:7.1f} {g['p99']:7.1f} | "
+            f"{f['p50']:6.2f} {f['p95']:6.2f} {f['p99']:6.2f} | {r['peak_rss_mb']:8.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate concurrent solver sessions and report throughput")
+    parser.add_argument("--users", type=int, nargs="+", default=[1, 4, 16], help="concurrency levels")
+    parser.add_argument("--model", choices=["thread", "process"], default="thread")
+    parser.add_argument("--games", type=int, default=3, help="games per user")
+    parser.add_argument("--think-ms", type=float, default=300.0, help="mean pause before submitting feedback")
+    parser.add_argument("--deadline-ms", type=float, default=None,
+                        help="latency budget per get_guess (default: full search)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="print the results as a JSON list")
+    parser.add_argument("--in-process", action="store_true",
+                        help="run the levels in this process (peak RSS becomes a running maximum)")
+    args = parser.parse_args()
+
+    run = run_level if args.in_process else run_isolated
+    results = []
+    if not args.json:
+        print(f"{'users':>5s} {'model':>7s} {'games':>6s} {'games/s':>8s} | "
+              f"{'guess ms p50/p95/p99':>23s} | {'feedback ms p50/p95/p99':>20s} | {'RSS MB':>8s}")
+    for users in args.users:
+        r = run(users, args.model, args.games, args.think_ms, args.deadline_ms, args.seed)
+        results.append(r)
+        if not args.json:
+            print(format_row(r), flush=True)
+    if args.json:
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+memory.py - Memory accounting for solvers, helpers and AIs
+Run: python memory.py report --games 5
+     python memory.py report --target ai --json
+     python memory.py check --budget-kb 4096
+
+memory_report(target) lists every major structure a WordleSolver,
+MultiBoardSolver, WordleKnowledge, WordleHelper or WordleAI holds, as
+    {"target", "total_bytes", "session_bytes", "structures": {name: {
+        "bytes", "count", "shared", "growth"}}}
+bytes are deep sizes, and each object is counted once, under the first
+structure that reaches it (so a list aliased as both all_words and
+allowed_words is not counted twice). shared marks process-wide objects from
+the indexes registry (word lists, answer sets, SharedWords, pattern indexes)
+and the shared RLAgents' Q-tables: they are paid once per process, so
+session_bytes leaves them out. growth is
+the change in bytes since the report passed as `previous` (None without one).
+
+check_session_budget() is the container-sizing gate: with the shared state
+already loaded, it plays a few Engine Mode games in a fresh solver under
+tracemalloc and fails (exit status 1 from the CLI, a failing test in
+tests/test_memory.py) if the memory the session retains exceeds
+config.SESSION_MEMORY_BUDGET.
+"""
+
+import argparse
+import json
+import random
+import sys
+import tracemalloc
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+from config import SESSION_MEMORY_BUDGET
+
+
+def deep_sizeof(obj, seen: Optional[set] = None) -> int:
+    """
+    Bytes held by obj and everything it reaches through containers and
+    instance attributes. Objects already in `seen` count zero, so passing one
+    set across calls counts shared objects once.
+    """
+    from lexicon import Lexicon  # Localized: only for its buffer and caches
+
+    if seen is None:
+        seen = set()
+    total = 0
+    stack = [obj]
+    while stack:
+        o = stack.pop()
+        if o is None or id(o) in seen:
+            continue
+        seen.add(id(o))
+        total += sys.getsizeof(o)
+        if isinstance(o, (str, bytes, bytearray, int, float, bool, array)):
+            continue
+        if isinstance(o, memoryview):
+            total += o.nbytes
+        elif isinstance(o, dict):
+            stack.extend(o.keys())
+            stack.extend(o.values())
+        elif isinstance(o, (list, tuple, set, frozenset)):
+            stack.extend(o)
+        elif isinstance(o, Lexicon):
+            stack.extend((o.buffer, o._text, o._index))
+        elif hasattr(o, "__dict__") and not isinstance(o, type):
+            stack.append(o.__dict__)
+    return total
+
+
+def _shared_ids() -> set:
+    """ids of the process-wide objects in the indexes and rl_agent registries"""
+    import indexes  # Localized!
+    import rl_agent
+
+    shared = set()
+    for answers, guessable in indexes._word_lists.values():
+        shared.update((id(answers), id(guessable)))
+    shared.update(id(index) for index in indexes._pattern_indexes.values())
+    shared.update(id(words) for words in indexes._answer_sets.values())
+    for lexicon in indexes._shared_words.values():
+        shared.update((id(lexicon), id(lexicon.words), id(lexicon._members),
+                       id(lexicon._codes), id(lexicon._word_of)))
+    for agent in rl_agent._shared.values():
+        shared.update((id(agent), id(agent._q_table)))
+    return shared
+
+
+def _knowledge_structures(kb, prefix: str = "") -> List[Tuple[str, object]]:
+    return [
+        (prefix + "answers", kb._answers),
+        (prefix + "guessable", kb._guessable),
+        (prefix + "possible", kb._possible),
+        (prefix + "allowed", kb._allowed),
+        (prefix + "constraints", kb.constraints),
+        (prefix + "pattern_index", kb._pattern_index),
+    ]
+
+
+def structures(target) -> List[Tuple[str, object]]:
+    """(name, object) for every major structure held by target"""
+    from knowledge import WordleKnowledge  # Localized!
+    from solver import MultiBoardSolver, WordleSolver
+    from WordleAI import WordleAI
+    from WordleHelper import WordleHelper
+
+    if isinstance(target, WordleSolver):
+        rl = target._rl
+        return _knowledge_structures(target.kb) + [
+            ("q_table", rl._q_table if rl is not None else None),
+            ("suggestions", target.suggestions),
+            ("turn_log", target._turns),
+            ("log_buffer", target.log._pending if target.log is not None else None),
+        ]
+    if isinstance(target, MultiBoardSolver):
+        found = []
+        for b, kb in enumerate(target.boards):
+            found.extend(_knowledge_structures(kb, f"board{b}."))
+        return found
+    if isinstance(target, WordleKnowledge):
+        return _knowledge_structures(target)
+    if isinstance(target, WordleHelper):
+        return [
+            ("all_words", target.all_words),
+            ("all_codes", target.all_codes),
+            ("word_of_code", target._word_of),
+            ("possible_codes", target.possible_codes),
+            ("possible_words", target._possible_words),
+            ("allowed_words", target.allowed_words),
+        ]
+    if isinstance(target, WordleAI):
+        return [("helper." + name, obj) for name, obj in structures(target.helper)] + [
+            ("best_starters", target.best_starters),
+            ("guess_history", target.guess_history),
+            ("feedback_history", target.feedback_history),
+        ]
+    raise TypeError(f"No memory layout for {type(target).__name__}")
+
+
+def _count(obj) -> Optional[int]:
+    """Elements in a structure: words, entries, or cached rows for a PatternIndex"""
+    if hasattr(obj, "_rows"):
+        return len(obj._rows)
+    return len(obj) if hasattr(obj, "__len__") else None
+
+
+def memory_report(target, previous: Optional[dict] = None) -> dict:
+    """Structured memory report for target (see the module docstring)"""
+    shared_ids = _shared_ids()
+    seen = set()
+    report = {"target": type(target).__name__, "total_bytes": 0, "session_bytes": 0, "structures": {}}
+    for name, obj in structures(target):
+        size = deep_sizeof(obj, seen)
+        shared = id(obj) in shared_ids
+        entry = {
+            "bytes": size,
+            "count": _count(obj),
+            "shared": shared,
+            "growth": None,
+        }
+        if previous is not None:
+            before = previous["structures"].get(name)
+            entry["growth"] = size - (before["bytes"] if before else 0)
+        report["structures"][name] = entry
+        report["total_bytes"] += size
+        if not shared:
+            report["session_bytes"] += size
+    return report
+
+
+def format_report(report: dict) -> str:
+    """Fixed-width table of a memory_report"""
+    lines = [f"{report['target']}: {report['total_bytes'] / 1024:,.1f} KB total, "
+             f"{report['session_bytes'] / 1024:,.1f} KB per session",
+             f"{'structure':24s} {'KB':>10s} {'count':>8s} {'growth KB':>10s}"]
+    for name, entry in report["structures"].items():
+        count = "" if entry["count"] is None else f"{entry['count']:,}"
+        growth = "" if entry["growth"] is None else f"{entry['growth'] / 1024:+,.1f}"
+        marker = " (shared)" if entry["shared"] else ""
+        lines.append(f"{name:24s} {entry['bytes'] / 1024:10,.1f} {count:>8s} {growth:>10s}{marker}")
+    return "\n".join(lines)
+
+
+def play_games(solver, games: int, seed: int = 0) -> None:
+    """Engine Mode games against random answers"""
+    rng = random.Random(seed)
+    answers = list(solver.kb.answers)
+    for _ in range(games):
+        solver.start_game(answer=rng.choice(answers))
+        while not solver.game_over:
+            solver.last_guess = solver.get_guess()
+            solver.submit_feedback("")
+
+
+def load_shared_state(length: int = 5) -> None:
+    """
+    Build everything sessions share, so a measurement only sees the session:
+    the word lists (and their Lexicon text and index), the answer set and the
+    shared RLAgent's Q-table.
+    """
+    from indexes import answer_set, word_lists  # Localized!
+    from lexicon import Lexicon
+    from rl_agent import shared_agent
+
+    for words in word_lists(length):
+        if isinstance(words, Lexicon):
+            words.text, words.index
+    answer_set(length)
+    shared_agent().q_table
+
+
+def session_memory(games: int = 3, seed: int = 0) -> Dict[str, int]:
+    """
+    tracemalloc-measured memory of one solver session: shared state is
+    loaded first (load_shared_state), then a fresh solver plays `games` games.
+    Returns {"retained_bytes", "peak_bytes"} relative to before the session.
+    """
+    from solver import WordleSolver  # Localized!
+
+    load_shared_state()
+    tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        solver = WordleSolver(learn=False)
+        play_games(solver, games, seed)
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del solver
+    return {"retained_bytes": retained - base, "peak_bytes": peak - base}
+
+
+def check_session_budget(budget: int = SESSION_MEMORY_BUDGET, games: int = 3, seed: int = 0) -> Tuple[bool, dict]:
+    """(within budget, session_memory result)"""
+    usage = session_memory(games, seed)
+    return usage["retained_bytes"] <= budget, usage
+
+
+def _build_target(kind: str):
+    from lexicon import load_words  # Localized!
+    from config import GUESSABLE_PATH
+
+    if kind == "solver":
+        from solver import WordleSolver
+        return WordleSolver(learn=False)
+    words = load_words(GUESSABLE_PATH, 5)
+    if kind == "helper":
+        from WordleHelper import WordleHelper
+        return WordleHelper(words)
+    from WordleAI import WordleAI
+    return WordleAI(words, "frequency")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memory footprint of solvers, helpers and AIs")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("report", help="structure-by-structure report, before and after some games")
+    p.add_argument("--target", choices=["solver", "helper", "ai"], default="solver")
+    p.add_argument("--games", type=int, default=3)
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--json", action="store_true", help="print the report dict as JSON")
+
+    p = sub.add_parser("check", help="fail if a solver session retains more than the budget")
+    p.add_argument("--budget-kb", type=float, default=SESSION_MEMORY_BUDGET / 1024)
+    p.add_argument("--games", type=int, default=3)
+    p.add_argument("--seed", type=int, default=0)
+
+    args = parser.parse_args()
+
+    if args.command == "report":
+        target = _build_target(args.target)
+        if args.target == "solver":
+            target.warm_up()
+            before = memory_report(target)
+            play_games(target, args.games, args.seed)
+        else:
+            from wordle_copy import WordleGame
+            from WordleAI import WordleTrainer
+            ai = target if args.target == "ai" else None
+            before = memory_report(target)
+            if ai is not None:
+                trainer = WordleTrainer(ai.helper.all_words)
+                trainer.train(ai, args.games, seed=args.seed)
+            else:
+                game = WordleGame(target.all_words)
+                game.reset(random.Random(args.seed).choice(game.word_list))
+                success, feedback = game.make_guess(target.get_best_guess())
+                if success:
+                    target.filter_words(game.attempts[-1], feedback)
+        report = memory_report(target, previous=before)
+        print(json.dumps(report, indent=2) if args.json else format_report(report))
+
+    elif args.command == "check":
+        ok, usage = check_session_budget(int(args.budget_kb * 1024), args.games, args.seed)
+        print(f"solver session: {usage['retained_bytes'] / 1024:,.1f} KB retained, "
+              f"{usage['peak_bytes'] / 1024:,.1f} KB peak, budget {args.budget_kb:,.1f} KB: "
+              f"{'OK' if ok else 'OVER BUDGET'}")
+        sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
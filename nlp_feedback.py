@@ -1,9 +1,9 @@
 import re
 
 
-def parse_feedback(text: str) -> str:
+def parse_feedback(text: str, length: int = 5) -> str:
     text = text.upper().strip()
-    if re.match(r'^[GYB]{5}$', text):
+    if len(text) == length and re.match(r'^[GYB]+$', text):
         return text
 
     # Full sanitization mapping for robustness
@@ -12,10 +12,10 @@ def parse_feedback(text: str) -> str:
     # Filter out spaces and map remaining characters
     filtered_text = "".join(mapping.get(c, 'B') for c in text if c != ' ')
 
-    # Ensure the string is exactly 5 characters long
-    sanitized = filtered_text[:5].ljust(5, 'B')
+    # Ensure the string is exactly `length` characters long
+    sanitized = filtered_text[:length].ljust(length, 'B')
 
-    if len(sanitized) != 5 or not re.match(r'^[GYB]{5}$', sanitized):
-        raise ValueError(f"Invalid feedback '{text}'. Use exactly 5 chars: G (green), Y (yellow), B (gray).")
+    if len(sanitized) != length or not re.match(r'^[GYB]+$', sanitized):
+        raise ValueError(f"Invalid feedback '{text}'. Use exactly {length} chars: G (green), Y (yellow), B (gray).")
 
     return sanitized
\ No newline at end of file
@@ -0,0 +1,210 @@
+# packed.py
+"""
+Words packed into integers: 5 bits per letter (A=0 ... Z=25), first letter
+in the highest field, so a 5-letter word is a 25-bit int and integer order
+is alphabetical order. Hashing, set membership and equality become int
+operations, and a word costs one small int instead of a str.
+
+Checks work on whole words with bit operations and small lookup tables:
+    - greens: one mask compare (code & mask == value)
+    - letters present / absent: a 26-bit letter mask, looked up per 3-letter
+      chunk of the code (a 32768-entry table, shared by every length)
+    - "not this letter here" and exact letter counts: XOR against a word with
+      the letter in every field leaves a zero field where it occurs, and
+      zero_fields() flags those fields in one expression
+"""
+
+from functools import lru_cache
+from typing import Iterable, List, Sequence
+
+from feedback import compile_constraints, decode_pattern
+
+BITS = 5
+FIELD = (1 << BITS) - 1
+CHUNK = 3  # fields per letter-mask lookup
+_A = ord('A')
+
+
+def encode_word(word: str) -> int:
+    """'CRANE' -> packed int (uppercase A-Z only)"""
+    code = 0
+    for ch in word.encode('ascii'):
+        code = (code << BITS) | (ch - _A)
+    return code
+
+
+def decode_word(code: int, length: int = 5) -> str:
+    """Inverse of encode_word"""
+    return bytes(((code >> (BITS * (length - 1 - i))) & FIELD) + _A for i in range(length)).decode('ascii')
+
+
+def encode_words(words: Sequence[str]) -> List[int]:
+    return [encode_word(w) for w in words]
+
+
+@lru_cache(maxsize=None)
+def _masks(length: int):
+    """(low, high, shifts): 0b01111 and 0b10000 in every field, and each position's shift"""
+    low = high = 0
+    for _ in range(length):
+        low = (low << BITS) | 0b01111
+        high = (high << BITS) | 0b10000
+    return low, high, [BITS * (length - 1 - i) for i in range(length)]
+
+
+@lru_cache(maxsize=None)
+def _repeated(letter: int, length: int) -> int:
+    """`letter` in every field"""
+    code = 0
+    for _ in range(length):
+        code = (code << BITS) | letter
+    return code
+
+
+@lru_cache(maxsize=None)
+def _letter_table(fields: int) -> List[int]:
+    """Packed chunk of `fields` letters -> mask with bit L set for each letter L in it"""
+    table = [0]
+    for _ in range(fields):
+        table = [mask | (1 << f if f < 26 else 0) for mask in table for f in range(1 << BITS)]
+    return table
+
+
+_T3, _T2 = _letter_table(3), _letter_table(2)  # the two chunks of a 5-letter word
+
+
+@lru_cache(maxsize=None)
+def _chunks(length: int):
+    """(shift, field mask, table) per chunk of up to CHUNK letters"""
+    chunks = []
+    for start in range(0, length, CHUNK):
+        fields = min(CHUNK, length - start)
+        chunks.append((BITS * start, (1 << BITS * fields) - 1, _letter_table(fields)))
+    return chunks
+
+
+def letter_mask(code: int, length: int = 5) -> int:
+    """Bit L set for each letter L (0-25) in a packed word"""
+    mask = 0
+    for shift, fields, table in _chunks(length):
+        mask |= table[(code >> shift) & fields]
+    return mask
+
+
+def letter_bits(letters: Iterable[str]) -> int:
+    """letter_mask of a set of letters"""
+    mask = 0
+    for letter in letters:
+        mask |= 1 << (ord(letter) - _A)
+    return mask
+
+
+def zero_fields(x: int, length: int = 5) -> int:
+    """High bit of every field of x that is zero (no carries cross fields)"""
+    low, high, _ = _masks(length)
+    return ~(((x & low) + low) | x | low) & high
+
+
+def count_letter(code: int, letter: int, length: int = 5) -> int:
+    """Copies of letter (0-25) in a packed word"""
+    return zero_fields(code ^ _repeated(letter, length), length).bit_count()
+
+
+@lru_cache(maxsize=16384)
+def _guess_profile(guess: int, length: int):
+    """(shift, letter, letter bit) per position, and whether no letter repeats"""
+    _, _, shifts = _masks(length)
+    positions = [(shift, (guess >> shift) & FIELD) for shift in shifts]
+    profile = [(shift, letter, 1 << letter) for shift, letter in positions]
+    return profile, len({letter for _, letter in positions}) == length
+
+
+def packed_feedback(guess: int, answer: int, length: int = 5) -> int:
+    """
+    encode_pattern(feedback_pattern(guess, answer)) on packed words.
+    Greens are the zero fields of guess ^ answer. Without repeated guess
+    letters a non-green letter is yellow exactly when the answer's letter mask
+    has it; otherwise it is yellow while the answer has unmatched (non-green)
+    copies left, left to right.
+    """
+    low, high, _ = _masks(length)
+    x = guess ^ answer
+    greens = ~(((x & low) + low) | x | low) & high
+    profile, unique = _guess_profile(guess, length)
+    code = 0
+    if unique:
+        if length == 5:
+            present = _T3[answer & 0x7FFF] | _T2[answer >> 15]
+        else:
+            present = letter_mask(answer, length)
+        for shift, _, bit in profile:
+            code = code * 3 + (2 if greens >> shift & 0b10000 else 1 if present & bit else 0)
+        return code
+
+    unmatched = {}
+    for shift, letter, _ in profile:
+        code *= 3
+        if greens >> shift & 0b10000:
+            code += 2
+            continue
+        left = unmatched.get(letter)
+        if left is None:
+            left = (zero_fields(answer ^ _repeated(letter, length), length) & ~greens).bit_count()
+        if left:
+            code += 1
+            left -= 1
+        unmatched[letter] = left
+    return code
+
+
+def packed_pattern(guess: int, answer: int, length: int = 5) -> str:
+    """feedback_pattern(decode_word(guess), decode_word(answer)) as a 'GYB' string"""
+    return decode_pattern(packed_feedback(guess, answer, length), length)
+
+
+def filter_packed(codes: Iterable[int], guess: str, pattern: str, length: int = 5) -> List[int]:
+    """
+    feedback.filter_consistent on packed words (same result, same order).
+    The compiled constraints are applied in passes, cheapest first: greens,
+    then letters required/absent via the letter mask, then misplaced letters,
+    then the counts a mask can't express (two or more copies, or an exact count).
+    """
+    constraints = compile_constraints(guess, pattern)
+    if constraints is None:
+        return []
+    greens, misplaced, counts = constraints
+    low, high, shifts = _masks(length)
+    codes = list(codes)
+
+    if greens:
+        green_mask = green_value = 0
+        for i, letter in greens:
+            green_mask |= FIELD << shifts[i]
+            green_value |= (ord(letter) - _A) << shifts[i]
+        codes = [c for c in codes if c & green_mask == green_value]
+
+    absent = letter_bits(letter for letter, n, exact in counts if exact and n == 0)
+    required = letter_bits(letter for letter, n, exact in counts if n > 0)
+    if absent or required:
+        if length == 5:
+            # Two lookups: the low three letters and the high two
+            codes = [c for c in codes
+                     if not (m := _T3[c & 0x7FFF] | _T2[c >> 15]) & absent and m & required == required]
+        else:
+            codes = [c for c in codes
+                     if not (m := letter_mask(c, length)) & absent and m & required == required]
+
+    if misplaced:
+        banned_value = banned_high = 0
+        for i, letter in misplaced:
+            banned_value |= (ord(letter) - _A) << shifts[i]
+            banned_high |= 0b10000 << shifts[i]
+        codes = [c for c in codes if not ~((((x := c ^ banned_value) & low) + low) | x | low) & banned_high]
+
+    for letter, n, exact in counts:
+        if n > 1 or (exact and n > 0):
+            repeated = _repeated(ord(letter) - _A, length)
+            codes = [c for c in codes
+                     if (k := (~((((x := c ^ repeated) & low) + low) | x | low) & high).bit_count()) >= n
+                     and (not exact or k == n)]
+    return codes
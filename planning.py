@@ -1,12 +1,77 @@
 # planning.py
+from config import (APPROX_RESCORE, APPROX_SAMPLE, APPROX_SEED, DEDUP_GUESSES, ENTROPY_KERNEL,
+                    HYBRID_PREFILTER, SUGGESTIONS, WORD_LENGTH)
+
+
 class Planner:
     def __init__(self, knowledge):
         self.kb = knowledge
+        # (word, entropy, expected_remaining, p_answer), best first, from the last plan
+        self.suggestions = []
+        # False if the last plan hit its deadline before scoring every word
+        self.complete = True
 
-    def plan_next_guess(self) -> str:
-        from search import best_guess  # Localized!
-
+    def plan_next_guess(self, deadline: float = None) -> str:
+        """
+        Best guess for the current knowledge. With a deadline (a time.monotonic()
+        instant) the best word found by then is returned and self.complete says
+        whether the search finished.
+        """
+        self.suggestions = []
+        self.complete = True
         if not self.kb or not self.kb.possible:
-            return "SLATE"
+            return self.opener()
+        if len(self.kb.possible) <= 2:
+            return next(iter(self.kb.possible))
+
+        # The alternatives come out of the same pass that picks the guess
+        self.suggestions, self.complete = self.top_guesses(SUGGESTIONS, deadline)
+        return self.suggestions[0][0]
+
+    def top_guesses(self, k: int = SUGGESTIONS, deadline: float = None):
+        """
+        The k best guesses as (word, entropy, expected_remaining, p_answer) tuples,
+        plus whether the search completed before the deadline: (top, complete)
+        """
+        from search import (anytime_top_guesses, approx_top_guesses, hybrid_top_guesses,  # Localized!
+                            partition_representatives, top_guesses)
+
+        # kb.allowed is the whole guessable list, or the hard-mode legal subset
+        possible, allowed = self.kb.possible, self.kb.allowed
+        if DEDUP_GUESSES:
+            # One guess per partition of the candidates: the rest would score the same
+            allowed = partition_representatives(possible, allowed, deadline)
+        if APPROX_SAMPLE and len(possible) > APPROX_SAMPLE and deadline is None:
+            return approx_top_guesses(possible, allowed, k, APPROX_SAMPLE, APPROX_RESCORE, APPROX_SEED), True
+        if HYBRID_PREFILTER and deadline is None:
+            return hybrid_top_guesses(possible, allowed, k, HYBRID_PREFILTER), True
+        if ENTROPY_KERNEL == "vector" and self.kb.word_length <= 5:
+            from vectorized import WordArrays  # Localized!
+            arrays = WordArrays(possible)
+            if deadline is None:
+                return arrays.top_guesses(allowed, k), True
+            return anytime_top_guesses(possible, allowed, k, deadline,
+                                       score=lambda w, _: arrays.score(w))
+        if ENTROPY_KERNEL == "index":
+            index = self.kb.pattern_index
+            if deadline is None:
+                return index.top_guesses(possible, allowed, k), True
+            ids = index.ids(possible)
+            return anytime_top_guesses(possible, allowed, k, deadline,
+                                       score=lambda w, _: index.score(w, ids))
+        if deadline is None:
+            return top_guesses(possible, allowed, k), True
+        return anytime_top_guesses(possible, allowed, k, deadline)
+
+    def opener(self) -> str:
+        from indexes import opener  # Localized!
+        return opener(self.kb.word_length if self.kb else WORD_LENGTH)
+
+    def plan_joint_guess(self, boards) -> str:
+        """Best shared guess for several boards (WordleKnowledge each); solved boards are skipped"""
+        from search import best_joint_guess  # Localized!
 
-        return best_guess(self.kb.possible, self.kb.guessable)
\ No newline at end of file
+        candidates = [kb.possible for kb in boards if not kb.solved]
+        if not candidates:
+            return self.opener()
+        return best_joint_guess(candidates, self.kb.guessable)
\ No newline at end of file
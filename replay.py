@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+replay.py - Re-run logged games against the current planner
+Run: python replay.py games.jsonl --workers 4
+
+Each game recorded by WordleSolver(log=GameLog(...)) is replayed turn by turn:
+the logged guesses and patterns rebuild the candidate set, and every
+deterministic decision ("opener" and "planner" turns) is made again by the
+current code, in the game's mode (hard or normal) and under the latency
+budget each turn had. Reported:
+    - changed: turns where the current code picks a different guess
+    - slower:  turns where it takes longer than the logged time, beyond the tolerance
+RL and endgame turns are random by design, so they are replayed but not
+compared; nor are searches that stopped at their budget (logged or replayed),
+since how far those got depends on the machine's load.
+Exits with status 1 if any guess changed, so it can gate a search optimization.
+"""
+
+import argparse
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+
+from config import WORD_LENGTH
+from gamelog import read_games
+from indexes import word_lists
+from knowledge import WordleKnowledge
+from planning import Planner
+
+COMPARED_SOURCES = ("opener", "planner")
+
+
+def _init_worker():
+    word_lists(WORD_LENGTH)  # other lengths load on first use
+
+
+def replay_game(index: int, game: dict, slower_pct: float = 25.0, slower_ms: float = 5.0) -> dict:
+    """
+    Replay one logged game; returns {"game", "compared", "cut_short", "changed": [...], "slower": [...]}
+    A turn counts as slower when it takes slower_pct percent and slower_ms
+    milliseconds longer than logged (both, so timer noise on fast turns is ignored).
+    """
+    length = len(game["turns"][0]["guess"]) if game["turns"] else WORD_LENGTH
+    answers, guessable = word_lists(length)
+    kb = WordleKnowledge(answers=answers, guessable=guessable, hard_mode=game.get("hard_mode", False))
+    planner = Planner(kb)
+
+    report = {"game": index, "answer": game.get("answer"), "compared": 0, "cut_short": 0,
+              "changed": [], "slower": []}
+    for turn, step in enumerate(game["turns"]):
+        if step["source"] in COMPARED_SOURCES:
+            start = time.perf_counter()
+            if step["source"] == "opener":
+                guess, complete = planner.opener(), True
+            else:
+                deadline_ms = step.get("deadline_ms")
+                deadline = time.monotonic() + deadline_ms / 1000 if deadline_ms is not None else None
+                guess = planner.plan_next_guess(deadline)
+                complete = planner.complete and step.get("complete", True)
+            ms = (time.perf_counter() - start) * 1000
+
+            if not complete:
+                report["cut_short"] += 1
+            else:
+                report["compared"] += 1
+                if guess != step["guess"]:
+                    report["changed"].append({"turn": turn + 1, "logged": step["guess"], "replayed": guess})
+            logged_ms = step.get("ms")
+            if (logged_ms is not None and ms > logged_ms * (1 + slower_pct / 100)
+                    and ms - logged_ms > slower_ms):
+                report["slower"].append({"turn": turn + 1, "logged_ms": logged_ms, "replayed_ms": round(ms, 3)})
+
+        kb.apply_feedback(step["guess"], step["pattern"])
+    return report
+
+
+def _replay_job(job):
+    return replay_game(*job)
+
+
+def replay_log(path: str, workers: int = 1, slower_pct: float = 25.0, slower_ms: float = 5.0,
+               limit: Optional[int] = None) -> List[dict]:
+    """Replay every game in the log (the first `limit` if given), in log order"""
+    jobs = []
+    for i, game in enumerate(read_games(path)):
+        if limit is not None and i >= limit:
+            break
+        jobs.append((i, game, slower_pct, slower_ms))
+
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            return list(pool.map(_replay_job, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
+    return [_replay_job(job) for job in jobs]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay logged games against the current planner")
+    parser.add_argument("log", help="JSONL game log written by WordleSolver")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--limit", type=int, default=None, help="only replay the first N games")
+    parser.add_argument("--slower-pct", type=float, default=25.0,
+                        help="report turns this many percent slower than logged")
+    parser.add_argument("--slower-ms", type=float, default=5.0,
+                        help="...and at least this many ms slower")
+    args = parser.parse_args()
+
+    reports = replay_log(args.log, args.workers, args.slower_pct, args.slower_ms, args.limit)
+
+    compared = cut_short = changed = slower = 0
+    for r in reports:
+        compared += r["compared"]
+        cut_short += r["cut_short"]
+        for c in r["changed"]:
+            changed += 1
+            print(f"CHANGED game {r['game']} ({r['answer']}) turn {c['turn']}: "
+                  f"{c['logged']} -> {c['replayed']}")
+        for s in r["slower"]:
+            slower += 1
+            print(f"SLOWER  game {r['game']} ({r['answer']}) turn {s['turn']}: "
+                  f"{s['logged_ms']:.1f} ms -> {s['replayed_ms']:.1f} ms")
+
+    print(f"\nReplayed {len(reports)} games, {compared} decisions compared: "
+          f"{changed} changed, {slower} slower ({cut_short} stopped at their deadline, not compared)")
+    sys.exit(1 if changed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# results_view.py
+"""
+Paged rendering of candidate word lists for the Tk GUIs.
+
+Only the visible page is materialized, and it is written to the text widget
+with a single insert, so redraw cost does not depend on how many words match.
+"""
+
+from typing import Callable, Sequence
+
+
+def format_page(words: Sequence[str], words_per_line: int, column_width: int = 5,
+                separator: str = ' ') -> str:
+    """Build the text for a page of words in one string"""
+    lines = []
+    for start in range(0, len(words), words_per_line):
+        chunk = words[start:start + words_per_line]
+        lines.append(separator.join(word.ljust(column_width) for word in chunk))
+    return '\n'.join(lines)
+
+
+class PagedResults:
+    """
+    Virtualized view of a word list on top of a (Scrolled)Text widget
+    """
+
+    def __init__(self, text_widget, words_per_line: int = 8, lines_per_page: int = 50,
+                 column_width: int = 5, separator: str = ' ',
+                 on_page_change: Callable[[str], None] = None):
+        """
+        Args:
+            text_widget: Tk Text/ScrolledText the page is rendered into
+            words_per_line: Number of words on each line
+            lines_per_page: Number of lines materialized at once
+            column_width: Width each word is padded to
+            separator: Text placed between words on a line
+            on_page_change: Called with a "Page x of y" description after each render
+        """
+        self.text = text_widget
+        self.words_per_line = words_per_line
+        self.page_size = words_per_line * lines_per_page
+        self.column_width = column_width
+        self.separator = separator
+        self.on_page_change = on_page_change
+
+        self.words: Sequence[str] = []
+        self.page = 0
+
+    @property
+    def page_count(self) -> int:
+        return max(1, -(-len(self.words) // self.page_size))
+
+    def show(self, words: Sequence[str]):
+        """Display a new word list, starting from the first page"""
+        self.words = words
+        self.page = 0
+        self.render()
+
+    def show_message(self, message: str):
+        """Replace the results with a plain message"""
+        self.words = []
+        self.page = 0
+        self._replace(message)
+        self._notify("")
+
+    def next_page(self):
+        if self.page + 1 < self.page_count:
+            self.page += 1
+            self.render()
+
+    def prev_page(self):
+        if self.page > 0:
+            self.page -= 1
+            self.render()
+
+    def render(self):
+        """Render the current page with a single insert"""
+        start = self.page * self.page_size
+        visible = self.words[start:start + self.page_size]
+        self._replace(format_page(visible, self.words_per_line, self.column_width, self.separator))
+        self._notify(f"Page {self.page + 1} of {self.page_count}")
+
+    def _replace(self, content: str):
+        self.text.delete("1.0", "end")
+        self.text.insert("end", content)
+
+    def _notify(self, description: str):
+        if self.on_page_change:
+            self.on_page_change(description)
@@ -1,30 +1,83 @@
-import random
 import json
+import os
+import queue
+import random
+import threading
+from pathlib import Path
 from typing import Dict
-from config import ALPHA, GAMMA, EPSILON
+from config import ALPHA, GAMMA, EPSILON, Q_TABLE_PATH
 
 class RLAgent:
-    def __init__(self):
-        self.q_table: Dict[str, float] = {}
-        try:
-            with open('q_table.json', 'r') as f:
-                self.q_table = json.load(f)
-        except FileNotFoundError:
-            pass
+    """
+    Q-table policy, safe to share between solver sessions on different threads.
+
+    Reads (choose_action) are plain dict lookups and need no lock. Updates go
+    through a queue: update() enqueues, and whichever thread finds the apply
+    lock free drains the queue, so concurrent sessions never block on each
+    other and the table has a single writer at a time. An update left queued
+    while another thread was draining is applied by the next update(),
+    flush() or save().
+    """
+
+    def __init__(self, path=Q_TABLE_PATH):
+        self.path = Path(path)
+        # Parsed on first use; q_table.json can be large and most turns never need it
+        self._q_table: Dict[str, float] = None
+        self._load_lock = threading.Lock()
+        self._apply_lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._pending = queue.SimpleQueue()  # (state, action, reward, next_state)
+
+    @property
+    def q_table(self) -> Dict[str, float]:
+        if self._q_table is None:
+            with self._load_lock:
+                if self._q_table is None:
+                    try:
+                        with open(self.path, 'r') as f:
+                            self._q_table = json.load(f)
+                    except FileNotFoundError:
+                        self._q_table = {}
+        return self._q_table
 
     def _state_key(self, possible_count: int, turn: int) -> str:
         bucket = min(possible_count // 50, 20)
         return f"{bucket}_{turn}"
 
-    def choose_action(self, candidates: set, turn: int) -> str:
+    def choose_action(self, candidates: set, turn: int, rng: random.Random = None) -> str:
+        """rng: the session's own generator (the random module if None)"""
+        rng = rng or random
         state = self._state_key(len(candidates), turn)
-        if random.random() < EPSILON:
-            return random.choice(list(candidates))
-        q_vals = {w: self.q_table.get(f"{state}_{w}", 0) for w in candidates}
-        if not q_vals: return random.choice(list(candidates))
+        # Sorted, so choices and ties don't depend on set order (PYTHONHASHSEED)
+        words = sorted(candidates)
+        if rng.random() < EPSILON:
+            return rng.choice(words)
+        q_vals = {w: self.q_table.get(f"{state}_{w}", 0) for w in words}
+        if not q_vals: return rng.choice(words)
         return max(q_vals, key=q_vals.get)
 
     def update(self, state: str, action: str, reward: float, next_state: str):
+        self._pending.put((state, action, reward, next_state))
+        self._drain(block=False)
+
+    def flush(self):
+        """Apply every queued update now"""
+        self._drain(block=True)
+
+    def _drain(self, block: bool):
+        if not self._apply_lock.acquire(blocking=block):
+            return  # another thread is applying; it picks up this update too
+        try:
+            while True:
+                try:
+                    update = self._pending.get_nowait()
+                except queue.Empty:
+                    break
+                self._apply(*update)
+        finally:
+            self._apply_lock.release()
+
+    def _apply(self, state: str, action: str, reward: float, next_state: str):
         old = self.q_table.get(f"{state}_{action}", 0.0)
 
         # SAFEST FIX: if no future values exist, use 0
@@ -36,6 +89,34 @@ class RLAgent:
 
         self.q_table[f"{state}_{action}"] = old + ALPHA * (reward + GAMMA * future - old)
 
-    def save(self, path="q_table.json"):
-        with open(path, 'w') as f:
-            json.dump(self.q_table, f)
\ No newline at end of file
+    def save(self, path=None):
+        """Write the table (after applying queued updates) atomically, to self.path by default"""
+        path = Path(path) if path is not None else self.path
+        with self._apply_lock:
+            while True:
+                try:
+                    self._apply(*self._pending.get_nowait())
+                except queue.Empty:
+                    break
+            table = dict(self.q_table)  # consistent copy: no writer while the lock is held
+        with self._save_lock:
+            tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp, 'w') as f:
+                json.dump(table, f)
+            os.replace(tmp, path)
+
+
+_shared: Dict[Path, RLAgent] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_agent(path=Q_TABLE_PATH) -> RLAgent:
+    """The process-wide RLAgent for a Q-table file, so sessions share one table"""
+    path = Path(path)
+    agent = _shared.get(path)
+    if agent is None:
+        with _shared_lock:
+            agent = _shared.get(path)
+            if agent is None:
+                agent = _shared[path] = RLAgent(path)
+    return agent
\ No newline at end of file
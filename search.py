@@ -1,30 +1,275 @@
-from typing import Set
-from collections import Counter
+from typing import Iterable, List, Sequence, Set, Tuple
+from collections import Counter, defaultdict
+import heapq
 import math
+import random
+import time
 
-def feedback_pattern(guess: str, answer: str) -> str:
-    result = ['B'] * 5
-    a_count = Counter(answer)
-    # 1. Greens
-    for i in range(5):
-        if guess[i] == answer[i]:
-            result[i] = 'G'
-            a_count[guess[i]] -= 1
-    # 2. Yellows
-    for i in range(5):
-        if result[i] != 'G' and guess[i] in a_count and a_count[guess[i]] > 0:
-            result[i] = 'Y'
-            a_count[guess[i]] -= 1
-    return ''.join(result)
+from config import DEDUP_GUESSES
+from feedback import feedback_pattern, feedback_row
 
 def entropy(word: str, candidates: Set[str]) -> float:
     patterns = Counter(feedback_pattern(word, c) for c in candidates)
     total = len(candidates)
     if total == 0:
         return 0.0
-    return -sum((count / total * math.log2(count / total) for count in patterns.values() if count > 0))
+    # Summed in sorted order: the float result must not depend on the set's
+    # iteration order, or equally good guesses tie-break differently per process
+    return -sum((count / total * math.log2(count / total) for count in sorted(patterns.values()) if count > 0))
+
+def score_guess(word: str, candidates: Set[str]) -> Tuple[float, float]:
+    """(entropy, expected number of candidates left) for guessing `word`, from one pattern count"""
+    patterns = Counter(feedback_pattern(word, c) for c in candidates)
+    total = len(candidates)
+    if total == 0:
+        return 0.0, 0.0
+    counts = sorted(patterns.values())
+    # Same arithmetic as entropy(), so rankings agree with best_guess exactly
+    ent = -sum((count / total * math.log2(count / total) for count in counts if count > 0))
+    return ent, sum(count * count for count in counts) / total
+
+
+def top_guesses(candidates: Set[str], guessable: list, k: int = 5) -> List[Tuple[str, float, float, float]]:
+    """
+    The k most informative guesses, best first, as
+    (word, entropy, expected_remaining, p_answer) tuples.
+
+    Selected with a k-sized heap rather than a full sort; ties keep guessable
+    order, so the first entry is always best_guess()'s choice.
+    """
+    if not candidates:
+        return []
+    return select_top(candidates, guessable, range(len(guessable)), k)
+
+
+def select_top(candidates: Set[str], guessable: list, indices: Iterable[int], k: int = 5,
+               score=score_guess) -> List[Tuple[str, float, float, float]]:
+    """
+    Score guessable[i] for each i in indices and keep the k best (one k-sized
+    heap, streamed), as top_guesses() tuples, best first. Equal entropies
+    rank the lower index first, i.e. guessable order. `score(word,
+    candidates)` -> (entropy, expected_remaining) may be another kernel.
+    """
+    total = len(candidates)
+    scored = (((ent, -i), guessable[i], remaining)
+              for i in indices for ent, remaining in (score(guessable[i], candidates),))
+    return [(w, key[0], remaining, 1 / total if w in candidates else 0.0)
+            for key, w, remaining in heapq.nlargest(k, scored)]
+
+
+def stratified_sample(candidates: Set[str], size: int, rng: random.Random) -> List[Tuple[str, float]]:
+    """
+    About `size` candidates as (word, weight) pairs, stratified by first letter
+    with proportional allocation (at least one word per stratum). A word's
+    weight is how many candidates it stands for, so weights sum to len(candidates).
+    Candidates are sorted first, so the sample depends only on the set and the rng.
+    """
+    strata = defaultdict(list)
+    for w in sorted(candidates):
+        strata[w[0]].append(w)
+    total = len(candidates)
+    sample = []
+    for letter in sorted(strata):
+        words = strata[letter]
+        take = min(len(words), max(1, round(size * len(words) / total)))
+        weight = len(words) / take
+        sample.extend((w, weight) for w in rng.sample(words, take))
+    return sample
+
+
+def approx_top_guesses(candidates: Set[str], guessable: list, k: int = 5, sample_size: int = 256,
+                       rescore: int = 32, seed: int = 0) -> List[Tuple[str, float, float, float]]:
+    """
+    top_guesses() for large candidate sets: every guess is first ranked by the
+    entropy of its patterns over a stratified sample of `sample_size`
+    candidates (seeded, so reproducible), then the `rescore` best are scored
+    exactly and the k best of those returned. Sets no larger than the sample
+    are scored exactly.
+
+    Error bound: the returned entropies are exact, and the pick is the exact
+    best among the rescored contenders, so the only loss is a better word
+    ranked below `rescore` by its estimate. For m sampled words and at most K
+    patterns (3**word_length), the plug-in estimate Ĥ of a guess's entropy H
+    obeys 0 <= H - E[Ĥ] <= log2(1 + (K - 1) / m), the same bias for every
+    guess to first order, and sd(Ĥ) <= log2(m) / sqrt(m) (about 0.5 bits at
+    m=256). Sampling without replacement within strata only reduces the
+    spread. bench.py approx measures the resulting loss.
+    """
+    total = len(candidates)
+    if total <= sample_size:
+        return top_guesses(candidates, guessable, k)
+
+    sample = stratified_sample(candidates, sample_size, random.Random(seed))
+    words = [w for w, _ in sample]
+    weights = [weight for _, weight in sample]
+
+    def estimate(item):
+        counts = defaultdict(float)
+        for pattern, weight in zip(feedback_row(item[1], words), weights):
+            counts[pattern] += weight
+        return -sum(c / total * math.log2(c / total) for c in counts.values())
+
+    contenders = heapq.nlargest(max(k, rescore), enumerate(guessable), key=estimate)
+    return select_top(candidates, guessable, (i for i, _ in contenders), k)
+
+
+def partition_representatives(candidates: Set[str], guessable: list, deadline: float = None) -> list:
+    """
+    guessable with partition-equivalent guesses collapsed, in guessable order.
+    A letter no candidate contains can only ever be grey, so two guesses that
+    differ only in such letters split the candidates identically. The
+    signature blanks those letters and the first word of each class (in
+    guessable order, so ties still resolve like best_guess) represents it.
+    Candidates contain only live letters, so each represents itself.
+    If `deadline` (a time.monotonic() instant) passes, the words not yet
+    checked are kept as they are, so the pass never costs the search its budget.
+    """
+    live = set().union(*map(set, candidates)) if candidates else set()
+    dead = set().union(*map(set, guessable)) - live if guessable else set()
+    if not dead:
+        return list(dict.fromkeys(guessable))  # every word is its own class
+    dead = str.maketrans({ch: '.' for ch in dead})
+    seen = set()
+    representatives = []
+    for n, w in enumerate(guessable):
+        if deadline is not None and not n % 512 and n and time.monotonic() >= deadline:
+            return representatives + list(guessable[n:])
+        signature = w.translate(dead)
+        if signature not in seen:
+            seen.add(signature)
+            representatives.append(w)
+    return representatives
+
+
+def heuristic_scores(candidates: Set[str], guessable: list, deadline: float = None) -> List[int]:
+    """
+    Cheap letter-frequency score of every guessable word (WordleHelper.letter_score
+    made split-aware): a letter present in about half of the candidates splits
+    them best, so each distinct letter scores min(words with it, words without
+    it), and each letter-position pair likewise for green matches.
+    If `deadline` (a time.monotonic() instant) passes, only the scores of the
+    words rated so far (a prefix of guessable) are returned.
+    """
+    total = len(candidates)
+    freq, positional = Counter(), Counter()
+    for c in candidates:
+        freq.update(set(c))
+        positional.update(enumerate(c))
+    split = Counter({letter: min(n, total - n) for letter, n in freq.items()})  # 0 for unseen letters
+    green = Counter({key: min(n, total - n) for key, n in positional.items()})
+    scores = []
+    for start in range(0, len(guessable), 1024):
+        if deadline is not None and start and time.monotonic() >= deadline:
+            break
+        scores.extend(sum(map(split.__getitem__, set(w))) + sum(map(green.__getitem__, enumerate(w)))
+                      for w in guessable[start:start + 1024])
+    return scores
+
+
+def hybrid_top_guesses(candidates: Set[str], guessable: list, k: int = 5,
+                       keep: int = 200) -> List[Tuple[str, float, float, float]]:
+    """
+    top_guesses() on a shortlist: guessable is ranked by heuristic_scores() and
+    only the `keep` best are scored exactly. Entropies are exact and ties keep
+    guessable order, so the result differs from top_guesses() only when a
+    better word falls outside the shortlist (bench.py hybrid counts how often).
+    """
+    if not candidates:
+        return []
+    proxy = heuristic_scores(candidates, guessable)
+    shortlist = heapq.nlargest(max(k, keep), range(len(guessable)), key=proxy.__getitem__)
+    return select_top(candidates, guessable, shortlist, k)
+
+
+def promising_order(candidates: Set[str], guessable: list, deadline: float = None) -> List[int]:
+    """
+    Indices into guessable, most promising first by heuristic_scores(). If
+    `deadline` passes while rating, the words not yet rated follow the rated
+    ones in guessable order.
+    """
+    proxy = heuristic_scores(candidates, guessable, deadline)
+    rated = sorted(range(len(proxy)), key=proxy.__getitem__, reverse=True)
+    return rated + list(range(len(proxy), len(guessable)))
+
+
+def anytime_top_guesses(candidates: Set[str], guessable: list, k: int = 5, deadline: float = None,
+                        score=score_guess):
+    """
+    top_guesses() that stops at `deadline` (a time.monotonic() instant).
+
+    Words are scored in promising_order(), keeping a running top-k, so an
+    early stop still returns the best words found so far. The ordering pass
+    also stops at the deadline, and at least one word is always scored, so
+    the deadline is overrun by at most one score. Returns (top list,
+    complete); when complete the list is exactly top_guesses()'s, including
+    its guessable-order tie-breaking.
+    `score(word, candidates)` -> (entropy, expected_remaining) may be swapped
+    for another kernel (e.g. PatternIndex).
+    """
+    if not candidates:
+        return [], True
+
+    complete = True
+
+    def until_deadline(order):
+        nonlocal complete
+        for n, i in enumerate(order):
+            if deadline is not None and n and time.monotonic() >= deadline:
+                complete = False
+                return
+            yield i
+
+    order = promising_order(candidates, guessable, deadline)
+    top = select_top(candidates, guessable, until_deadline(order), k, score)
+    return top, complete
+
+
+def board_membership(boards: Sequence[Set[str]]):
+    """
+    Index the union of several candidate sets.
+    Returns (words, rows): words is the union (each word once), and rows[b]
+    lists the positions in words of board b's candidates.
+    """
+    position = {}
+    rows = [[position.setdefault(c, len(position)) for c in candidates] for candidates in boards]
+    return list(position), rows
+
+
+def joint_entropy(word: str, boards: Sequence[Set[str]], membership=None) -> float:
+    """
+    Sum of entropy(word, board) over all boards, computed in one pass: the
+    patterns of `word` against the union of the boards are computed once
+    (feedback_row) and each board just counts its share of them.
+    Pass board_membership(boards) when scoring many guesses against the same boards.
+    """
+    words, rows = membership or board_membership(boards)
+    patterns = feedback_row(word, words)
+
+    total = 0.0
+    for row in rows:
+        n = len(row)
+        if n:
+            counts = sorted(Counter(map(patterns.__getitem__, row)).values())
+            total += math.log2(n) - sum(c * math.log2(c) for c in counts) / n
+    return total
+
+
+def best_joint_guess(boards: Sequence[Set[str]], guessable: list) -> str:
+    """Guess with the most expected information summed over all (unsolved) boards"""
+    boards = [b for b in boards if b]
+    if not boards:
+        return "NO_CANDIDATE"
+    membership = board_membership(boards)
+    return max(guessable, key=lambda w: joint_entropy(w, boards, membership))
+
 
 def best_guess(candidates: Set[str], guessable: list) -> str:
+    """
+    Most informative guess. For a latency-bounded search, which also reports
+    whether it finished, use anytime_top_guesses() (or Planner.plan_next_guess).
+    """
     if len(candidates) <= 2:
         return list(candidates)[0] if candidates else "NO_CANDIDATE"
+    if DEDUP_GUESSES:
+        guessable = partition_representatives(candidates, guessable)
     return max(guessable, key=lambda w: entropy(w, candidates))
\ No newline at end of file
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+service.py - Local multi-session solver service (HTTP/JSON over asyncio)
+Run: python service.py --port 8080
+
+Endpoints:
+    POST   /sessions                {"answer": "CRANE", "length": 5}
+                                    (both optional)                -> {"session_id", "mode", "length"}
+    GET    /sessions/<id>/guess[?deadline_ms=N]                    -> {"guess", "turn", "remaining",
+                                                                       "complete"}
+    POST   /sessions/<id>/feedback  {"feedback": "GYBBB"}          -> {"guess", "feedback", "remaining",
+                                                                       "solved", "game_over"}
+    DELETE /sessions/<id>                                          -> {"deleted": true}
+    GET    /health                                                 -> {"sessions": n}
+
+Sessions only hold their own game state; the word lists (per word length,
+loaded when a length is first used) and the RLAgent are shared. Guesses and
+feedback (searching, filtering, Q-table updates) run in a thread pool so one
+slow request doesn't stall other sessions, and sessions
+idle for longer than idle_timeout seconds are evicted.
+
+The service serves the Q-table read-only unless started with --learn: online
+RL updates (and saving the table after every game) are off by default.
+
+A guess request may carry a latency budget (deadline_ms: positive and finite,
+clamped to MAX_DEADLINE_MS; or the service-wide default): the search then
+returns the best word found in time, and "complete" is false if it had to
+stop early.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import time
+import uuid
+from urllib.parse import parse_qs
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from typing import Dict, Optional, Tuple
+
+from config import WORD_LENGTH
+from indexes import word_lists
+from knowledge import WordleKnowledge
+from solver import WordleSolver
+
+MAX_BODY_BYTES = 64 * 1024  # requests are a few small JSON fields
+MAX_DEADLINE_MS = 60_000.0  # longer deadline_ms values are clamped to this
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class Session:
+    """Per-user state: one solver over the shared lists"""
+
+    def __init__(self, solver: WordleSolver):
+        self.solver = solver
+        self.lock = asyncio.Lock()
+        self.last_seen = time.monotonic()
+        self.guess_turn: Optional[int] = None  # turn the current last_guess was made for
+        self.complete = True  # whether that guess's search finished before its deadline
+
+
+class SolverService:
+    def __init__(self, idle_timeout: float = 900.0, sweep_interval: float = 30.0,
+                 max_workers: Optional[int] = None, deadline_ms: Optional[float] = None,
+                 learn: bool = False):
+        """
+        Args:
+            idle_timeout: Seconds without a request before a session is evicted
+            sweep_interval: Seconds between eviction sweeps
+            max_workers: Threads for guesses and feedback (ThreadPoolExecutor default if None)
+            deadline_ms: Default latency budget for guess requests (None: always search fully)
+            learn: Update (and save) the shared Q-table from finished games
+        """
+        from rl_agent import shared_agent
+
+        word_lists(WORD_LENGTH)  # other lengths are loaded by their first session
+        self.rl = shared_agent()
+        self.rl.q_table  # load now, not inside the first request
+        self.learn = learn
+
+        self.sessions: Dict[str, Session] = {}
+        self.idle_timeout = idle_timeout
+        self.sweep_interval = sweep_interval
+        self.deadline_ms = deadline_ms
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    # --- Session operations ---
+
+    def create_session(self, answer: str = None, length: int = None) -> dict:
+        if length is None:
+            length = len(answer) if isinstance(answer, str) else WORD_LENGTH
+        if not isinstance(length, int) or isinstance(length, bool) or length < 1:
+            raise HTTPError(400, "length must be a positive integer")
+        if answer is not None and not (isinstance(answer, str) and len(answer) == length
+                                       and answer.isascii() and answer.isalpha()):
+            raise HTTPError(400, f"answer must be a {length}-letter word")
+        try:
+            answers, guessable = word_lists(length)
+        except FileNotFoundError:
+            raise HTTPError(400, f"No {length}-letter word list is installed")
+
+        kb = WordleKnowledge(answers=answers, guessable=guessable, word_length=length)
+        solver = WordleSolver(knowledge=kb, rl=self.rl, learn=self.learn)
+        solver.start_game(answer=answer)
+
+        session_id = uuid.uuid4().hex
+        self.sessions[session_id] = Session(solver)
+        return {"session_id": session_id, "mode": "engine" if solver.answer else "helper", "length": length}
+
+    async def get_guess(self, session_id: str, deadline_ms: float = None) -> dict:
+        # The budget starts when the request arrives, so time spent queued counts against it
+        deadline_ms = self.deadline_ms if deadline_ms is None else deadline_ms
+        deadline = time.monotonic() + deadline_ms / 1000 if deadline_ms is not None else None
+
+        session = self._session(session_id)
+        solver = session.solver
+        async with session.lock:
+            if solver.game_over:
+                raise HTTPError(409, "Game is over")
+
+            # Asking again before submitting feedback returns the same guess
+            if session.guess_turn != solver.turn:
+                loop = asyncio.get_running_loop()
+                guess = await loop.run_in_executor(self.executor, solver.get_guess, deadline)
+                if guess.startswith("ERROR"):
+                    raise HTTPError(409, guess)
+                solver.last_guess = guess
+                session.guess_turn = solver.turn
+                session.complete = solver.search_complete
+
+            return {"guess": solver.last_guess, "turn": solver.turn + 1,
+                    "remaining": len(solver.kb.possible), "complete": session.complete}
+
+    async def submit_feedback(self, session_id: str, feedback: str) -> dict:
+        if feedback is not None and not isinstance(feedback, str):
+            raise HTTPError(400, "feedback must be a string such as \"GYBBB\"")
+        session = self._session(session_id)
+        solver = session.solver
+        async with session.lock:
+            if solver.game_over:
+                raise HTTPError(409, "Game is over")
+            if session.guess_turn != solver.turn:
+                raise HTTPError(409, "Request a guess before submitting feedback")
+
+            # On the pool, like guesses: filtering is a few ms on big candidate sets, and
+            # with learn on it also updates (and at game end saves) the shared Q-table.
+            # The RLAgent's update queue and save lock make that safe from any thread.
+            loop = asyncio.get_running_loop()
+            try:
+                result = await loop.run_in_executor(self.executor, solver.submit_feedback, feedback or "")
+            except ValueError as e:
+                raise HTTPError(400, str(e))
+
+            result["game_over"] = solver.game_over
+            return result
+
+    def delete_session(self, session_id: str) -> dict:
+        self._session(session_id)
+        del self.sessions[session_id]
+        return {"deleted": True}
+
+    def evict_idle(self, now: float = None) -> int:
+        """Drop sessions idle for longer than idle_timeout; returns how many were evicted"""
+        now = time.monotonic() if now is None else now
+        expired = [sid for sid, s in self.sessions.items()
+                   if now - s.last_seen > self.idle_timeout and not s.lock.locked()]
+        for sid in expired:
+            del self.sessions[sid]
+        return len(expired)
+
+    def _session(self, session_id: str) -> Session:
+        session = self.sessions.get(session_id)
+        if session is None:
+            raise HTTPError(404, f"Unknown session '{session_id}'")
+        session.last_seen = time.monotonic()
+        return session
+
+    # --- HTTP layer ---
+
+    async def handle(self, method: str, path: str, body: bytes = b"") -> Tuple[int, dict]:
+        """Route one request; returns (status, JSON payload)"""
+        try:
+            try:
+                data = json.loads(body) if body else {}
+            except ValueError:
+                raise HTTPError(400, "Body must be JSON")
+            if not isinstance(data, dict):
+                raise HTTPError(400, "Body must be a JSON object")
+
+            path, _, query = path.partition("?")
+            params = parse_qs(query)
+            parts = path.strip("/").split("/")
+
+            if parts == ["health"] and method == "GET":
+                return 200, {"sessions": len(self.sessions)}
+            if parts == ["sessions"] and method == "POST":
+                return 201, self.create_session(data.get("answer"), data.get("length"))
+            if len(parts) == 2 and parts[0] == "sessions" and method == "DELETE":
+                return 200, self.delete_session(parts[1])
+            if len(parts) == 3 and parts[0] == "sessions":
+                if parts[2] == "guess" and method == "GET":
+                    deadline_ms = None
+                    if "deadline_ms" in params:
+                        try:
+                            deadline_ms = float(params["deadline_ms"][0])
+                        except ValueError:
+                            deadline_ms = math.nan
+                        # nan would never trip the search's time check, so it means "no deadline"
+                        if not (math.isfinite(deadline_ms) and deadline_ms > 0):
+                            raise HTTPError(400, "deadline_ms must be a positive number")
+                        deadline_ms = min(deadline_ms, MAX_DEADLINE_MS)
+                    return 200, await self.get_guess(parts[1], deadline_ms)
+                if parts[2] == "feedback" and method == "POST":
+                    return 200, await self.submit_feedback(parts[1], data.get("feedback"))
+            raise HTTPError(404, f"No route for {method} {path}")
+        except HTTPError as e:
+            return e.status, {"error": str(e)}
+        except Exception as e:
+            # Anything else is a bug on our side: answer it rather than drop the connection
+            return 500, {"error": f"Internal error: {type(e).__name__}: {e}"}
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                try:
+                    length = int(headers.get("content-length", 0) or 0)
+                except ValueError:
+                    length = -1
+                if not 0 <= length <= MAX_BODY_BYTES:
+                    # The body can't be framed (or is too big to read): answer and hang up
+                    if length > MAX_BODY_BYTES:
+                        status, payload = 413, {"error": f"Body over {MAX_BODY_BYTES} bytes"}
+                    else:
+                        status, payload = 400, {"error": "Bad Content-Length"}
+                    await self._respond(writer, status, payload, keep_alive=False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                status, payload = await self.handle(method, target, body)
+
+                keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _respond(writer: asyncio.StreamWriter, status: int, payload: dict, keep_alive: bool):
+        data = json.dumps(payload).encode()
+        writer.write(
+            f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(data)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + data)
+        await writer.drain()
+
+    async def _evict_loop(self):
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            self.evict_idle()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8080) -> asyncio.AbstractServer:
+        """Start listening (port 0 picks a free port) and the eviction sweeps"""
+        server = await asyncio.start_server(self._handle_connection, host, port)
+        self._evictor = asyncio.get_running_loop().create_task(self._evict_loop())
+        return server
+
+    def close(self):
+        evictor = getattr(self, "_evictor", None)
+        if evictor:
+            evictor.cancel()
+        self.executor.shutdown(wait=False)
+
+
+async def _serve(args):
+    service = SolverService(idle_timeout=args.idle_timeout, max_workers=args.workers,
+                            deadline_ms=args.deadline_ms, learn=args.learn)
+    server = await service.start(args.host, args.port)
+    host, port = server.sockets[0].getsockname()[:2]
+    print(f"Wordle solver service on http://{host}:{port}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local Wordle solver service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--idle-timeout", type=float, default=900.0, help="seconds before an idle session is evicted")
+    parser.add_argument("--workers", type=int, default=None, help="threads for guess computation")
+    parser.add_argument("--deadline-ms", type=float, default=None,
+                        help="default latency budget per guess request (default: no limit)")
+    parser.add_argument("--learn", action="store_true",
+                        help="update and save the shared Q-table from finished games (off by default)")
+    args = parser.parse_args()
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
@@ -1,46 +1,122 @@
 # solver.py (Updated for Dual Mode)
 
 import random
+import struct
+import time
+import zlib
 from knowledge import WordleKnowledge
 from planning import Planner
-from rl_agent import RLAgent
 from nlp_feedback import parse_feedback
 from search import feedback_pattern
+from feedback import encode_pattern, decode_pattern
 from config import MAX_GUESSES
 
+# Snapshot layout (see WordleSolver.snapshot): header, then
+#   answer      word_length bytes      if SNAP_ENGINE
+#   last_guess  word_length bytes      if SNAP_LAST_GUESS
+#   constraints n x (guess, base-3 pattern code)
+#   candidates  bitmask over the answer list (zlib'd if SNAP_ZLIB), absent if SNAP_ALL
+SNAPSHOT_MAGIC = b"WSNP"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_HEADER = struct.Struct("<4sBBBBB3xII")  # magic, version, word length, turn, flags,
+                                                 # constraint count, answer count, answer crc32
+SNAP_ENGINE, SNAP_GAME_OVER, SNAP_LAST_GUESS, SNAP_ALL, SNAP_ZLIB, SNAP_HARD = 1, 2, 4, 8, 16, 32
+
+
+def _list_checksum(words) -> int:
+    buffer = getattr(words, "buffer", None)  # lexicon.Lexicon: checksum the packed records
+    return zlib.crc32(buffer if buffer is not None else "".join(words).encode("ascii"))
+
 
 class WordleSolver:
-    def __init__(self):
-        self.kb = WordleKnowledge()
+    def __init__(self, knowledge: WordleKnowledge = None, rl=None, learn: bool = True, log=None,
+                 word_length: int = None, hard_mode: bool = None, seed: int = None):
+        # Callers that already loaded the word lists (e.g. a GUI warming up in
+        # the background) can hand them in instead of reading them again.
+        # Likewise an RLAgent can be shared between solvers (by default every
+        # solver uses the process-wide one, rl_agent.shared_agent()).
+        # A solver is safe to run on any thread as long as one thread at a time
+        # drives it: its randomness comes from its own rng (seeded by `seed`),
+        # and the shared agent queues learning updates (see RLAgent).
+        self.kb = knowledge if knowledge is not None else WordleKnowledge(word_length=word_length)
+        # hard_mode: guesses must reuse revealed hints (kb.allowed); None keeps the knowledge's own setting
+        if hard_mode is not None and bool(hard_mode) != self.kb.hard_mode:
+            self.kb.hard_mode = bool(hard_mode)
+            self.kb._allowed = None  # rebuilt from the constraints on first use
+        self.word_length = self.kb.word_length
+        self.solved_pattern = "G" * self.word_length
         self.planner = Planner(self.kb)
-        self.rl = RLAgent()
+        self._rl = rl  # built on first use if not given, see the rl property
+        # learn=False plays with the current Q-table but never updates or saves it
+        # (read-only serving: no table writes at all)
+        self.learn = learn
+        self.rng = random.Random(seed)
+        # Optional gamelog.GameLog: every finished game is appended to it
+        self.log = log
+        self._turns = []
+        self._decision = None  # (guess, source, ms, deadline_ms, complete) of the last get_guess call
+        self.suggestions = []  # planner's ranked alternatives for the last guess (see Planner.suggestions)
+        self.search_complete = True  # False if the last guess was cut short by its deadline
         self.turn = 0
         self.game_over = False
         self.answer = None
         self.last_guess = ""
 
+    @property
+    def rl(self):
+        if self._rl is None:
+            from rl_agent import shared_agent  # Localized: only needed once a game is under way
+            self._rl = shared_agent()
+        return self._rl
+
+    def warm_up(self):
+        """Load the word lists and the Q-table now rather than on first use"""
+        self.kb.warm_up()
+        self.rl.q_table
+
     def start_game(self, answer: str = None):
         self.kb.reset()
         self.turn = 0
         self.game_over = False
         self.last_guess = ""
+        self._turns = []
+        self._decision = None
 
         if answer is None or answer == "HELPER_MODE":
             self.answer = None  # Helper Mode
         else:
+            if len(answer) != self.word_length:
+                raise ValueError(f"Answer must be a {self.word_length}-letter word")
             self.answer = answer.upper()  # Engine Mode — THIS MUST BE SET
 
-    def get_guess(self) -> str:
+    def get_guess(self, deadline: float = None) -> str:
+        """
+        Next guess. deadline (a time.monotonic() instant) bounds the planner's
+        search; search_complete tells whether it finished in time.
+        """
+        start = time.perf_counter()
+        # The budget left, so a logged game can be replayed under the same one
+        deadline_ms = (deadline - time.monotonic()) * 1000 if deadline is not None else None
+        guess, source = self._choose_guess(deadline)
+        ms = (time.perf_counter() - start) * 1000
+        self.suggestions = self.planner.suggestions if source == "planner" else []
+        self.search_complete = self.planner.complete if source == "planner" else True
+        self._decision = (guess, source, ms, deadline_ms, self.search_complete)
+        return guess
+
+    def _choose_guess(self, deadline: float = None):
+        """Returns (guess, source); source says which component decided"""
         if self.turn == 0:
-            return "SLATE"
+            return self.planner.opener(), "opener"
         elif len(self.kb.possible) == 0:
-            return "ERROR: No possible words left—Check feedback!"
+            return "ERROR: No possible words left—Check feedback!", "error"
         elif len(self.kb.possible) <= 2:
-            return random.choice(list(self.kb.possible))
+            # Sorted: set order changes with PYTHONHASHSEED, and a seeded game must replay
+            return self.rng.choice(sorted(self.kb.possible)), "endgame"
         else:
-            if random.random() < 0.3:
-                return self.rl.choose_action(self.kb.possible, self.turn)
-            return self.planner.plan_next_guess()
+            if self.rng.random() < 0.3:
+                return self.rl.choose_action(self.kb.possible, self.turn, self.rng), "rl"
+            return self.planner.plan_next_guess(deadline), "planner"
 
     def submit_feedback(self, feedback_text: str):
         guess = self.last_guess
@@ -53,32 +129,240 @@ class WordleSolver:
             actual = feedback_pattern(guess, self.answer)
         elif feedback_text:
             # ✍️ Helper Mode: Answer is None, use and parse user's text feedback
-            actual = parse_feedback(feedback_text)
+            actual = parse_feedback(feedback_text, self.word_length)
         else:
             # Should be caught by the UI, but here for robustness
-            raise ValueError("Feedback required. Please enter 5 G/Y/B characters.")
+            raise ValueError(f"Feedback required. Please enter {self.word_length} G/Y/B characters.")
 
-        if len(self.kb.possible) == 0 and actual != "GGGGG":
+        if len(self.kb.possible) == 0 and actual != self.solved_pattern:
             raise ValueError(f"Feedback '{actual}' is inconsistent with history. No possible words left.")
 
         self.kb.apply_feedback(guess, actual)
 
         # --- RL Update Logic (Used in both modes) ---
-        state = self.rl._state_key(len(self.kb.possible), self.turn)
-        next_state = self.rl._state_key(len(self.kb.possible), self.turn + 1)
-        reward = 10 if actual == "GGGGG" else -1 * (self.turn + 1)
-        self.rl.update(state, guess, reward, next_state)
+        if self.learn:
+            state = self.rl._state_key(len(self.kb.possible), self.turn)
+            next_state = self.rl._state_key(len(self.kb.possible), self.turn + 1)
+            reward = 10 if actual == self.solved_pattern else -1 * (self.turn + 1)
+            self.rl.update(state, guess, reward, next_state)
         # --- End RL Update Logic ---
 
         self.turn += 1
 
-        if actual == "GGGGG" or self.turn >= MAX_GUESSES:
+        if self.log is not None:
+            self._record_turn(guess, actual)
+
+        if actual == self.solved_pattern or self.turn >= MAX_GUESSES:
             self.game_over = True
-            self.rl.save()
+            if self.learn:
+                self.rl.save()
+            if self.log is not None:
+                self.log.write({
+                    "mode": "engine" if self.answer else "helper",
+                    "answer": self.answer,
+                    "hard_mode": self.kb.hard_mode,
+                    "solved": actual == self.solved_pattern,
+                    "turns": self._turns,
+                })
 
         return {
             "guess": guess,
             "feedback": actual,
             "remaining": len(self.kb.possible),
-            "solved": actual == "GGGGG"
-        }
\ No newline at end of file
+            "solved": actual == self.solved_pattern
+        }
+
+    def snapshot(self) -> bytes:
+        """
+        Serialize the game state (a few hundred bytes at most)
+
+        The candidate set is stored as a bitmask over the answer list, so the
+        restoring process must use the same list (checked via its crc32).
+        Word lists, the RL agent and any game log are not included.
+        """
+        kb = self.kb
+        n = kb.word_length
+        pattern_size = ((3 ** n - 1).bit_length() + 7) // 8
+
+        flags = 0
+        body = bytearray()
+        if self.answer:
+            flags |= SNAP_ENGINE
+            body += self.answer.encode("ascii")
+        if self.game_over:
+            flags |= SNAP_GAME_OVER
+        if kb.hard_mode:
+            flags |= SNAP_HARD
+        if self.last_guess:
+            flags |= SNAP_LAST_GUESS
+            body += self.last_guess.encode("ascii")
+        for guess, pattern in kb.constraints:
+            body += guess.encode("ascii") + encode_pattern(pattern).to_bytes(pattern_size, "little")
+
+        if kb._possible is None or len(kb.possible) == len(kb.answers):
+            flags |= SNAP_ALL
+        else:
+            mask = kb.candidate_mask()
+            packed = zlib.compress(mask, 9)
+            if len(packed) < len(mask):
+                flags |= SNAP_ZLIB
+                mask = packed
+            body += mask
+
+        header = SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, n, self.turn, flags,
+                                      len(kb.constraints), len(kb.answers), _list_checksum(kb.answers))
+        return header + bytes(body)
+
+    def restore(self, data: bytes):
+        """Load a snapshot() into this solver, replacing its game state"""
+        try:
+            self._restore(data)
+        except (zlib.error, struct.error, IndexError, TypeError) as e:
+            # Corrupt bytes past the header checks: same error type as every other bad snapshot
+            raise ValueError(f"Invalid snapshot: {e}") from e
+
+    def _restore(self, data: bytes):
+        if len(data) < SNAPSHOT_HEADER.size:
+            raise ValueError("Snapshot is truncated")
+        magic, version, n, turn, flags, n_constraints, count, checksum = SNAPSHOT_HEADER.unpack_from(data)
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            raise ValueError("Not a solver snapshot (or unsupported version)")
+        kb = self.kb
+        if n != kb.word_length or count != len(kb.answers) or checksum != _list_checksum(kb.answers):
+            raise ValueError("Snapshot was taken with a different answer list")
+
+        pattern_size = ((3 ** n - 1).bit_length() + 7) // 8
+        pos = SNAPSHOT_HEADER.size
+
+        def take(size):
+            nonlocal pos
+            chunk = data[pos:pos + size]
+            if len(chunk) != size:
+                raise ValueError("Snapshot is truncated")
+            pos += size
+            return chunk
+
+        answer = take(n).decode("ascii") if flags & SNAP_ENGINE else None
+        last_guess = take(n).decode("ascii") if flags & SNAP_LAST_GUESS else ""
+        constraints = []
+        for _ in range(n_constraints):
+            guess = take(n).decode("ascii")
+            code = int.from_bytes(take(pattern_size), "little")
+            constraints.append((guess, decode_pattern(code, n)))
+
+        mask = None
+        if not flags & SNAP_ALL:
+            mask = data[pos:]
+            if flags & SNAP_ZLIB:
+                # Inflate no further than a valid mask could be (a bad stream can't balloon)
+                inflater = zlib.decompressobj()
+                mask = inflater.decompress(mask, (count + 7) // 8 + 1)
+                if not inflater.eof or inflater.unused_data:
+                    raise ValueError("Snapshot candidate mask is truncated or has trailing data")
+            if len(mask) != (count + 7) // 8 or (count % 8 and mask[-1] >> (count % 8)):
+                raise ValueError("Snapshot candidate mask is corrupt")
+
+        # Everything is decoded: only now replace the current state
+        kb.reset()
+        if mask is not None:
+            kb.set_candidate_mask(mask)
+        kb.constraints = constraints
+        kb.hard_mode = bool(flags & SNAP_HARD)  # its allowed set is rebuilt on first use
+        kb.solved = any(p == "G" * n for _, p in constraints)
+
+        self.answer = answer
+        self.last_guess = last_guess
+        self.turn = turn
+        self.game_over = bool(flags & SNAP_GAME_OVER)
+        self._turns = []
+        self._decision = None
+
+    def _record_turn(self, guess: str, pattern: str):
+        if self._decision is not None and self._decision[0] == guess:
+            _, source, ms, deadline_ms, complete = self._decision
+            ms = round(ms, 3)
+            deadline_ms = round(deadline_ms, 3) if deadline_ms is not None else None
+        else:
+            # e.g. the user played their own word
+            source, ms, deadline_ms, complete = "manual", None, None, True
+        self._decision = None
+        self._turns.append({"guess": guess, "pattern": pattern, "source": source, "ms": ms,
+                            "deadline_ms": deadline_ms, "complete": complete})
+
+
+class MultiBoardSolver:
+    """
+    Dordle/Quordle-style play: N boards, every guess is played on all of them.
+    Each board keeps its own WordleKnowledge; guesses maximize the summed
+    entropy over the unsolved boards (search.best_joint_guess).
+    """
+
+    def __init__(self, boards: int = 4, knowledge: WordleKnowledge = None, max_guesses: int = None,
+                 word_length: int = None):
+        first = knowledge if knowledge is not None else WordleKnowledge(word_length=word_length)
+        # All boards share the first board's (read-only) word lists
+        self.boards = [first] + [WordleKnowledge(answers=first.answers, guessable=first.guessable)
+                                 for _ in range(boards - 1)]
+        self.word_length = first.word_length
+        self.planner = Planner(first)
+        # One extra guess per extra board, like Dordle (7) and Quordle (9)
+        self.max_guesses = max_guesses if max_guesses is not None else MAX_GUESSES + boards - 1
+        self.turn = 0
+        self.game_over = False
+        self.answers = None
+        self.last_guess = ""
+
+    def start_game(self, answers: list = None):
+        """answers: one per board for Engine Mode, or None for Helper Mode"""
+        if answers is not None and len(answers) != len(self.boards):
+            raise ValueError(f"Need {len(self.boards)} answers, got {len(answers)}")
+        if answers is not None and any(len(a) != self.word_length for a in answers):
+            raise ValueError(f"Answers must be {self.word_length}-letter words")
+        for kb in self.boards:
+            kb.reset()
+        self.turn = 0
+        self.game_over = False
+        self.last_guess = ""
+        self.answers = [a.upper() for a in answers] if answers is not None else None
+
+    def get_guess(self) -> str:
+        if self.turn == 0:
+            return self.planner.opener()
+        unsolved = [kb for kb in self.boards if not kb.solved]
+        if any(len(kb.possible) == 0 for kb in unsolved):
+            return "ERROR: No possible words left—Check feedback!"
+        # A board down to one word is a guaranteed solve; take it before exploring
+        for kb in unsolved:
+            if len(kb.possible) == 1:
+                return next(iter(kb.possible))
+        return self.planner.plan_joint_guess(self.boards)
+
+    def submit_feedback(self, feedbacks: list = None):
+        """feedbacks: one G/Y/B string per board (ignored in Engine Mode; solved boards may be None)"""
+        guess = self.last_guess
+        if not guess:
+            raise ValueError("Solver error: No guess was made.")
+
+        if self.answers:
+            actual = [feedback_pattern(guess, a) for a in self.answers]
+        elif feedbacks is not None and len(feedbacks) == len(self.boards):
+            actual = [None if kb.solved else parse_feedback(fb, self.word_length)
+                      for kb, fb in zip(self.boards, feedbacks)]
+        else:
+            raise ValueError(f"Feedback required for each of the {len(self.boards)} boards.")
+
+        for kb, pattern in zip(self.boards, actual):
+            if not kb.solved:
+                kb.apply_feedback(guess, pattern)
+
+        self.turn += 1
+        solved = all(kb.solved for kb in self.boards)
+        if solved or self.turn >= self.max_guesses:
+            self.game_over = True
+
+        return {
+            "guess": guess,
+            "feedback": actual,
+            "remaining": [len(kb.possible) for kb in self.boards],
+            "solved": solved,
+        }
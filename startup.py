@@ -0,0 +1,81 @@
+# startup.py
+"""
+Background warm-up for the Tk GUIs.
+
+Work runs on a daemon thread; completion callbacks are delivered on the Tk
+thread by polling a queue with root.after, since Tk widgets must only be
+touched from the thread that created them.
+"""
+
+import queue
+import threading
+from typing import Any, Callable, List, Optional, Tuple
+
+# (description, work(previous_result) -> result, on_done(result))
+Stage = Tuple[str, Callable[[Any], Any], Callable[[Any], None]]
+
+
+class StagedLoader:
+    """
+    Run a sequence of loading stages in the background
+    """
+
+    def __init__(self, root, stages: List[Stage],
+                 on_progress: Optional[Callable[[int, int, str], None]] = None,
+                 on_error: Optional[Callable[[Exception], None]] = None,
+                 poll_ms: int = 50):
+        """
+        Args:
+            root: Tk root used to schedule polling
+            stages: Stages to run in order; each work function receives the previous stage's result
+            on_progress: Called as (stage_index, stage_count, description) when a stage starts,
+                         and with stage_index == stage_count once everything is done
+            on_error: Called with the exception if a stage fails (remaining stages are skipped)
+            poll_ms: How often the Tk thread checks for finished stages
+        """
+        self.root = root
+        self.stages = stages
+        self.on_progress = on_progress
+        self.on_error = on_error
+        self.poll_ms = poll_ms
+        self._events = queue.Queue()
+
+    def start(self):
+        threading.Thread(target=self._run, daemon=True).start()
+        self.root.after(self.poll_ms, self._poll)
+
+    def _run(self):
+        result = None
+        for index, (description, work, _) in enumerate(self.stages):
+            self._events.put(("start", index, description))
+            try:
+                result = work(result)
+            except Exception as e:
+                self._events.put(("error", index, e))
+                return
+            self._events.put(("done", index, result))
+
+    def _poll(self):
+        while True:
+            try:
+                kind, index, payload = self._events.get_nowait()
+            except queue.Empty:
+                break
+
+            if kind == "start":
+                self._progress(index, payload)
+            elif kind == "done":
+                self.stages[index][2](payload)
+                if index == len(self.stages) - 1:
+                    self._progress(len(self.stages), "Ready")
+                    return
+            else:
+                if self.on_error:
+                    self.on_error(payload)
+                return
+
+        self.root.after(self.poll_ms, self._poll)
+
+    def _progress(self, index: int, description: str):
+        if self.on_progress:
+            self.on_progress(index, len(self.stages), description)
@@ -0,0 +1,71 @@
+# tests/test_feedback_kernels.py
+"""The packed (packed.py) and matrix-free (vectorized.py) kernels agree with feedback.py"""
+
+import random
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # flat top-level modules
+
+import vectorized
+from feedback import encode_pattern, feedback_pattern, filter_consistent
+from indexes import word_lists
+from packed import decode_word, encode_word, encode_words, filter_packed, packed_feedback, packed_pattern
+from search import score_guess
+from vectorized import WordArrays
+
+# Repeated letters in guess, answer or both: the cases the kernels special-case
+DUPLICATES = ["EERIE", "GEESE", "SPEED", "ABBEY", "LLAMA", "MAMMA", "TATTY", "EASEL", "ALLEY", "CRANE"]
+
+
+class FeedbackKernelTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        answers, guessable = word_lists(5)
+        rng = random.Random(2024)
+        # dict.fromkeys: no repeats, so the list and set(list) hold the same candidates
+        cls.answers = list(dict.fromkeys(rng.sample(list(answers), 300) + DUPLICATES))
+        cls.guesses = list(dict.fromkeys(rng.sample(list(guessable), 40) + DUPLICATES))
+
+    def test_word_codes_round_trip(self):
+        for word in self.answers:
+            self.assertEqual(decode_word(encode_word(word)), word)
+
+    def test_packed_feedback_matches(self):
+        answer_codes = encode_words(self.answers)
+        for guess in self.guesses:
+            g = encode_word(guess)
+            for answer, a in zip(self.answers, answer_codes):
+                expected = feedback_pattern(guess, answer)
+                self.assertEqual(packed_feedback(g, a), encode_pattern(expected), (guess, answer))
+                self.assertEqual(packed_pattern(g, a), expected, (guess, answer))
+
+    def test_filter_packed_matches(self):
+        answer_codes = encode_words(self.answers)
+        for guess in self.guesses:
+            for answer in DUPLICATES + self.answers[:10]:
+                pattern = feedback_pattern(guess, answer)
+                expected = filter_consistent(self.answers, guess, pattern)
+                got = [decode_word(c) for c in filter_packed(answer_codes, guess, pattern)]
+                self.assertEqual(got, expected, (guess, pattern))
+
+    def _check_arrays(self):
+        arrays = WordArrays(self.answers)
+        for guess in self.guesses:
+            expected = bytes(encode_pattern(feedback_pattern(guess, a)) for a in self.answers)
+            self.assertEqual(arrays.codes(guess), expected, guess)
+            # Sorted-count sums on both sides, so equal, not just close
+            self.assertEqual(arrays.score(guess), score_guess(guess, set(self.answers)), guess)
+
+    def test_vectorized_matches(self):
+        self._check_arrays()
+
+    def test_vectorized_pure_python_matches(self):
+        with mock.patch.object(vectorized, "np", None):
+            self._check_arrays()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+# tests/test_hard_mode.py
+"""Hard mode: feedback.hard_mode_filter, WordleKnowledge.allowed and the solver's hard_mode flag"""
+
+import random
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # flat top-level modules
+
+from feedback import feedback_pattern, hard_mode_filter
+from indexes import word_lists
+from knowledge import WordleKnowledge
+from solver import WordleSolver
+
+
+class HardModeFilterTest(unittest.TestCase):
+    def test_greens_and_revealed_letters(self):
+        words = ["CRANE", "CRONE", "CARES", "TRACE", "CREEK", "SLATE"]
+        # C green, R and E yellow, A and N gray
+        self.assertEqual(hard_mode_filter(words, "CRANE", "GYBBY"), ["CRANE", "CRONE", "CARES", "CREEK"])
+
+    def test_duplicate_letter_counts(self):
+        words = ["GEESE", "EERIE", "STEEL", "SPEED", "SPELL"]
+        # Two yellow Es: every legal guess needs at least two
+        self.assertEqual(hard_mode_filter(words, "EERIE", "YYBBB"), ["GEESE", "EERIE", "STEEL", "SPEED"])
+
+    def test_all_gray_keeps_everything(self):
+        words = ["CRANE", "SLATE"]
+        self.assertEqual(hard_mode_filter(words, "PUFFY", "BBBBB"), words)
+
+    def test_answer_always_allowed(self):
+        answers, guessable = word_lists(5)
+        rng = random.Random(7)
+        for answer in rng.sample(list(answers), 20):
+            allowed = guessable
+            for guess in rng.sample(list(guessable), 3):
+                allowed = hard_mode_filter(allowed, guess, feedback_pattern(guess, answer))
+                self.assertIn(answer, allowed, (guess, answer))
+
+
+class HardModeKnowledgeTest(unittest.TestCase):
+    def test_incremental_matches_rebuild(self):
+        kb = WordleKnowledge(hard_mode=True)
+        kb.allowed  # narrowed turn by turn from here on
+        for guess in ("SLATE", "CRONY", "PIOUS"):
+            kb.apply_feedback(guess, feedback_pattern(guess, "ROBIN"))
+            rebuilt = WordleKnowledge(hard_mode=True)
+            rebuilt.constraints = list(kb.constraints)
+            self.assertEqual(kb.allowed, rebuilt.allowed, guess)
+        self.assertIn("ROBIN", kb.allowed)
+
+    def test_normal_mode_allows_everything(self):
+        kb = WordleKnowledge()
+        kb.apply_feedback("SLATE", feedback_pattern("SLATE", "ROBIN"))
+        self.assertIs(kb.allowed, kb.guessable)
+
+
+class SolverHardModeTest(unittest.TestCase):
+    def test_none_keeps_knowledge_setting(self):
+        kb = WordleKnowledge(hard_mode=True)
+        self.assertTrue(WordleSolver(knowledge=kb, learn=False).kb.hard_mode)
+
+    def test_flag_overrides_and_resets_allowed(self):
+        kb = WordleKnowledge(hard_mode=True)
+        kb.apply_feedback("SLATE", feedback_pattern("SLATE", "ROBIN"))
+        narrowed = kb.allowed
+        solver = WordleSolver(knowledge=kb, learn=False, hard_mode=False)
+        self.assertFalse(solver.kb.hard_mode)
+        self.assertIs(solver.kb.allowed, solver.kb.guessable)
+        solver.kb.hard_mode = True  # stale narrowed set must not come back
+        self.assertIsNone(solver.kb._allowed)
+        self.assertEqual(solver.kb.allowed, narrowed)
+
+    def test_guesses_stay_legal(self):
+        for seed in range(3):
+            solver = WordleSolver(learn=False, hard_mode=True, seed=seed)
+            solver.start_game(answer="ROBIN")
+            while not solver.game_over:
+                guess = solver.get_guess()
+                self.assertIn(guess, solver.kb.allowed, (seed, solver.turn))
+                solver.last_guess = guess
+                solver.submit_feedback("")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+# tests/test_memory.py
+"""Per-session memory gate (memory.py), measured with tracemalloc"""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # flat top-level modules
+
+from config import SESSION_MEMORY_BUDGET
+from memory import check_session_budget, load_shared_state, memory_report, session_memory
+
+
+class SessionMemoryTest(unittest.TestCase):
+    def test_session_within_budget(self):
+        ok, usage = check_session_budget(SESSION_MEMORY_BUDGET, games=3)
+        self.assertTrue(ok, f"solver session retained {usage['retained_bytes']:,} B, "
+                            f"budget {SESSION_MEMORY_BUDGET:,} B")
+
+    def test_shared_state_not_charged_to_session(self):
+        # Word lists, answer set and Q-table together are over 1 MB; a session is a few KB
+        usage = session_memory(games=1)
+        self.assertLess(usage["retained_bytes"], 64 * 1024)
+
+    def test_report_marks_shared_structures(self):
+        from solver import WordleSolver
+
+        load_shared_state()
+        solver = WordleSolver(learn=False)
+        solver.warm_up()
+        report = memory_report(solver)
+        for name in ("answers", "guessable", "q_table"):
+            self.assertTrue(report["structures"][name]["shared"], name)
+        self.assertLess(report["session_bytes"], report["total_bytes"])
+
+
+if __name__ == "__main__":
+    unittest.main()
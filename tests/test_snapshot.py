@@ -0,0 +1,95 @@
+# tests/test_snapshot.py
+"""WordleSolver.snapshot()/restore(): round trips, and bad bytes rejected as ValueError"""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # flat top-level modules
+
+from feedback import feedback_pattern
+from knowledge import WordleKnowledge
+from solver import SNAP_ZLIB, SNAPSHOT_HEADER, WordleSolver
+
+
+def play(solver, turns, answer="CRANE"):
+    """Play `turns` guesses; in Helper Mode the feedback is typed in against `answer`"""
+    for _ in range(turns):
+        solver.last_guess = solver.get_guess()
+        solver.submit_feedback("" if solver.answer else feedback_pattern(solver.last_guess, answer))
+
+
+def state(solver):
+    kb = solver.kb
+    return (solver.answer, solver.turn, solver.game_over, solver.last_guess,
+            kb.constraints, set(kb.possible), kb.hard_mode, kb.solved)
+
+
+class SnapshotTest(unittest.TestCase):
+    def round_trip(self, solver):
+        data = solver.snapshot()
+        restored = WordleSolver(learn=False)
+        restored.restore(data)
+        self.assertEqual(state(restored), state(solver))
+        return data
+
+    def test_engine_mode(self):
+        solver = WordleSolver(learn=False, seed=1)
+        solver.start_game(answer="CRANE")
+        self.round_trip(solver)  # fresh game: no mask stored
+        play(solver, 2)
+        self.round_trip(solver)
+
+    def test_helper_mode(self):
+        solver = WordleSolver(learn=False, seed=2)
+        solver.start_game()
+        play(solver, 1, answer="GEESE")
+        self.round_trip(solver)
+
+    def test_zlib_mask(self):
+        solver = WordleSolver(learn=False, seed=1)
+        solver.start_game(answer="CRANE")
+        play(solver, 1)
+        data = self.round_trip(solver)
+        self.assertTrue(SNAPSHOT_HEADER.unpack_from(data)[4] & SNAP_ZLIB)
+
+    def test_hard_mode(self):
+        solver = WordleSolver(learn=False, hard_mode=True, seed=3)
+        solver.start_game(answer="CRANE")
+        play(solver, 2)
+        restored = WordleSolver(learn=False)
+        restored.restore(solver.snapshot())
+        self.assertTrue(restored.kb.hard_mode)
+        self.assertEqual(restored.kb.allowed, solver.kb.allowed)
+
+    def test_corrupt_data_rejected(self):
+        solver = WordleSolver(learn=False, seed=1)
+        solver.start_game(answer="CRANE")
+        play(solver, 2)
+        data = solver.snapshot()
+        flipped_mask = data[:-1] + bytes([data[-1] ^ 0xFF])
+        flipped_header = data[:1] + bytes([data[1] ^ 0xFF]) + data[2:]
+        bad = [b"", data[:SNAPSHOT_HEADER.size - 1], data[:SNAPSHOT_HEADER.size + 3],
+               data[:-1], flipped_mask, flipped_header, data + b"\x00"]
+
+        target = WordleSolver(learn=False, seed=4)
+        target.start_game(answer="SLATE")
+        play(target, 1, answer="SLATE")
+        before = state(target)
+        for i, blob in enumerate(bad):
+            with self.assertRaises(ValueError, msg=f"case {i}"):
+                target.restore(blob)
+            self.assertEqual(state(target), before, f"case {i} changed the game")
+
+    def test_other_answer_list_rejected(self):
+        solver = WordleSolver(learn=False, seed=1)
+        solver.start_game(answer="CRANE")
+        play(solver, 1)
+        words = ["CRANE", "SLATE", "GEESE", "ABBEY"]
+        other = WordleSolver(knowledge=WordleKnowledge(answers=words, guessable=words), learn=False)
+        with self.assertRaises(ValueError):
+            other.restore(solver.snapshot())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,9 +5,9 @@ import random
 import time
 from statistics import mean
 from solver import WordleSolver
-from config import MAX_GUESSES
+from config import MAX_GUESSES, Q_TABLE_PATH
 
-def train_rl(episodes: int = 10000, output_file: str = "q_table.json"):
+def train_rl(episodes: int = 10000, output_file: str = Q_TABLE_PATH):
     solver = WordleSolver()
     wins = []
     guesses_list = []
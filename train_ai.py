@@ -183,9 +183,11 @@ def demo_single_game(word_list: List[str], strategy: str = "adaptive", show_step
     return game.won, attempt
 
 
-def train_multiple_strategies(word_list: List[str], num_games: int = 100):
+def train_multiple_strategies(word_list: List[str], num_games: int = 100, workers: int = 1):
     """
     Train and compare multiple strategies
+
+    Games for each strategy are spread over `workers` processes.
     """
     ui = TrainingUI()
     strategies = ["random", "frequency", "elimination", "adaptive"]
@@ -201,7 +203,7 @@ def train_multiple_strategies(word_list: List[str], num_games: int = 100):
         ai = WordleAI(word_list, strategy=strategy)
         trainer = WordleTrainer(word_list)
 
-        stats = trainer.train(ai, num_games)
+        stats = trainer.train(ai, num_games, workers=workers, progress=ui.show_progress)
         results[strategy] = stats
 
         print(f"  Win Rate: {stats['win_rate']:.2f}%")
@@ -279,13 +281,14 @@ def main():
             strategy = input(
                 "Choose strategy (random/frequency/elimination/adaptive) [adaptive]: ").strip() or "adaptive"
             num_games = int(input("Number of games [100]: ").strip() or "100")
+            workers = int(input("Worker processes [1]: ").strip() or "1")
 
             ui = TrainingUI()
             ai = WordleAI(word_list, strategy=strategy)
             trainer = WordleTrainer(word_list)
 
             print(f"\nTraining '{strategy}' strategy with {num_games} games...")
-            stats = trainer.train(ai, num_games)
+            stats = trainer.train(ai, num_games, workers=workers, progress=ui.show_progress)
 
             ui.show_statistics(stats)
             input("\nPress Enter to continue...")
@@ -293,7 +296,8 @@ def main():
         elif choice == "3":
             # Compare strategies
             num_games = int(input("Number of games per strategy [100]: ").strip() or "100")
-            train_multiple_strategies(word_list, num_games)
+            workers = int(input("Worker processes [1]: ").strip() or "1")
+            train_multiple_strategies(word_list, num_games, workers)
             input("\nPress Enter to continue...")
 
         elif choice == "4":
@@ -301,12 +305,16 @@ def main():
             print("\nCustom training options:")
             strategy = input("Strategy: ").strip()
             num_games = int(input("Number of games: ").strip())
+            workers = int(input("Worker processes [1]: ").strip() or "1")
+            seed_text = input("Seed (blank for random): ").strip()
 
             ui = TrainingUI()
             ai = WordleAI(word_list, strategy=strategy)
             trainer = WordleTrainer(word_list)
 
-            stats = trainer.train(ai, num_games)
+            stats = trainer.train(ai, num_games, workers=workers,
+                                  seed=int(seed_text) if seed_text else None,
+                                  progress=ui.show_progress)
             ui.show_statistics(stats)
             input("\nPress Enter to continue...")
 
@@ -0,0 +1,163 @@
+# vectorized.py
+"""
+Matrix-free feedback kernel: pattern codes of one guess against a whole
+candidate set, computed on the fly from array-encoded words instead of
+looked up in a guess x answer table (indexes.PatternIndex).
+
+Words are stored as positional letter arrays (one column per position) plus
+per-word letter counts, built lazily per letter. A guess is scored one
+distinct letter at a time: for its positions S, each word gets a key
+    sum(green at S[k] << k) + (min(count of the letter, len(S)) << len(S))
+and a 256-entry table maps the key to that letter's share of the pattern
+code, with duplicate letters resolved exactly like feedback.feedback_pattern
+(greens first, then yellows left to right while unmatched copies remain).
+Codes are base-3 as in feedback.encode_pattern, so they fit a byte for
+words of up to MAX_LENGTH letters.
+
+With numpy the arrays are uint8 ndarrays. Without it the same arithmetic
+runs on bytes: columns are compared with bytes.translate and the byte lanes
+are added as one big integer (no lane can carry into the next, since every
+sum stays below 256).
+"""
+
+import heapq
+from collections import Counter
+from functools import lru_cache
+from math import log2
+from operator import itemgetter
+from typing import Dict, Iterable, List, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+MAX_LENGTH = 5  # 3 ** 5 codes fit a byte
+
+
+@lru_cache(maxsize=None)
+def _letter_table(positions: Tuple[int, ...], length: int) -> bytes:
+    """Key -> code contribution of one guess letter at `positions` (see module docstring)"""
+    s = len(positions)
+    table = bytearray(256)
+    for key in range(min(256, (s + 1) << s)):
+        greens, count = key & ((1 << s) - 1), key >> s
+        unmatched = count - bin(greens).count("1")
+        code = 0
+        for k, i in enumerate(positions):
+            weight = 3 ** (length - 1 - i)
+            if greens >> k & 1:
+                code += 2 * weight
+            elif unmatched > 0:
+                code += weight
+                unmatched -= 1
+        table[key] = code
+    return bytes(table)
+
+
+@lru_cache(maxsize=None)
+def _equals_table(letter: int) -> bytes:
+    """bytes.translate table: `letter` -> 1, every other byte -> 0"""
+    table = bytearray(256)
+    table[letter] = 1
+    return bytes(table)
+
+
+@lru_cache(maxsize=None)
+def _cap_table(cap: int) -> bytes:
+    return bytes(min(b, cap) for b in range(256))
+
+
+class WordArrays:
+    """
+    A candidate list encoded for the matrix-free kernel. Memory is about
+    len(words) * (length + distinct letters seen) bytes, against
+    len(guessable) * len(words) for a full pattern table.
+    Build one per candidate set; words keep their iteration order.
+    """
+
+    def __init__(self, words: Iterable[str]):
+        self.words = list(words)
+        self.word_set = set(self.words)
+        self.size = len(self.words)
+        self.length = len(self.words[0]) if self.words else 0
+        if self.length > MAX_LENGTH:
+            raise ValueError(f"WordArrays handles words of up to {MAX_LENGTH} letters, not {self.length}")
+        raw = "".join(self.words).encode("ascii")
+        if np is not None:
+            self._letters = np.frombuffer(raw, dtype=np.uint8).reshape(self.size, self.length)
+        else:
+            self._columns = [raw[i::self.length] for i in range(self.length)]
+        self._counts: Dict[int, object] = {}
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the encoded arrays"""
+        if np is not None:
+            return self._letters.nbytes + sum(c.nbytes for c in self._counts.values())
+        return sum(map(len, self._columns)) + sum(map(len, self._counts.values()))
+
+    def _count(self, letter: int):
+        """Copies of `letter` in each word"""
+        counts = self._counts.get(letter)
+        if counts is None:
+            if np is not None:
+                counts = (self._letters == letter).sum(axis=1, dtype=np.uint8)
+            else:
+                table = _equals_table(letter)
+                lanes = sum(int.from_bytes(col.translate(table), "big") for col in self._columns)
+                counts = lanes.to_bytes(self.size, "big")
+            self._counts[letter] = counts
+        return counts
+
+    def codes(self, guess: str) -> bytes:
+        """encode_pattern(feedback_pattern(guess, w)) for each word, as bytes"""
+        positions: Dict[int, List[int]] = {}
+        for i, letter in enumerate(guess.encode("ascii")):
+            positions.setdefault(letter, []).append(i)
+
+        if np is not None:
+            letters = self._letters
+            codes = np.zeros(self.size, dtype=np.uint8)
+            for letter, where in positions.items():
+                s = len(where)
+                key = np.minimum(self._count(letter), s) << s
+                for k, i in enumerate(where):
+                    key |= (letters[:, i] == letter).view(np.uint8) << k
+                table = np.frombuffer(_letter_table(tuple(where), self.length), dtype=np.uint8)
+                codes += table[key]
+            return codes.tobytes()
+
+        size = self.size
+        codes = 0
+        for letter, where in positions.items():
+            s = len(where)
+            equals = _equals_table(letter)
+            key = int.from_bytes(self._count(letter).translate(_cap_table(s)), "big") << s
+            for k, i in enumerate(where):
+                key += int.from_bytes(self._columns[i].translate(equals), "big") << k
+            table = _letter_table(tuple(where), self.length)
+            codes += int.from_bytes(key.to_bytes(size, "big").translate(table), "big")
+        return codes.to_bytes(size, "big")
+
+    def score(self, guess: str) -> Tuple[float, float]:
+        """search.score_guess(guess, words)"""
+        n = self.size
+        if n == 0:
+            return 0.0, 0.0
+        # Sorted counts, as in search.score_guess, so the float sums match exactly
+        counts = sorted(Counter(self.codes(guess)).values())
+        ent = -sum(c / n * log2(c / n) for c in counts if c > 0)
+        return ent, sum(c * c for c in counts) / n
+
+    def entropy(self, guess: str) -> float:
+        return self.score(guess)[0]
+
+    def top_guesses(self, guessable, k: int = 5):
+        """search.top_guesses(words, guessable, k)"""
+        n = self.size
+        if n == 0:
+            return []
+        scored = ((w,) + self.score(w) for w in guessable)
+        best = heapq.nlargest(k, scored, key=itemgetter(1))
+        return [(w, ent, remaining, 1 / n if w in self.word_set else 0.0) for w, ent, remaining in best]
@@ -1,26 +1,43 @@
 import random
 from typing import List, Tuple
 
+from feedback import feedback_pattern, to_tuples
+from indexes import shared_words
+from lexicon import load_words
+
 class WordleGame:
-    def __init__(self, word_list: List[str] = None):
+    def __init__(self, word_list: List[str] = None, word_length: int = 5):
         """
         Initialize the Wordle game with a list of possible words.
         If no list provided, uses a default set of common 5-letter words.
+        Only words of word_length letters are kept.
         """
+        self.word_length = word_length
         if word_list is None:
             self.word_list = [
                 "Sucks"
             ]
         else:
-            self.word_list = [word.upper() for word in word_list if len(word) == 5]
+            # Shared read-only dictionary: engines for the same list hold one copy between them
+            lexicon = shared_words(word_list, word_length)
+            self.word_list = lexicon.words
         
         if not self.word_list:
-            raise ValueError("No valid 5-letter words provided")
+            raise ValueError(f"No valid {word_length}-letter words provided")
         
-        self.secret_word = random.choice(self.word_list)
+        # Hashed copy for O(1) guess validation; the list keeps random.choice cheap
+        self.valid_words = lexicon.members if word_list is not None else frozenset(self.word_list)
+        self.max_attempts = 6
+        self.reset()
+
+    def reset(self, secret: str = None):
+        """
+        Start a new game on the same word list.
+        The engine is meant to be built once and reset per game.
+        """
+        self.secret_word = secret.upper() if secret else random.choice(self.word_list)
         self.attempts = []
         self.feedback_history = []
-        self.max_attempts = 6
         self.game_over = False
         self.won = False
 
@@ -30,27 +47,7 @@ class WordleGame:
         Returns: List of tuples (letter, color) where color is 'green', 'yellow', or 'gray'
         """
         guess = guess.upper()
-        feedback = []
-        secret_list = list(self.secret_word)
-        guess_list = list(guess)
-        
-        # First pass: mark correct positions (green)
-        for i in range(len(guess_list)):
-            if guess_list[i] == secret_list[i]:
-                feedback.append((guess_list[i], 'green'))
-                secret_list[i] = None  # Mark as used
-                guess_list[i] = None   # Mark as processed
-            else:
-                feedback.append((guess_list[i], 'gray'))  # Temporary, will update for yellows
-        
-        # Second pass: mark correct letters in wrong position (yellow)
-        for i in range(len(guess_list)):
-            if guess_list[i] is not None and guess_list[i] in secret_list:
-                feedback[i] = (guess_list[i], 'yellow')
-                # Remove the first occurrence from secret list
-                secret_list[secret_list.index(guess_list[i])] = None
-        
-        return feedback
+        return to_tuples(guess, feedback_pattern(guess, self.secret_word))
 
     def make_guess(self, guess: str) -> Tuple[bool, List[Tuple[str, str]]]:
         """
@@ -63,10 +60,10 @@ class WordleGame:
         if self.game_over:
             return False, "Game is over!"
         
-        if len(guess) != 5:
-            return False, "Guess must be 5 letters!"
+        if len(guess) != self.word_length:
+            return False, f"Guess must be {self.word_length} letters!"
         
-        if guess not in self.word_list:
+        if guess not in self.valid_words:
             return False, "Word not in word list!"
         
         if guess in self.attempts:
@@ -89,7 +86,7 @@ class WordleGame:
     def display_board(self):
         """Display the current game board with colored feedback"""
         print(f"\nWORDLE - Attempts: {len(self.attempts)}/{self.max_attempts}")
-        print("=" * 30)
+        print("=" * (6 * self.word_length))
         
         for i in range(self.max_attempts):
             if i < len(self.attempts):
@@ -106,9 +103,9 @@ class WordleGame:
                         display_line += f"  {letter}  "
                 print(display_line)
             else:
-                print("  _     _     _     _     _  ")
+                print("  _   " * self.word_length)
         
-        print("=" * 30)
+        print("=" * (6 * self.word_length))
         
         if self.game_over:
             if self.won:
@@ -130,12 +127,10 @@ class WordleGame:
                 colored_str += f"\033[90m{letter}\033[0m"  # Gray
         return colored_str
 
-def load_words_from_file(filename: str) -> List[str]:
-    """Load words from a text file (one word per line)"""
+def load_words_from_file(filename: str, word_length: int = 5) -> List[str]:
+    """Load words from a text file (one word per line), via its packed lexicon cache"""
     try:
-        with open(filename, 'r') as file:
-            words = [line.strip().upper() for line in file if len(line.strip()) == 5]
-        return words
+        return load_words(filename, word_length)
     except FileNotFoundError:
         print(f"Warning: File {filename} not found. Using default word list.")
         return None